@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Shared uinput keyboard helpers for the voice injectors
+Virtual keyboard capabilities and keymaps, device creation, batched typing and the
+compositor focus-change wait, used by the claude/ and voice_injection/ injector scripts
+"""
+
+import os
+import socket
+import struct
+import time
+import logging
+from types import MappingProxyType
+from evdev import UInput, ecodes as e
+
+try:
+    import pyudev
+    PYUDEV_AVAILABLE = True
+except ImportError:
+    PYUDEV_AVAILABLE = False
+
+# Per-keystroke chatter goes through logging so it costs nothing unless a caller enables DEBUG
+logger = logging.getLogger('uinput_keyboard')
+
+_I3_IPC_MAGIC = b"i3-ipc"
+_I3_IPC_SUBSCRIBE = 2
+_I3_IPC_EVENT_WINDOW = 0x80000003
+
+def _open_focus_socket():
+    """Connect to the compositor's event socket, or return (None, None) if there isn't one"""
+    signature = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE")
+    if signature:
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "/tmp")
+        for base in (os.path.join(runtime_dir, "hypr"), "/tmp/hypr"):
+            path = os.path.join(base, signature, ".socket2.sock")
+            if os.path.exists(path):
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.connect(path)
+                return sock, "hyprland"
+    swaysock = os.environ.get("SWAYSOCK")
+    if swaysock and os.path.exists(swaysock):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(swaysock)
+        payload = b'["window"]'
+        sock.sendall(_I3_IPC_MAGIC + struct.pack("<II", len(payload), _I3_IPC_SUBSCRIBE) + payload)
+        return sock, "sway"
+    return None, None
+
+def _recv_exact(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("focus socket closed")
+        data += chunk
+    return data
+
+def wait_for_focus(timeout):
+    """Block until the focused window changes or timeout seconds pass.
+
+    Uses Hyprland's socket2 or Sway's IPC window events; without either it
+    just sleeps for the timeout. Returns True if a focus change was seen.
+    """
+    if timeout <= 0:
+        return False
+    deadline = time.monotonic() + timeout
+    try:
+        sock, backend = _open_focus_socket()
+    except OSError as ex:
+        print(f"[INJECTOR] Focus IPC unavailable ({ex}), sleeping instead")
+        sock, backend = None, None
+    if sock is None:
+        time.sleep(timeout)
+        return False
+    try:
+        pending = b""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            sock.settimeout(remaining)
+            if backend == "hyprland":
+                chunk = sock.recv(4096)
+                if not chunk:
+                    return False
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                if any(line.startswith(b"activewindow>>") for line in lines):
+                    return True
+            else:
+                header = _recv_exact(sock, 14)
+                length, msg_type = struct.unpack("<II", header[6:])
+                body = _recv_exact(sock, length)
+                if msg_type == _I3_IPC_EVENT_WINDOW and b'"change":"focus"' in body.replace(b" ", b""):
+                    return True
+    except (socket.timeout, OSError):
+        return False
+    finally:
+        sock.close()
+
+# Virtual keyboard capabilities and keymaps, built once at import
+CAPABILITIES = MappingProxyType({
+    e.EV_KEY: [
+        # Letters
+        e.KEY_A, e.KEY_B, e.KEY_C, e.KEY_D, e.KEY_E, e.KEY_F,
+        e.KEY_G, e.KEY_H, e.KEY_I, e.KEY_J, e.KEY_K, e.KEY_L,
+        e.KEY_M, e.KEY_N, e.KEY_O, e.KEY_P, e.KEY_Q, e.KEY_R,
+        e.KEY_S, e.KEY_T, e.KEY_U, e.KEY_V, e.KEY_W, e.KEY_X,
+        e.KEY_Y, e.KEY_Z,
+        # Numbers
+        e.KEY_1, e.KEY_2, e.KEY_3, e.KEY_4, e.KEY_5,
+        e.KEY_6, e.KEY_7, e.KEY_8, e.KEY_9, e.KEY_0,
+        # Special keys
+        e.KEY_SPACE, e.KEY_ENTER, e.KEY_TAB, e.KEY_BACKSPACE,
+        e.KEY_LEFTSHIFT, e.KEY_RIGHTSHIFT, e.KEY_LEFTCTRL,
+        e.KEY_V,  # For Ctrl+Shift+V
+        # Punctuation
+        e.KEY_DOT, e.KEY_COMMA, e.KEY_SEMICOLON, e.KEY_APOSTROPHE,
+        e.KEY_MINUS, e.KEY_EQUAL, e.KEY_SLASH, e.KEY_BACKSLASH,
+        e.KEY_LEFTBRACE, e.KEY_RIGHTBRACE, e.KEY_GRAVE
+    ]
+})
+
+# Character to key mapping
+CHAR_TO_KEY = MappingProxyType({
+    'a': e.KEY_A, 'b': e.KEY_B, 'c': e.KEY_C, 'd': e.KEY_D,
+    'e': e.KEY_E, 'f': e.KEY_F, 'g': e.KEY_G, 'h': e.KEY_H,
+    'i': e.KEY_I, 'j': e.KEY_J, 'k': e.KEY_K, 'l': e.KEY_L,
+    'm': e.KEY_M, 'n': e.KEY_N, 'o': e.KEY_O, 'p': e.KEY_P,
+    'q': e.KEY_Q, 'r': e.KEY_R, 's': e.KEY_S, 't': e.KEY_T,
+    'u': e.KEY_U, 'v': e.KEY_V, 'w': e.KEY_W, 'x': e.KEY_X,
+    'y': e.KEY_Y, 'z': e.KEY_Z,
+    '1': e.KEY_1, '2': e.KEY_2, '3': e.KEY_3, '4': e.KEY_4,
+    '5': e.KEY_5, '6': e.KEY_6, '7': e.KEY_7, '8': e.KEY_8,
+    '9': e.KEY_9, '0': e.KEY_0,
+    ' ': e.KEY_SPACE, '\n': e.KEY_ENTER, '\t': e.KEY_TAB,
+    '.': e.KEY_DOT, ',': e.KEY_COMMA, ';': e.KEY_SEMICOLON,
+    "'": e.KEY_APOSTROPHE, '-': e.KEY_MINUS, '=': e.KEY_EQUAL,
+    '/': e.KEY_SLASH, '\\': e.KEY_BACKSLASH,
+    '[': e.KEY_LEFTBRACE, ']': e.KEY_RIGHTBRACE,
+    '`': e.KEY_GRAVE
+})
+
+# Characters that require shift
+SHIFT_CHARS = MappingProxyType({
+    'A': e.KEY_A, 'B': e.KEY_B, 'C': e.KEY_C, 'D': e.KEY_D,
+    'E': e.KEY_E, 'F': e.KEY_F, 'G': e.KEY_G, 'H': e.KEY_H,
+    'I': e.KEY_I, 'J': e.KEY_J, 'K': e.KEY_K, 'L': e.KEY_L,
+    'M': e.KEY_M, 'N': e.KEY_N, 'O': e.KEY_O, 'P': e.KEY_P,
+    'Q': e.KEY_Q, 'R': e.KEY_R, 'S': e.KEY_S, 'T': e.KEY_T,
+    'U': e.KEY_U, 'V': e.KEY_V, 'W': e.KEY_W, 'X': e.KEY_X,
+    'Y': e.KEY_Y, 'Z': e.KEY_Z,
+    '!': e.KEY_1, '@': e.KEY_2, '#': e.KEY_3, '$': e.KEY_4,
+    '%': e.KEY_5, '^': e.KEY_6, '&': e.KEY_7, '*': e.KEY_8,
+    '(': e.KEY_9, ')': e.KEY_0,
+    '_': e.KEY_MINUS, '+': e.KEY_EQUAL,
+    ':': e.KEY_SEMICOLON, '"': e.KEY_APOSTROPHE,
+    '<': e.KEY_COMMA, '>': e.KEY_DOT, '?': e.KEY_SLASH,
+    '{': e.KEY_LEFTBRACE, '}': e.KEY_RIGHTBRACE,
+    '|': e.KEY_BACKSLASH, '~': e.KEY_GRAVE
+})
+
+# struct input_event: a timeval (two native longs, left zero for the kernel to stamp), type, code, value
+_INPUT_EVENT = struct.Struct('llHHi')
+_SYN_REPORT_BYTES = _INPUT_EVENT.pack(0, 0, e.EV_SYN, e.SYN_REPORT, 0)
+
+# Per ASCII code (every mapped character is ASCII): the bare key press/release records,
+# whether the character needs shift held, and the unmapped codes, so a transcript can
+# be filtered in one bytes.translate() call and shift only toggles on transitions
+_SHIFT_DOWN_BYTES = _INPUT_EVENT.pack(0, 0, e.EV_KEY, e.KEY_LEFTSHIFT, 1)
+_SHIFT_UP_BYTES = _INPUT_EVENT.pack(0, 0, e.EV_KEY, e.KEY_LEFTSHIFT, 0)
+_ASCII_KEY_BYTES = tuple(
+    _INPUT_EVENT.pack(0, 0, e.EV_KEY, key, 1) + _INPUT_EVENT.pack(0, 0, e.EV_KEY, key, 0)
+    if key is not None else None
+    for key in (CHAR_TO_KEY.get(chr(code), SHIFT_CHARS.get(chr(code))) for code in range(128))
+)
+_ASCII_NEEDS_SHIFT = bytes(chr(code) in SHIFT_CHARS for code in range(128))
+_UNMAPPED_ASCII = bytes(code for code in range(128) if _ASCII_KEY_BYTES[code] is None)
+
+def create_uinput(capabilities, name, settle):
+    """
+    Create the virtual keyboard and wait until udev has announced its event node,
+    giving up after settle seconds. Without pyudev just sleep the full settle time.
+    """
+    if not PYUDEV_AVAILABLE:
+        ui = UInput(capabilities, name=name, version=0x3)
+        time.sleep(settle)
+        return ui
+    
+    # Start listening before the device exists so its add event can't be missed
+    monitor = pyudev.Monitor.from_netlink(pyudev.Context(), source='udev')
+    monitor.filter_by('input')
+    monitor.start()
+    ui = UInput(capabilities, name=name, version=0x3)
+    node = ui.device.path
+    deadline = time.monotonic() + settle
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        device = monitor.poll(timeout=remaining)
+        if device is None or (device.action == 'add' and device.device_node == node):
+            break
+    return ui
+
+def type_text(ui, text, flush_every=8, delay=0.005):
+    """
+    Type text using the virtual keyboard.
+
+    Characters without a key mapping are dropped up front, and LEFTSHIFT is held
+    across runs of shifted characters instead of toggled per character. Keystrokes
+    go out in reports of flush_every characters, each report a single writev() of
+    pre-packed input_event records plus a SYN_REPORT, with a short pause between
+    reports so the reading compositor never overflows its evdev buffer and drops keys.
+    """
+    logger.debug("Typing: '%s'", text)
+
+    # Drop non-ASCII and unmapped characters in C rather than per character here
+    codes = text.encode('ascii', 'ignore').translate(None, _UNMAPPED_ASCII)
+    if len(codes) != len(text):
+        logger.debug("Skipping %d unmapped characters", len(text) - len(codes))
+
+    lut = _ASCII_KEY_BYTES
+    needs_shift = _ASCII_NEEDS_SHIFT
+    fd = ui.fd
+    shift_held = False
+    for start in range(0, len(codes), flush_every):
+        if start and delay:
+            time.sleep(delay)
+        report = []
+        for code in codes[start:start + flush_every]:
+            if needs_shift[code] != shift_held:
+                shift_held = not shift_held
+                report.append(_SHIFT_DOWN_BYTES if shift_held else _SHIFT_UP_BYTES)
+            report.append(lut[code])
+        report.append(_SYN_REPORT_BYTES)
+        os.writev(fd, report)
+
+    if shift_held:
+        os.writev(fd, [_SHIFT_UP_BYTES, _SYN_REPORT_BYTES])
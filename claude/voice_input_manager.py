@@ -189,12 +189,20 @@ class VoiceInputManager:
         """Play teletype sound during transcription"""
         await self.play_sound("teletype")
                 
-    async def capture_voice_for_clipboard(self, duration: int = 60) -> Optional[str]:
+    async def capture_voice_for_clipboard(self, duration: int = 60, copy: bool = True,
+                                          on_final: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """
         Capture voice input and copy to clipboard
         
         Args:
             duration: Maximum capture duration in seconds
+            copy: Copy the transcription to the clipboard (callers that paste it
+                themselves pass False and copy right before pasting)
+            on_final: Called with the text of each utterance as VOSK finalizes it,
+                so callers can act on text before capture ends. Each call carries
+                only that utterance, not the transcript so far - callers that type
+                or append it must join the pieces themselves (the returned transcript
+                is the final result and may not equal the joined utterances)
             
         Returns:
             Transcribed text if successful
@@ -242,6 +250,9 @@ class VoiceInputManager:
                 is_final, is_speech, current_text = self.transcriber.process_frame(pcm_bytes)
                 frames_processed += 1
                 
+                if is_final and on_final and current_text:
+                    on_final(current_text)
+                
                 # Play typing sound when speech is being processed
                 current_time = time.time()
                 if is_speech and current_text and len(current_text.strip()) > 0:
@@ -276,7 +287,9 @@ class VoiceInputManager:
                 print(f"\n📝 Transcribed: {final_text}")
                 
                 # Copy to clipboard
-                if self.copy_to_clipboard(final_text):
+                if not copy:
+                    await self.play_ready_sound()
+                elif self.copy_to_clipboard(final_text):
                     print("✅ Copied to clipboard! Press Ctrl+Shift+V to paste in Claude Code")
                     self.tts.update_status("Transcription ready in clipboard. Press Control Shift V to paste.")
                     await self.play_ready_sound()
@@ -304,6 +317,24 @@ class VoiceInputManager:
             print("\n🛑 Voice capture ended")
 
 
+_manager = None
+
+def capture_once(duration: int = 30, copy: bool = True,
+                 on_final: Optional[Callable[[str], None]] = None) -> Optional[str]:
+    """
+    Capture one utterance and return the text, copying it to the clipboard if copy is set.
+    on_final is passed through to capture_voice_for_clipboard() and is called once
+    per finalized utterance with that utterance's text only.
+    
+    The VoiceInputManager (and its VOSK model) is created on the first call and
+    kept at module scope so later captures in the same process reuse it.
+    """
+    global _manager
+    if _manager is None:
+        _manager = VoiceInputManager()
+    return asyncio.run(_manager.capture_voice_for_clipboard(duration=duration, copy=copy, on_final=on_final))
+
+
 async def test_voice_input():
     """Test the voice input system"""
     print("🎤 Claude Code Voice Input Test")
@@ -2,6 +2,7 @@ import asyncio
 import os
 from pathlib import Path
 import traceback
+from typing import AsyncIterator
 import httpx # For Cartesia and ElevenLabs direct API calls
 
 # Import secrets if Cartesia or ElevenLabs keys are stored there
@@ -81,6 +82,37 @@ class TTSHandler:
             print(f"[TTS INFO] Audio generated successfully with {engine_used}.")
         return audio_bytes, engine_used
 
+    async def generate_audio_stream(self, text: str, persona_name: str | None) -> AsyncIterator[tuple[bytes, str]]:
+        """
+        Yield (chunk, engine) tuples as audio is generated.
+
+        ElevenLabs is streamed chunk by chunk so playback can start before synthesis
+        finishes. Other providers, and the fallback when streaming fails before any
+        audio arrives, yield their whole buffer once.
+        """
+        provider = self.get_active_provider_for_tts_attempt()
+        if text and provider == "elevenlabs" and self.elevenlabs_api_key:
+            voice_params = get_voice_params_for_persona(provider, persona_name) or {}
+            got_audio = False
+            async for chunk in self._stream_elevenlabs(text, voice_params):
+                got_audio = True
+                yield chunk, provider
+            if got_audio:
+                return
+            
+            print("[TTS INFO] ElevenLabs streaming produced no audio.")
+            fallback_provider = self.get_fallback_provider(provider)
+            if fallback_provider:
+                print(f"[TTS INFO] Attempting fallback with {fallback_provider}.")
+                audio_bytes, engine_used = await self._try_generate(text, fallback_provider, persona_name)
+                if audio_bytes:
+                    yield audio_bytes, engine_used
+            return
+        
+        audio_bytes, engine_used = await self.generate_audio(text, persona_name)
+        if audio_bytes:
+            yield audio_bytes, engine_used
+
     async def _try_generate(self, text: str, provider_name: str, persona_name: str | None) -> tuple[bytes | None, str | None]:
         """Attempts to generate audio using the specified provider and persona."""
         voice_params = get_voice_params_for_persona(provider_name, persona_name)
@@ -143,6 +175,42 @@ class TTSHandler:
             traceback.print_exc()
             return None
 
+    async def _stream_elevenlabs(self, text: str, voice_params: dict) -> AsyncIterator[bytes]:
+        """Yield MP3 chunks from the ElevenLabs streaming endpoint as they arrive"""
+        voice_name_or_id = voice_params.get("voice_name_or_id")
+        model = voice_params.get("model")
+        if not voice_name_or_id or not model:
+            print(f"[TTS ERROR] Missing voice_name_or_id or model for ElevenLabs. Params: {voice_params}")
+            return
+        
+        try:
+            print(f"[TTS INFO] Streaming ElevenLabs: Voice='{voice_name_or_id}', Model='{model}'")
+            
+            url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_name_or_id}/stream"
+            headers = {
+                "xi-api-key": self.elevenlabs_api_key,
+                "Content-Type": "application/json"
+            }
+            payload = {
+                "text": text,
+                "model_id": model
+            }
+            
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                async with client.stream("POST", url, headers=headers, json=payload) as response:
+                    if response.status_code != 200:
+                        body = await response.aread()
+                        print(f"[TTS ERROR] ElevenLabs stream returned status {response.status_code}: {body[:200]!r}")
+                        return
+                    
+                    async for chunk in response.aiter_bytes():
+                        if chunk:
+                            yield chunk
+                
+        except Exception as e:
+            print(f"[TTS ERROR] ElevenLabs streaming error: {e}")
+            traceback.print_exc()
+
     async def _generate_cartesia(self, text: str, voice_params: dict) -> bytes | None:
         if not self.cartesia_api_key:
             print("[TTS ERROR] Cartesia API key not available.")
@@ -81,6 +81,7 @@ class DisplayManager:
         
         self.image_cache = {}
         self.current_state = 'boot'
+        self._state_cond = asyncio.Condition()
         self.current_mood = 'casual'
         self.last_state = None
         self.last_mood = None
@@ -273,9 +274,11 @@ class DisplayManager:
             mapped_mood = self.laura_mood_mapping[mapped_mood]
         
         try:
-            self.last_state = self.current_state
-            self.current_state = state
-            self.current_mood = mapped_mood
+            async with self._state_cond:
+                self.last_state = self.current_state
+                self.current_state = state
+                self.current_mood = mapped_mood
+                self._state_cond.notify_all()
             
             # Handle image selection
             if state == 'booting' and self.boot_img:
@@ -344,13 +347,18 @@ class DisplayManager:
                 self.last_image_change = time.time()
                 # Synchronize TTS break timer with display rotation timer
                 if hasattr(self, 'input_manager') and self.input_manager:
-                    self.input_manager.wake_last_break = self.last_image_change
+                    self.input_manager.sync_wake_break()
                 
             print(f"Display updated - State: {self.current_state}, Mood: {self.current_mood}")
                 
         except Exception as e:
             print(f"Error updating display: {e}")
 
+    async def wait_for_state(self, state):
+        """Block until the display enters the given state"""
+        async with self._state_cond:
+            await self._state_cond.wait_for(lambda: self.current_state == state)
+
     async def rotate_background(self):
         """Background image rotation for idle/sleep states"""
         while not self.initialized:
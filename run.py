@@ -3,6 +3,7 @@
 import asyncio
 import json
 import os
+import re
 import subprocess
 import traceback
 from datetime import datetime
@@ -31,6 +32,7 @@ from system.input_manager import InputManager
 from system.notification_manager import NotificationManager
 from system.system_command_manager import SystemCommandManager
 from system.audio_coordinator import AudioCoordinator
+from system.background_task_manager import BackgroundTaskManager
 
 # Configuration and Utilities
 from config.client_config import (
@@ -42,6 +44,10 @@ from config.client_config import (
 # Initialize colorama
 init()
 
+# Heuristics for deciding whether a Claude Code response should be spoken
+_CODE_INDICATOR_RE = re.compile(r"```|def |class |import |function|[{}]|const |let |var ")
+_CODING_KEYWORD_RE = re.compile(r"create|write|implement|code|function|debug|fix|refactor", re.IGNORECASE)
+
 
 def get_random_audio(category: str, subtype: str = None):
     """Get random audio file for given category"""
@@ -82,12 +88,59 @@ class PiMCPClient:
     while maintaining a minimal footprint for the main client logic.
     """
     
+    # Wake word models that trigger a dedicated action instead of regular chat
+    _WAKE_ACTIONS = {
+        "claudecode.pmdl": "claude_code",
+        "send_now.pmdl": "enter",
+        "sendnote.pmdl": "note",
+    }
+    
+    # Claude Code responses longer than this are replaced by a spoken summary
+    _SPEECH_SUMMARY_THRESHOLD = 300
+    _SPEECH_SUMMARY_FALLBACK = "Task completed successfully. Check the output for details."
+    
     def __init__(self, server_url: str, device_id: str):
         self.server_url = server_url
         self.device_id = device_id
         self.session_id: str | None = None
         self.mcp_session: ClientSession | None = None
         
+        # Resolve helper script paths once rather than on every injection
+        self._project_root = os.path.dirname(os.path.abspath(__file__))
+        self._venv_python = os.path.join(self._project_root, "venv", "bin", "python")
+        self._injector_script = os.path.join(self._project_root, "claude", "claude_voice_injector.py")
+        self._enter_script = os.path.join(self._project_root, "claude", "send_enter.py")
+        
+        # Check sound effects once at startup; missing files map to None
+        sound_dir = "/home/user/rp_client/assets/sounds/sound_effects"
+        sounds = {
+            "success": f"{sound_dir}/successfulloadup.mp3",
+            "error": f"{sound_dir}/error.mp3",
+            "teletype": f"{sound_dir}/teletype.mp3",
+            "ping": f"{sound_dir}/radarping.mp3",
+            "processing": f"{sound_dir}/data_processing.mp3",
+        }
+        self._sound_files = {name: path if os.path.exists(path) else None for name, path in sounds.items()}
+        
+        # TTS voice configuration, loaded lazily on the first persona switch
+        self._voices_config_path = "/home/user/rp_client/TTS/config/voices.json"
+        self._voices_config = None
+        
+        # Fire-and-forget tasks (sound effects, input handlers), cancelled on cleanup
+        self._tasks = BackgroundTaskManager()
+        
+        # Set to leave code mode and retry the server connection
+        self._exit_code_mode_event = asyncio.Event()
+        
+        # Set by cleanup() so the main loop returns instead of waiting forever
+        self._shutdown_event = asyncio.Event()
+        
+        # In-flight route_to_claude_code task, cancelled when a newer request arrives
+        self._current_route_task: asyncio.Task | None = None
+        
+        # Shared HTTP session for local service calls (created on first use)
+        self._http: aiohttp.ClientSession | None = None
+        
         # Initialize core components
         self.audio_manager = AudioManager(sample_rate=AUDIO_SAMPLE_RATE)
         self.tts_handler = TTSHandler()
@@ -215,8 +268,7 @@ class PiMCPClient:
                     print("[INFO] Server is processing (10 seconds)...")
                     # Play a subtle ping to indicate still waiting
                     try:
-                        ping_sound = "/home/user/rp_client/assets/sounds/sound_effects/radarping.mp3"
-                        if os.path.exists(ping_sound):
+                        if ping_sound := self._sound_files["ping"]:
                             self.audio_manager.play_audio_file(ping_sound)
                     except:
                         pass
@@ -268,30 +320,10 @@ class PiMCPClient:
         """Simplified GameBoy-style main loop - waits for Apple Watch input"""
         print("[INFO] GameBoy-style main loop started - waiting for Apple Watch input.")
         
-        while True:
-            try:
-                current_state = self.display_manager.current_state
-                
-                # Simple state monitoring - just check for sleep timeout
-                if current_state == 'idle':
-                    time_since_interaction = self.input_manager.get_time_since_last_interaction()
-                    
-                    # Sleep timeout (5 minutes)
-                    if time_since_interaction >= 300:  # 5 minutes
-                        print(f"[INFO] Sleep timeout reached ({time_since_interaction:.1f}s since last interaction)")
-                        await self.display_manager.update_display('sleep')
-                
-                # All conversation processing now happens via handle_apple_watch_input()
-                # which is called from the HTTP endpoint
-                
-                await asyncio.sleep(1)  # Simple 1-second sleep loop
-                    
-            except Exception as e:
-                print(f"[ERROR] Error in main loop: {e}")
-                traceback.print_exc()
-                await self.display_manager.update_display("error", text="System Error")
-                await asyncio.sleep(2)
-                await self.display_manager.update_display("idle")
+        # All conversation processing happens via handle_apple_watch_input(), called from
+        # the HTTP endpoint, and sleep_timeout_monitor() owns the sleep timeout - so there
+        # is nothing to poll here; just stay alive until shutdown (or cancellation)
+        await self._shutdown_event.wait()
 
     async def handle_tts_conversation(self, request):
         """TTS endpoint that returns to idle state - for questions/confirmations"""
@@ -378,8 +410,7 @@ class PiMCPClient:
             
             # Play processing sound effect
             try:
-                processing_sound = "/home/user/rp_client/assets/sounds/sound_effects/data_processing.mp3"
-                if os.path.exists(processing_sound):
+                if processing_sound := self._sound_files["processing"]:
                     self.audio_manager.play_audio_file(processing_sound)
             except Exception as e:
                 print(f"[INFO] Could not play processing sound: {e}")
@@ -465,7 +496,7 @@ class PiMCPClient:
             
             if text:
                 # Handle the input asynchronously
-                asyncio.create_task(self.handle_apple_watch_input(text))
+                self._tasks.create(self.handle_apple_watch_input(text))
                 return web.json_response({"status": "success", "message": "Input received"})
             else:
                 return web.json_response({"status": "error", "message": "No text provided"}, status=400)
@@ -521,14 +552,11 @@ class PiMCPClient:
                     print("[INFO] Running in code mode - server connection bypassed")
                     await self.display_manager.update_display("code")
                     
-                    # Add main loop task and run it
+                    # Add main loop task and run it until asked to leave code mode
                     main_loop_task = asyncio.create_task(self.run_main_loop())
-                    all_tasks = background_tasks + [main_loop_task]
                     
                     try:
-                        await asyncio.gather(*all_tasks, return_exceptions=True)
-                    except Exception as e:
-                        print(f"[ERROR] Task execution error in code mode: {e}")
+                        await self._exit_code_mode_event.wait()
                     finally:
                         # Cancel main loop task
                         main_loop_task.cancel()
@@ -537,8 +565,11 @@ class PiMCPClient:
                         except asyncio.CancelledError:
                             pass
                     
-                    # Check if user wants to try reconnecting (wait a bit)
-                    await asyncio.sleep(10)
+                    # User asked to leave code mode - retry the server with a clean slate
+                    print("[INFO] Leaving code mode - retrying server connection")
+                    self._exit_code_mode_event.clear()
+                    code_mode_active = False
+                    connection_failures = 0
                     continue
                 
                 connection_attempts += 1
@@ -576,8 +607,7 @@ class PiMCPClient:
                         # Play startup sound and transition to sleep (only on first connection)
                         if connection_attempts == 0:
                             print(f"\n{Fore.CYAN}=== Startup Sequence ==={Fore.WHITE}")
-                            startup_sound = "/home/user/rp_client/assets/sounds/sound_effects/successfulloadup.mp3"
-                            if os.path.exists(startup_sound):
+                            if startup_sound := self._sound_files["success"]:
                                 try:
                                     print(f"{Fore.CYAN}Playing startup audio...{Fore.WHITE}")
                                     # Use idle for Claude Code profile, sleep for LAURA
@@ -626,42 +656,16 @@ class PiMCPClient:
             except (ConnectionRefusedError, ConnectionError, OSError) as e:
                 print(f"[ERROR] Connection failed: {e}. Server may be down.")
                 connection_failures += 1
-                
-                # Check if we should enter code mode after 2 connection failures
-                if connection_failures >= 2 and not code_mode_active:
-                    print(f"[INFO] {connection_failures} connection failures detected. Entering code mode...")
-                    await self.display_manager.update_display("code")
-                    print("[INFO] Code mode active - speech will be routed to Claude Code")
-                    code_mode_active = True
-                else:
-                    await self.display_manager.update_display("error", text="Server Offline")
-                
-                if not code_mode_active:
-                    print(f"[INFO] Retrying connection in 30 seconds...")
-                    await asyncio.sleep(30)
-                else:
-                    print("[INFO] Code mode active - stopping connection attempts. Use voice commands or keyboard.")
-                    await asyncio.sleep(5)  # Short sleep before trying again to see if user wants to exit code mode
+                code_mode_active = await self._handle_connection_failure(
+                    "Server Offline", connection_failures, code_mode_active
+                )
             except Exception as e:
                 print(f"[ERROR] Unhandled connection-level exception: {e}")
                 traceback.print_exc()
                 connection_failures += 1  # Also count general exceptions as connection failures
-                
-                # Check if we should enter code mode after 2 connection failures
-                if connection_failures >= 2 and not code_mode_active:
-                    print(f"[INFO] {connection_failures} connection failures detected. Entering code mode...")
-                    await self.display_manager.update_display("code")
-                    print("[INFO] Code mode active - speech will be routed to Claude Code")
-                    code_mode_active = True
-                else:
-                    await self.display_manager.update_display("error", text="Connection Error")
-                
-                if not code_mode_active:
-                    print(f"[INFO] Retrying connection in 30 seconds...")
-                    await asyncio.sleep(30)
-                else:
-                    print("[INFO] Code mode active - stopping connection attempts. Use voice commands or keyboard.")
-                    await asyncio.sleep(5)  # Short sleep before trying again to see if user wants to exit code mode
+                code_mode_active = await self._handle_connection_failure(
+                    "Connection Error", connection_failures, code_mode_active
+                )
             finally:
                 self.mcp_session = None
                 if connection_attempts == 0:  # Only show disconnected state if we were previously connected
@@ -675,31 +679,78 @@ class PiMCPClient:
             except asyncio.CancelledError:
                 pass
     
+    def exit_code_mode(self):
+        """Leave code mode and resume connecting to the MCP server (for voice/keyboard handlers)"""
+        self._exit_code_mode_event.set()
+    
+    async def _handle_connection_failure(self, error_text: str, connection_failures: int, code_mode_active: bool) -> bool:
+        """
+        Update display and wait before the next connection attempt
+        
+        Args:
+            error_text: Text shown on the error display (e.g. "Server Offline")
+            connection_failures: Consecutive failures so far, including this one
+            code_mode_active: Whether code mode was already active
+            
+        Returns:
+            bool: Whether code mode is active after handling this failure
+        """
+        # Check if we should enter code mode after 2 connection failures
+        if connection_failures >= 2 and not code_mode_active:
+            print(f"[INFO] {connection_failures} connection failures detected. Entering code mode...")
+            await self.display_manager.update_display("code")
+            print("[INFO] Code mode active - speech will be routed to Claude Code")
+            code_mode_active = True
+        else:
+            await self.display_manager.update_display("error", text=error_text)
+        
+        if not code_mode_active:
+            print(f"[INFO] Retrying connection in 30 seconds...")
+            await asyncio.sleep(30)
+        else:
+            # No delay - the code mode branch blocks until exit_code_mode() is called
+            print("[INFO] Code mode active - stopping connection attempts. Use voice commands or keyboard.")
+        
+        return code_mode_active
+    
     async def sleep_timeout_monitor(self):
         """Background task to monitor for sleep timeout (5 minutes of inactivity)"""
         SLEEP_TIMEOUT = 300  # 5 minutes in seconds
         
         while True:
             try:
-                current_state = self.display_manager.current_state
+                # Sleep is only entered from idle - park until the display returns there
+                if self.display_manager.current_state != 'idle':
+                    await self.display_manager.wait_for_state('idle')
                 
-                # Only check for sleep timeout when in idle state
-                if current_state == 'idle':
-                    time_since_interaction = self.input_manager.get_time_since_last_interaction()
-                    
-                    if time_since_interaction >= SLEEP_TIMEOUT:
-                        print(f"[INFO] Sleep timeout reached ({time_since_interaction:.1f}s since last interaction)")
-                        await self.display_manager.update_display('sleep')
-                    
-                await asyncio.sleep(1)  # Check every second for precision
+                time_since_interaction = self.input_manager.get_time_since_last_interaction()
+                remaining = SLEEP_TIMEOUT - time_since_interaction
+                
+                if remaining > 0:
+                    # Block until the deadline, or wake early when an interaction resets it
+                    await self.input_manager.wait_for_interaction(timeout=remaining)
+                    continue
+                
+                print(f"[INFO] Sleep timeout reached ({time_since_interaction:.1f}s since last interaction)")
+                await self.display_manager.update_display('sleep')
                 
             except Exception as e:
                 print(f"[ERROR] Sleep timeout monitor error: {e}")
                 await asyncio.sleep(5)  # Wait longer on error
             
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive HTTP session, creating it if needed"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=4))
+        return self._http
+    
     async def cleanup(self):
         """Clean up resources"""
         print("[INFO] Starting client cleanup...")
+        self._shutdown_event.set()
+        await self._tasks.shutdown()
+        if self._http:
+            await self._http.close()
         if self.audio_coordinator: 
             await self.audio_coordinator.cleanup()
         if self.audio_manager: 
@@ -714,6 +765,12 @@ class PiMCPClient:
         """Route speech transcript to Claude Code with health check and session management"""
         from claude.claude_code_healthcheck import execute_claude_code_with_health_check
         
+        # A new request pre-empts any in-flight one so stale results are never spoken
+        if self._current_route_task and not self._current_route_task.done():
+            print("[INFO] Cancelling in-flight Claude Code request")
+            self._current_route_task.cancel()
+        self._current_route_task = asyncio.current_task()
+        
         try:
             print(f"[INFO] Routing to Claude Code: '{transcript}'")
             
@@ -728,19 +785,21 @@ class PiMCPClient:
                 execution_time = result.get("execution_time", 0)
                 session_info = result.get("session_info", "Unknown session")
                 
+                response_len = len(response)
+                preview = response if response_len <= 100 else response[:100] + '...'
                 print(f"[INFO] Claude Code completed in {execution_time:.1f}s via {session_info}")
-                print(f"[INFO] Response: {response[:100]}{'...' if len(response) > 100 else ''}")
+                print(f"[INFO] Response: {preview}")
                 
                 # Determine if we should speak the response
-                should_speak = self._should_speak_claude_response(response, transcript)
+                should_speak = self._should_speak_claude_response(response, transcript, response_len)
                 
                 if should_speak and response:
                     # Speak the response via TTS
                     await self.display_manager.update_display("speaking", mood="helpful")
                     
                     # Use a shorter summary for very long responses
-                    if len(response) > 300:
-                        speech_text = "Task completed successfully. Check the output for details."
+                    if response_len > self._SPEECH_SUMMARY_THRESHOLD:
+                        speech_text = self._SPEECH_SUMMARY_FALLBACK
                     else:
                         speech_text = response
                         
@@ -756,14 +815,12 @@ class PiMCPClient:
                     except Exception as tts_error:
                         print(f"[ERROR] TTS failed: {tts_error}")
                         # Fall back to success sound
-                        await self.audio_manager.play_audio(
-                            "/home/user/rp_client/assets/sounds/sound_effects/successfulloadup.mp3"
-                        )
+                        if success_sound := self._sound_files["success"]:
+                            await self.audio_manager.play_audio(success_sound)
                 else:
                     # Just confirm completion without speaking the full response
-                    await self.audio_manager.play_audio(
-                        "/home/user/rp_client/assets/sounds/sound_effects/successfulloadup.mp3"
-                    )
+                    if success_sound := self._sound_files["success"]:
+                        await self.audio_manager.play_audio(success_sound)
                     
             else:
                 # Handle error
@@ -780,44 +837,54 @@ class PiMCPClient:
                     )
                     if audio_file:
                         await self.audio_manager.play_audio(audio_file)
-                except:
+                except Exception as tts_error:
+                    print(f"[ERROR] TTS failed for error notification: {tts_error}")
                     # Fall back to error sound if TTS fails
-                    pass
+                    if error_sound := self._sound_files["error"]:
+                        await self.audio_manager.play_audio(error_sound)
                     
         except Exception as e:
             print(f"[ERROR] Failed to route to Claude Code: {e}")
             # Handle error gracefully
             
+        except asyncio.CancelledError:
+            print(f"[INFO] Claude Code request cancelled: '{transcript}'")
+            raise
+            
         finally:
-            # Update interaction time on successful completion
-            self.input_manager.update_last_interaction()
-            # Return to idle state
-            await self.display_manager.update_display("idle", mood="casual")
+            # Leave the display alone if a newer request has taken over
+            if self._current_route_task is asyncio.current_task():
+                self._current_route_task = None
+                # Update interaction time on successful completion
+                self.input_manager.update_last_interaction()
+                # Return to idle state
+                await self.display_manager.update_display("idle", mood="casual")
     
-    def _should_speak_claude_response(self, response: str, original_command: str) -> bool:
-        """Determine if Claude Code response should be spoken"""
+    def _should_speak_claude_response(self, response: str, original_command: str, response_len: int | None = None) -> bool:
+        """Determine if Claude Code response should be spoken (response_len may be passed if already known)"""
         if not response:
             return False
+        
+        if response_len is None:
+            response_len = len(response)
             
         # Don't speak very long responses
-        if len(response) > 500:
+        if response_len > 500:
             return False
             
-        # Don't speak responses that look like code
-        code_indicators = ['```', 'def ', 'class ', 'import ', 'function', '{', '}', 'const ', 'let ', 'var ']
-        if any(indicator in response for indicator in code_indicators):
+        # Don't speak file paths or technical output (cheap checks before the regex scan)
+        if response.startswith('/') or 'http://' in response or 'https://' in response:
             return False
             
-        # Don't speak file paths or technical output
-        if response.startswith('/') or 'http://' in response or 'https://' in response:
+        # Don't speak responses that look like code
+        if _CODE_INDICATOR_RE.search(response):
             return False
             
         # Check for coding-related commands
-        coding_keywords = ['create', 'write', 'implement', 'code', 'function', 'debug', 'fix', 'refactor']
-        is_coding_command = any(keyword in original_command.lower() for keyword in coding_keywords)
+        is_coding_command = _CODING_KEYWORD_RE.search(original_command) is not None
         
         # For coding commands, be more conservative about speaking
-        if is_coding_command and len(response) > 200:
+        if is_coding_command and response_len > 200:
             return False
             
         # Speak conversational responses
@@ -829,17 +896,9 @@ class PiMCPClient:
     
     async def inject_to_claude_code_with_sounds(self, transcript: str, data_processing_task):
         """Inject transcript with phase-based sound transitions"""
-        import subprocess
-        import os
-        
         try:
             print(f"[INFO] Injecting to Claude Code: '{transcript}'")
             
-            # Path to our voice injector
-            project_root = os.path.dirname(os.path.abspath(__file__))
-            injector_script = os.path.join(project_root, "claude", "claude_voice_injector.py")
-            venv_python = os.path.join(project_root, "venv", "bin", "python")
-            
             # Processing phase: Copy transcript to clipboard
             try:
                 # Use pyclip to put transcript in clipboard
@@ -853,25 +912,29 @@ class PiMCPClient:
             
             # Start teletype sound immediately before typing (MP3 has built-in 0.2s silence for sync)
             print("[INFO] Starting teletype sound with built-in timing...")
-            asyncio.create_task(self._play_claude_code_confirmation())
+            teletype_started = asyncio.Event()
+            self._tasks.create(self._play_claude_code_confirmation(teletype_started))
             
-            # Delay to ensure audio is playing before subprocess blocks
-            await asyncio.sleep(0.45)
+            # Wait until the audio is actually playing, bounded so a stuck TTS server can't stall typing
+            try:
+                await asyncio.wait_for(teletype_started.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                print("[WARNING] Teletype sound did not start within 1s - injecting anyway")
             
             # Run the voice injector with sudo to create virtual keyboard
             print("[INFO] Creating virtual keyboard for injection...")
-            result = subprocess.run([
-                'sudo', venv_python, injector_script, '--inject-text', transcript
-            ], capture_output=True, text=True, timeout=30)
+            returncode, stderr = await self._run_sudo_script(
+                self._venv_python, self._injector_script, '--inject-text', transcript, timeout=30
+            )
             
             # Stop teletype sound when injection completes
             print("[DEBUG] Injection complete, stopping typing phase sound...")
             await self.audio_coordinator.play_phase_sound("complete")
             
-            if result.returncode == 0:
+            if returncode == 0:
                 print("[INFO] Successfully injected transcript to Claude Code")
             else:
-                print(f"[ERROR] Injection failed: {result.stderr}")
+                print(f"[ERROR] Injection failed: {stderr}")
                 
         except Exception as e:
             print(f"[ERROR] Failed to inject to Claude Code: {e}")
@@ -880,80 +943,81 @@ class PiMCPClient:
     
     async def send_enter_key(self):
         """Send Enter key using virtual keyboard for 'send now' wake word"""
-        import subprocess
-        import os
-        
         try:
             print("[INFO] Sending Enter key to focused application")
             
-            # Path to our Enter key sender
-            project_root = os.path.dirname(os.path.abspath(__file__))
-            enter_script = os.path.join(project_root, "claude", "send_enter.py")
-            venv_python = os.path.join(project_root, "venv", "bin", "python")
-            
             # Run the Enter key sender with sudo
-            result = subprocess.run([
-                'sudo', venv_python, enter_script
-            ], capture_output=True, text=True, timeout=10)
+            returncode, stderr = await self._run_sudo_script(self._venv_python, self._enter_script, timeout=10)
             
-            if result.returncode == 0:
+            if returncode == 0:
                 print("[INFO] Successfully sent Enter key")
             else:
-                print(f"[ERROR] Failed to send Enter key: {result.stderr}")
+                print(f"[ERROR] Failed to send Enter key: {stderr}")
                 
         except Exception as e:
             print(f"[ERROR] Failed to send Enter key: {e}")
             import traceback
             traceback.print_exc()
     
+    async def _run_sudo_script(self, *args, timeout):
+        """Run a command under sudo without blocking the event loop; returns (returncode, stderr)"""
+        proc = await asyncio.create_subprocess_exec(
+            'sudo', *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return proc.returncode, stderr.decode(errors='replace')
+    
     def _should_route_to_claude_code_from_wake(self, wake_event_source: str) -> bool:
         """Check if wake event is for Claude Code (for confirmation sound)"""
         return self._should_route_to_claude_code(wake_event_source) or wake_event_source == "keyboard_code"
     
-    async def _play_claude_code_confirmation(self):
-        """Play teletype sound with built-in timing (MP3 has 0.2s silence at start)"""
-        teletype = "/home/user/rp_client/assets/sounds/sound_effects/teletype.mp3"
+    async def _play_claude_code_confirmation(self, started_event: asyncio.Event | None = None):
+        """
+        Play teletype sound with built-in timing (MP3 has 0.2s silence at start)
+        
+        Args:
+            started_event: Optional event set once playback has started (or failed to)
+        """
+        teletype = self._sound_files["teletype"]
+        if not teletype:
+            print("[DEBUG] Teletype file not found")
+            if started_event:
+                started_event.set()
+            return
+        
         print("[DEBUG] Playing teletype sound with built-in sync timing!")
-        if os.path.exists(teletype):
-            try:
-                await self.audio_coordinator.play_phase_sound("processing", teletype)
-                print("[DEBUG] Teletype sound playback completed")
-            except Exception as e:
-                print(f"[DEBUG] Teletype playback failed: {e}")
-                # Try direct fallback
-                try:
-                    await self.audio_coordinator.play_audio_file(teletype)
-                    print("[DEBUG] Teletype fallback playback completed")
-                except Exception as e2:
-                    print(f"[DEBUG] Teletype fallback also failed: {e2}")
-        else:
-            print(f"[DEBUG] Teletype file not found: {teletype}")
-    
-    async def _delayed_teletype_sound(self, teletype_file):
-        """Play teletype sound after 0.6s delay"""
-        await asyncio.sleep(0.6)
-        print("[DEBUG] Starting teletype sound after delay...")
         try:
-            await self.audio_coordinator.play_phase_sound("processing", teletype_file)
+            await self.audio_coordinator.play_phase_sound("processing", teletype, started_event)
             print("[DEBUG] Teletype sound playback completed")
         except Exception as e:
-            print(f"[DEBUG] Teletype sound playback failed: {e}")
+            print(f"[DEBUG] Teletype playback failed: {e}")
             # Try direct fallback
             try:
-                await self.audio_coordinator.play_audio_file(teletype_file)
+                if started_event:
+                    started_event.set()
+                await self.audio_coordinator.play_audio_file(teletype)
                 print("[DEBUG] Teletype fallback playback completed")
             except Exception as e2:
                 print(f"[DEBUG] Teletype fallback also failed: {e2}")
+        finally:
+            # Never leave a waiter hanging if playback could not start
+            if started_event:
+                started_event.set()
     
-    def _switch_to_persona(self, persona: str):
+    async def _switch_to_persona(self, persona: str):
         """
         Switch both display profile and TTS voice configuration
         
         Args:
             persona: 'laura' for LAURA persona, 'claude_code' for Claude Code persona
         """
-        import json
-        
         print(f"[INFO] Switching to {persona} persona")
         
         # Switch display profile
@@ -964,119 +1028,74 @@ class PiMCPClient:
         
         # Update TTS voice configuration
         try:
-            # Update TTS server voices.json
-            voices_config_path = "/home/user/rp_client/TTS/config/voices.json"
-            with open(voices_config_path, 'r') as f:
-                voices_config = json.load(f)
-            
+            voice_id = None
             if persona == 'laura':
-                voices_config['active_voice'] = 'qEwI395unGwWV1dn3Y65'  # LAURA voice
+                voice_id = 'qEwI395unGwWV1dn3Y65'  # LAURA voice
             elif persona == 'claude_code':
-                voices_config['active_voice'] = 'uY96J30mUhYUIymmD5cu'  # Claude Code voice
+                voice_id = 'uY96J30mUhYUIymmD5cu'  # Claude Code voice
             
-            with open(voices_config_path, 'w') as f:
-                json.dump(voices_config, f, indent=2)
+            # Update TTS server voices.json off the event loop
+            await asyncio.to_thread(self._write_voices_config, voice_id)
             
             # Notify TTS server to reload configuration
-            import aiohttp
-            import asyncio
-            
-            async def reload_tts_config():
-                try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.post('http://localhost:5000/reload_config') as response:
-                            if response.status == 200:
-                                print(f"[INFO] TTS server reloaded config for {persona} persona")
-                            else:
-                                print(f"[WARNING] TTS reload returned status {response.status}")
-                except Exception as e:
-                    print(f"[WARNING] Could not notify TTS server to reload: {e}")
-            
-            # Run the reload in the background
-            asyncio.create_task(reload_tts_config())
+            try:
+                async with self._get_http_session().post('http://localhost:5000/reload_config') as response:
+                    if response.status == 200:
+                        print(f"[INFO] TTS server reloaded config for {persona} persona")
+                    else:
+                        print(f"[WARNING] TTS reload returned status {response.status}")
+            except Exception as e:
+                print(f"[WARNING] Could not notify TTS server to reload: {e}")
             
             print(f"[INFO] Updated TTS voice to {persona} persona")
             
         except Exception as e:
             print(f"[ERROR] Failed to update TTS voice configuration: {e}")
     
-    def _should_route_to_claude_code(self, wake_event_source: str) -> bool:
-        """
-        Determine if wake event should route to Claude Code CLI
+    def _write_voices_config(self, active_voice: str | None):
+        """Persist the active voice to voices.json (blocking - run via asyncio.to_thread)"""
+        # Read the file only once; later switches just rewrite the cached dict
+        if self._voices_config is None:
+            with open(self._voices_config_path, 'r') as f:
+                self._voices_config = json.load(f)
         
-        Args:
-            wake_event_source: The wake event source (e.g., "wakeword (YourNewModel.pmdl)")
-            
-        Returns:
-            bool: True if should route to Claude Code, False for regular chat
-        """
-        if not wake_event_source or 'wakeword' not in wake_event_source:
-            return False
-            
-        # Extract model name from wake event source
-        if '(' in wake_event_source and ')' in wake_event_source:
-            model_name = wake_event_source.split('(')[1].rstrip(')')
-            
-            # Define wake words that should route to Claude Code
-            claude_code_wake_words = [
-                "claudecode.pmdl",
-            ]
-            
-            return model_name in claude_code_wake_words
-            
-        return False
+        if active_voice:
+            self._voices_config['active_voice'] = active_voice
+        
+        with open(self._voices_config_path, 'w') as f:
+            json.dump(self._voices_config, f, indent=2)
     
-    def _should_send_enter_key(self, wake_event_source: str) -> bool:
+    def _parse_wake_model(self, wake_event_source: str) -> str | None:
         """
-        Determine if wake event should send Enter key
+        Extract the model name from a wake event source
         
         Args:
-            wake_event_source: The wake event source (e.g., "wakeword (send_now.pmdl)")
+            wake_event_source: The wake event source (e.g., "wakeword (claudecode.pmdl)")
             
         Returns:
-            bool: True if should send Enter key, False otherwise
+            str | None: The model filename, or None if this is not a wake word event
         """
         if not wake_event_source or 'wakeword' not in wake_event_source:
-            return False
-            
-        # Extract model name from wake event source
+            return None
         if '(' in wake_event_source and ')' in wake_event_source:
-            model_name = wake_event_source.split('(')[1].rstrip(')')
-            
-            # Define wake words that should send Enter
-            send_enter_wake_words = [
-                "send_now.pmdl",
-            ]
-            
-            return model_name in send_enter_wake_words
-            
-        return False
+            return wake_event_source.split('(', 1)[1].rstrip(')')
+        return None
+    
+    def _get_wake_action(self, wake_event_source: str) -> str | None:
+        """Map a wake event source to its action ("claude_code", "enter", "note"), if any"""
+        return self._WAKE_ACTIONS.get(self._parse_wake_model(wake_event_source))
+    
+    def _should_route_to_claude_code(self, wake_event_source: str) -> bool:
+        """Determine if wake event should route to Claude Code CLI"""
+        return self._get_wake_action(wake_event_source) == "claude_code"
+    
+    def _should_send_enter_key(self, wake_event_source: str) -> bool:
+        """Determine if wake event should send Enter key"""
+        return self._get_wake_action(wake_event_source) == "enter"
     
     def _should_send_note_to_mac(self, wake_event_source: str) -> bool:
-        """
-        Determine if wake event should trigger note transfer to Mac
-        
-        Args:
-            wake_event_source: The wake event source (e.g., "wakeword (sendnote.pmdl)")
-            
-        Returns:
-            bool: True if should send note to Mac, False otherwise
-        """
-        if not wake_event_source or 'wakeword' not in wake_event_source:
-            return False
-            
-        # Extract model name from wake event source
-        if '(' in wake_event_source and ')' in wake_event_source:
-            model_name = wake_event_source.split('(')[1].rstrip(')')
-            
-            # Define wake words that should trigger note transfer
-            note_transfer_wake_words = [
-                "sendnote.pmdl",
-            ]
-            
-            return model_name in note_transfer_wake_words
-            
-        return False
+        """Determine if wake event should trigger note transfer to Mac"""
+        return self._get_wake_action(wake_event_source) == "note"
     
     async def send_note_to_mac(self):
         """Send pi500_note.txt to Mac server via MCP endpoint"""
@@ -1084,12 +1103,12 @@ class PiMCPClient:
             from send_note_to_mac import Pi500NoteSender
             
             sender = Pi500NoteSender()
-            result = sender.send_note()
+            # send_note() does blocking network IO - keep it off the event loop
+            result = await asyncio.to_thread(sender.send_note)
             
             if result["success"]:
                 # Success - play confirmation sound and speak result
-                success_sound = "/home/user/rp_client/assets/sounds/sound_effects/successfulloadup.mp3"
-                if os.path.exists(success_sound):
+                if success_sound := self._sound_files["success"]:
                     await self.audio_coordinator.play_audio_file(success_sound)
                 
                 message = "Note successfully sent to Mac server!"
@@ -1104,8 +1123,7 @@ class PiMCPClient:
                 
             else:
                 # Error - play error sound and speak error
-                error_sound = "/home/user/rp_client/assets/sounds/sound_effects/error.mp3"
-                if os.path.exists(error_sound):
+                if error_sound := self._sound_files["error"]:
                     await self.audio_coordinator.play_audio_file(error_sound)
                 
                 message = f"Failed to send note: {result.get('error', 'Unknown error')}"
@@ -1122,8 +1140,7 @@ class PiMCPClient:
             print(f"[ERROR] Exception in send_note_to_mac: {e}")
             
             # Play error sound
-            error_sound = "/home/user/rp_client/assets/sounds/sound_effects/error.mp3"
-            if os.path.exists(error_sound):
+            if error_sound := self._sound_files["error"]:
                 await self.audio_coordinator.play_audio_file(error_sound)
             
             # Speak error
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Compiled sum-of-squares kernel for frame energy, built with cffi at import.
+
+Used by frame_energy when numba isn't installed, avoiding both the JIT warm-up
+and NumPy's per-call overhead. The build is cached by cffi after the first
+import; if cffi or a C compiler is unavailable, ``lib`` is None and callers
+fall back to NumPy.
+"""
+
+try:
+    import cffi
+
+    ffi = cffi.FFI()
+    ffi.cdef("int64_t sum_sq_i16(const int16_t *buf, int n);")
+    lib = ffi.verify(
+        """
+        #include <stdint.h>
+        int64_t sum_sq_i16(const int16_t *buf, int n) {
+            int64_t s = 0;
+            for (int i = 0; i < n; i++) {
+                int32_t v = buf[i];
+                s += (int64_t)(v * v);
+            }
+            return s;
+        }
+        """,
+        extra_compile_args=["-O3", "-ftree-vectorize"],
+    )
+except Exception as e:
+    # ImportError when cffi is missing, VerificationError when no compiler
+    print(f"[FrameEnergy] C energy kernel unavailable: {e}")
+    ffi = None
+    lib = None
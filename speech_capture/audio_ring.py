@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Audio Ring - Threaded audio frame producer for the speech capture loops
+
+A dedicated reader thread pulls fixed-size PCM frames from the audio manager
+into a fixed-size single-producer/single-consumer ring. The asyncio consumer
+awaits new frames instead of calling the blocking stream read inline and
+spin-sleeping between empty reads.
+
+Only the producer advances write_idx and only the consumer advances read_idx,
+so no lock is needed; the producer wakes the consumer through
+loop.call_soon_threadsafe.
+
+PyAudio has no read-into API, so each read already allocates a fresh immutable
+bytes object. The ring stores those objects in its slots and hands the same
+object to the consumer, so frames are never copied after the stream read.
+"""
+
+import asyncio
+import threading
+
+from speech_capture.thread_affinity import pin_current_thread
+
+
+class FrameRing:
+    """
+    SPSC ring of fixed-size PCM frames filled by a background reader thread.
+
+    If the consumer falls a full ring behind, new frames are dropped (and
+    counted) rather than overwriting frames that have not been read yet.
+    """
+
+    def __init__(self, read_frame, frame_bytes: int, n_slots: int = 32, cpu_affinity=None, nice_increment: int = 0):
+        """
+        Args:
+            read_frame: Blocking callable returning one frame of PCM bytes (or None)
+            frame_bytes: Expected size of each frame in bytes
+            n_slots: Ring capacity in frames
+            cpu_affinity: Optional CPU indices to pin the producer thread to
+            nice_increment: Optional nice adjustment for the producer thread
+        """
+        self._read_frame = read_frame
+        self.frame_bytes = frame_bytes
+        self.n_slots = n_slots
+        self._slots = [None] * n_slots
+        self._write_idx = 0
+        self._read_idx = 0
+        self.dropped_frames = 0
+        self._cpu_affinity = cpu_affinity
+        self._nice_increment = nice_increment
+
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._loop = None
+        self._event = asyncio.Event()
+
+    def start(self):
+        """Start the producer thread (must be called from the event loop)"""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._produce, name="audio-frame-producer", daemon=True)
+        self._thread.start()
+
+    async def stop(self):
+        """Stop the producer thread and wait for its in-flight read to finish"""
+        self._stop_event.set()
+        if self._thread:
+            await asyncio.to_thread(self._thread.join, 1.0)
+            self._thread = None
+
+    def _produce(self):
+        """Reader thread: copy frames from the audio stream into the ring"""
+        pin_current_thread(self._cpu_affinity, "audio producer", self._nice_increment)
+        fb = self.frame_bytes
+        backoff = 0.005
+        while not self._stop_event.is_set():
+            # Normally this blocks inside the stream read until the device has a frame
+            data = self._read_frame()
+            if not data:
+                # Stream closed or erroring - back off (up to 100 ms) rather than
+                # spinning, and wake immediately if stop() is called
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, 0.1)
+                continue
+            backoff = 0.005
+            if len(data) != fb:
+                print(f"[FrameRing] Frame size mismatch: got {len(data)}, expected {fb}")
+                continue
+            if self._write_idx - self._read_idx >= self.n_slots:
+                self.dropped_frames += 1
+                continue
+
+            self._slots[self._write_idx % self.n_slots] = data
+            self._write_idx += 1
+            try:
+                self._loop.call_soon_threadsafe(self._event.set)
+            except RuntimeError:
+                # Event loop closed underneath us
+                break
+
+    async def read(self, timeout: float | None = None) -> bytes | None:
+        """
+        Wait for the next frame.
+
+        Args:
+            timeout: Seconds to wait for a frame; None waits indefinitely
+
+        Returns:
+            bytes | None: The next PCM frame, or None if the timeout expired
+        """
+        if self._read_idx == self._write_idx:
+            self._event.clear()
+            # Re-check after clearing so a frame written in between isn't missed
+            if self._read_idx == self._write_idx:
+                try:
+                    await asyncio.wait_for(self._event.wait(), timeout)
+                except asyncio.TimeoutError:
+                    return None
+                if self._read_idx == self._write_idx:
+                    return None
+
+        slot = self._read_idx % self.n_slots
+        frame = self._slots[slot]
+        # Drop the ring's reference so the frame is freed once the caller is done
+        self._slots[slot] = None
+        self._read_idx += 1
+        return frame
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Frame Energy - RMS energy kernel for the VAD capture loop
+
+Computes the mean square of a 16-bit PCM frame in a single pass without the
+int16 -> float32 -> squared temporaries of the naive NumPy version. A
+Numba-compiled kernel with an exact int64 accumulator is used when numba is
+installed; otherwise a cffi-compiled C kernel (see _vad_c) is tried, and as a
+last resort a NumPy einsum fallback accumulates in int64 without materializing
+a converted copy of the frame.
+
+The normalized RMS energy the VAD thresholds are calibrated against is
+sqrt(mean_sq) * INV_FULL_SCALE.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Multiply instead of dividing by 32768 on every frame
+INV_FULL_SCALE = 1.0 / 32768.0
+
+
+def _frame_mean_sq_i16_numpy(buf: np.ndarray) -> float:
+    """NumPy fallback: mean of squared int16 samples (raw sample units)"""
+    n = buf.shape[0]
+    if n == 0:
+        return 0.0
+    # np.dot would accumulate in int16 and overflow; einsum casts per buffered chunk
+    return int(np.einsum('i,i->', buf, buf, dtype=np.int64)) / n
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def frame_mean_sq_i16(buf):
+        """Mean of squared int16 samples, accumulated exactly in int64"""
+        n = buf.shape[0]
+        if n == 0:
+            return 0.0
+        s = np.int64(0)
+        for i in range(n):
+            v = np.int64(buf[i])
+            s += v * v
+        return s / n
+else:
+    from speech_capture._vad_c import ffi as _c_ffi, lib as _c_lib
+
+    if _c_lib is not None:
+        def frame_mean_sq_i16(buf):
+            """Mean of squared int16 samples via the compiled C kernel"""
+            n = buf.shape[0]
+            if n == 0:
+                return 0.0
+            return _c_lib.sum_sq_i16(_c_ffi.from_buffer("int16_t[]", buf), n) / n
+    else:
+        frame_mean_sq_i16 = _frame_mean_sq_i16_numpy
+
+
+def frame_rms_i16(buf) -> float:
+    """RMS of an int16 frame normalized to [0, 1]"""
+    return math.sqrt(frame_mean_sq_i16(buf)) * INV_FULL_SCALE
+
+
+def warm_up():
+    """Trigger JIT compilation up front so the first real frame isn't penalized"""
+    frame_mean_sq_i16(np.zeros(16, dtype=np.int16))
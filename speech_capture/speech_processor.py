@@ -26,13 +26,38 @@ TRANSCRIPT PRIORITY ORDER:
 """
 
 import asyncio
+import collections
+import math
+import os
+import queue
+import sys
+import threading
 import time
 import traceback
-import select
+import selectors
 import numpy as np
 from typing import Optional
 from evdev import ecodes
 from speech_capture.vosk_readiness_checker import vosk_readiness
+from speech_capture.audio_ring import FrameRing
+from speech_capture.thread_affinity import pin_current_thread
+from speech_capture.frame_energy import INV_FULL_SCALE, frame_mean_sq_i16, warm_up as warm_up_energy_kernel
+
+try:
+    from config.client_config import AUDIO_THREAD_CPUS, VOSK_THREAD_CPUS
+except ImportError:
+    # Leave cores 0/1 to the asyncio/display thread
+    AUDIO_THREAD_CPUS, VOSK_THREAD_CPUS = {2}, {3}
+
+try:
+    import pyudev
+    PYUDEV_AVAILABLE = True
+except ImportError:
+    PYUDEV_AVAILABLE = False
+
+# VAD capture states
+VAD_IDLE = 0     # Waiting for speech to start
+VAD_VOICED = 1   # Speech in progress, counting trailing silence
 
 
 class SpeechProcessor:
@@ -46,7 +71,42 @@ class SpeechProcessor:
     def __init__(self, audio_manager, transcriber, keyboard_device=None):
         self.audio_manager = audio_manager
         self.transcriber = transcriber
-        self.keyboard_device = keyboard_device
+        self.keyboard_device = None
+        
+        # Selector is registered once per device instead of rebuilding an fd set every frame
+        self._key_selector = selectors.DefaultSelector()
+        self._device_valid_until = 0.0
+        self._set_keyboard_device(keyboard_device)
+        
+        # Re-enumerate input devices only when udev reports a hot-plug event
+        self._input_devices_changed = keyboard_device is None
+        self._udev_observer = None
+        if PYUDEV_AVAILABLE:
+            try:
+                monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+                monitor.filter_by('input')
+                self._udev_observer = pyudev.MonitorObserver(
+                    monitor, callback=self._on_input_device_event, name="vad-input-monitor"
+                )
+                self._udev_observer.start()
+            except Exception as e:
+                print(f"[VAD] udev monitor unavailable, falling back to device polling: {e}")
+                self._udev_observer = None
+        
+        # Throttle for partial transcript output (monotonic seconds, reset per capture)
+        self._last_partial_print_time = 0.0
+        
+        # Per-frame debug lines are batched and written out once per flush
+        self._log_buf = []
+        
+        # Transcription runs on a worker thread so VOSK round-trips don't stall VAD timing
+        self._vosk_in = queue.Queue(maxsize=32)
+        self._vosk_out = queue.Queue()
+        self._vosk_thread = threading.Thread(target=self._vosk_worker, name="vosk-frame-worker", daemon=True)
+        self._vosk_thread.start()
+        
+        # Compile the energy kernel now rather than on the first captured frame
+        warm_up_energy_kernel()
         
     async def _check_manual_vad_stop(self):
         """Check for manual VAD stop via keyboard"""
@@ -54,15 +114,21 @@ class SpeechProcessor:
             return False
             
         # Handle channel switching - refresh keyboard device if needed
-        if not self.keyboard_device or not self._is_device_valid():
+        if self._udev_observer:
+            if self._input_devices_changed:
+                self._input_devices_changed = False
+                self._refresh_keyboard_device()
+        elif not self.keyboard_device or not self._is_device_valid():
             self._refresh_keyboard_device()
             
         if not self.keyboard_device:
             return False
             
         try:
-            if select.select([self.keyboard_device.fd], [], [], 0)[0]:
-                for event in self.keyboard_device.read():
+            if self._key_selector.select(0):
+                # Drain the whole queue so a burst of events is seen in one frame
+                events = list(self.keyboard_device.read())
+                for event in events:
                     if event.type == ecodes.EV_KEY and event.code == ecodes.KEY_LEFTMETA and event.value == 1:
                         print("[VAD] Manual stop via keyboard.")
                         return True
@@ -75,16 +141,109 @@ class SpeechProcessor:
                 print(f"[VAD] Keyboard read error: {e}")
         return False
         
+    def _dlog(self, msg):
+        """Queue a per-frame debug line instead of printing it from the hot loop"""
+        self._log_buf.append(msg)
+        
+    def _flush_dlog(self):
+        """Write all queued debug lines to stdout in a single write"""
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            sys.stdout.flush()
+            self._log_buf.clear()
+            
+    def _vosk_worker(self):
+        """Worker thread: feed queued frames to the transcriber off the event loop"""
+        pin_current_thread(VOSK_THREAD_CPUS, "VOSK worker")
+        while True:
+            pcm_bytes = self._vosk_in.get()
+            try:
+                result = self.transcriber.process_frame(pcm_bytes)
+            except Exception as e:
+                result = e
+            self._vosk_out.put(result)
+            self._vosk_in.task_done()
+            
+    def _submit_vosk_frame(self, pcm_bytes):
+        """Queue a frame for transcription, dropping the oldest if the worker falls behind"""
+        try:
+            self._vosk_in.put_nowait(pcm_bytes)
+        except queue.Full:
+            try:
+                self._vosk_in.get_nowait()
+                self._vosk_in.task_done()
+            except queue.Empty:
+                pass
+            self._vosk_in.put_nowait(pcm_bytes)
+            
+    def _drain_vosk_results(self):
+        """Collect all transcription results produced since the last call (non-blocking)"""
+        results = []
+        while True:
+            try:
+                results.append(self._vosk_out.get_nowait())
+            except queue.Empty:
+                return results
+                
+    async def _retranscribe(self, audio_window, tag):
+        """Re-decode the captured audio when the streamed VOSK session came back empty"""
+        if not audio_window or not hasattr(self.transcriber, "decode_full"):
+            return ""
+        print(f"[{tag}] Re-transcribing {len(audio_window)} captured frames...")
+        try:
+            transcript = await asyncio.to_thread(self.transcriber.decode_full, b"".join(audio_window))
+        except Exception as e:
+            print(f"[{tag}] Re-transcription failed: {e}")
+            return ""
+        return (transcript or "").strip()
+        
+    async def _wait_for_vosk_frames(self, discard=False):
+        """Wait until queued frames have reached VOSK, optionally dropping ones not yet sent"""
+        if discard:
+            while True:
+                try:
+                    self._vosk_in.get_nowait()
+                except queue.Empty:
+                    break
+                self._vosk_in.task_done()
+        await asyncio.to_thread(self._vosk_in.join)
+        
+    def _on_input_device_event(self, device):
+        """udev observer callback (runs on the observer thread)"""
+        if device.action in ('add', 'remove') and (device.device_node or '').startswith('/dev/input/event'):
+            # Only flag the change; the device is swapped on the capture loop
+            self._input_devices_changed = True
+            
     def _is_device_valid(self):
-        """Check if keyboard device is still valid"""
+        """Check if keyboard device is still valid (result cached for ~1s)"""
         if not self.keyboard_device:
             return False
-        try:
-            # Quick test read with no blocking
-            select.select([self.keyboard_device.fd], [], [], 0)
+        now = time.monotonic()
+        if now < self._device_valid_until:
             return True
+        try:
+            # fstat fails once the fd has been closed or revoked
+            os.fstat(self.keyboard_device.fd)
         except (OSError, ValueError):
+            self._device_valid_until = 0.0
             return False
+        self._device_valid_until = now + 1.0
+        return True
+        
+    def _set_keyboard_device(self, device):
+        """Swap the keyboard device, keeping the selector registration in sync"""
+        if self.keyboard_device:
+            try:
+                self._key_selector.unregister(self.keyboard_device)
+            except (KeyError, ValueError, OSError):
+                pass
+        self.keyboard_device = device
+        self._device_valid_until = 0.0
+        if device:
+            try:
+                self._key_selector.register(device, selectors.EVENT_READ)
+            except (KeyError, ValueError, OSError) as e:
+                print(f"[VAD] Could not watch keyboard device: {e}")
             
     def _refresh_keyboard_device(self):
         """Refresh keyboard device connection for channel switching"""
@@ -97,22 +256,23 @@ class SpeechProcessor:
                 if ('k780' in device.name.lower() or 
                     ('keyboard' in device.name.lower() and 'mouse' not in device.name.lower())):
                     # Close old device if exists
-                    if self.keyboard_device:
+                    old_device = self.keyboard_device
+                    self._set_keyboard_device(device)
+                    if old_device:
                         try:
-                            self.keyboard_device.close()
+                            old_device.close()
                         except:
                             pass
                     
-                    self.keyboard_device = device
                     print(f"[VAD] Refreshed keyboard device: {device.name}")
                     return
                     
             # Keyboard not found - continue without logging to reduce noise
-            self.keyboard_device = None
+            self._set_keyboard_device(None)
             
         except Exception as e:
             print(f"[VAD] Error refreshing keyboard device: {e}")
-            self.keyboard_device = None
+            self._set_keyboard_device(None)
 
     async def capture_speech_with_unified_vad(self, display_manager, is_follow_up=False, claude_code_mode=False, immediate_feedback_callback=None) -> str | None:
         """Unified VAD function for speech capture"""
@@ -173,73 +333,147 @@ class SpeechProcessor:
         # Initialize state variables
         overall_start_time = time.monotonic()
         speech_start_time = 0
-        voice_started = False
+        state = VAD_IDLE
         silence_frames_count = 0
         last_partial_text = ""  # Track accumulated partials for fallback
+        self._last_partial_print_time = 0.0
         
         
         # Calculate frame timing
         frames_per_second = self.audio_manager.sample_rate / self.audio_manager.frame_length
         silence_frames_needed = int(silence_duration * frames_per_second)
-        frame_history = []
+        frame_period = 1.0 / frames_per_second
+        
+        # Bounded copy of the captured audio so an empty VOSK result can be re-decoded
+        audio_window = collections.deque(maxlen=int(frames_per_second * max_recording_time) + 1)
+        
+        # Debug log throttles counted in frames instead of wall-clock modulo checks
+        frame_idx = 0
+        log_every_half_second = max(1, int(frames_per_second / 2))
+        log_every_second = max(1, int(frames_per_second))
+        log_every_five_seconds = max(1, int(frames_per_second * 5))
+        
+        # Fixed-size ring buffer with a running sum for the moving-average energy
+        frame_history = np.zeros(frame_history_length, dtype=np.float32)
+        history_idx = 0
+        history_filled = 0
+        history_sum = 0.0
+        
+        # Read audio on a producer thread so the loop awaits frames instead of polling
+        frame_ring = FrameRing(
+            self.audio_manager.read_audio_frame,
+            self.audio_manager.frame_length * 2,
+            cpu_affinity=AUDIO_THREAD_CPUS,
+            nice_increment=-5,
+        )
+        frame_ring.start()
+        
+        # Local aliases for names resolved on every frame
+        monotonic = time.monotonic
+        read_frame = frame_ring.read
+        frame_timeout = frame_period * 2
+        frombuffer = np.frombuffer
+        int16 = np.int16
+        sqrt = math.sqrt
+        mean_sq_kernel = frame_mean_sq_i16
+        check_manual_stop = self._check_manual_vad_stop
+        submit_vosk_frame = self._submit_vosk_frame
+        drain_vosk_results = self._drain_vosk_results
+        dlog = self._dlog
         
         try:
             while True:
-                current_time = time.monotonic()
+                current_time = monotonic()
                 
                 # Check for manual stop via keyboard
-                if await self._check_manual_vad_stop():
-                    print(f"[VAD] Manual stop triggered. Voice started: {voice_started}, Duration: {(current_time - speech_start_time) if voice_started else 0:.2f}s")
+                if await check_manual_stop():
+                    self._flush_dlog()
+                    print(f"[VAD] Manual stop triggered. Voice started: {state == VAD_VOICED}, Duration: {(current_time - speech_start_time) if state == VAD_VOICED else 0:.2f}s")
                     # Always process what we have, don't reset
-                    if voice_started:
+                    if state == VAD_VOICED:
                         # Give a small buffer time to process the last audio
                         await asyncio.sleep(speech_buffer_time)
                     # Break without resetting - we want to keep any partial transcript
                     break
 
                 # Timeout checks
-                if not voice_started and (current_time - overall_start_time > initial_timeout):
+                if state == VAD_IDLE and (current_time - overall_start_time > initial_timeout):
                     elapsed = current_time - overall_start_time
+                    self._flush_dlog()
                     print(f"[VAD] {'Follow-up' if is_follow_up else 'Initial'} timeout ({initial_timeout:.1f}s) reached at {elapsed:.2f}s. No voice detected.")
+                    await self._wait_for_vosk_frames(discard=True)
                     self.transcriber.reset()  # Clean up before returning
                     return None
                     
-                if voice_started and (current_time - speech_start_time > max_recording_time):
+                if state == VAD_VOICED and (current_time - speech_start_time > max_recording_time):
                     print(f"[VAD] Max recording time ({max_recording_time:.1f}s) reached.")
                     break
 
-                # Read audio frame
-                pcm_bytes = self.audio_manager.read_audio_frame()
+                # Wait for the next audio frame (size is validated by the producer);
+                # the timeout keeps the stop/timeout checks above running if audio stalls
+                pcm_bytes = await read_frame(timeout=frame_timeout)
                 if not pcm_bytes:
-                    await asyncio.sleep(0.005)
                     continue
-
-                # Validate frame size
-                expected_frame_size = self.audio_manager.frame_length * 2
-                if len(pcm_bytes) != expected_frame_size:
-                    print(f"[VAD DEBUG] Frame size mismatch: got {len(pcm_bytes)}, expected {expected_frame_size}")
-                    continue
-
-                # Calculate energy
-                frame_data_int16 = np.frombuffer(pcm_bytes, dtype=np.int16)
-                frame_data_float32 = frame_data_int16.astype(np.float32) / 32768.0
-                current_energy = np.sqrt(np.mean(frame_data_float32**2)) if len(frame_data_float32) > 0 else 0.0
+                frame_idx += 1
+                audio_window.append(pcm_bytes)
+
+                # Calculate energy. The start/continue decisions below compare the
+                # moving average, not this frame, so the exact value is needed every
+                # frame - a loud-sample early exit can't stand in for the reduction.
+                frame_data_int16 = frombuffer(pcm_bytes, dtype=int16)
+                frame_rms = sqrt(mean_sq_kernel(frame_data_int16))
+                current_energy = frame_rms * INV_FULL_SCALE
                 
-                # Maintain frame history for smoothing
-                frame_history.append(current_energy)
-                if len(frame_history) > frame_history_length:
-                    frame_history.pop(0)
-                avg_energy = np.mean(frame_history) if frame_history else 0.0
+                # Maintain frame history for smoothing (O(1) ring buffer update)
+                history_sum += current_energy - frame_history[history_idx]
+                frame_history[history_idx] = current_energy
+                history_idx = (history_idx + 1) % frame_history_length
+                if history_filled < frame_history_length:
+                    history_filled += 1
+                avg_energy = history_sum / history_filled
                 
                 # Debug energy calculation details
-                if len(frame_history) <= 5:  # First 5 frames to see garbage pattern
+                if frame_idx <= 5:  # First 5 frames to see garbage pattern
                     frame_max = np.max(np.abs(frame_data_int16))
-                    frame_rms = np.sqrt(np.mean(frame_data_int16.astype(np.float64)**2))
-                    print(f"[VAD DEBUG] Frame {len(frame_history)}: current={current_energy:.6f}, avg={avg_energy:.6f}, max_sample={frame_max}, raw_rms={frame_rms:.6f}")
-                elif len(frame_history) == 10:  # When history is full
-                    print(f"[VAD DEBUG] Frame history full: avg={avg_energy:.6f}, min={np.min(frame_history):.6f}, max={np.max(frame_history):.6f}")
-                elif int(current_time * 4) % 20 == 0:  # Every 5 seconds during normal operation
-                    print(f"[VAD DEBUG] Current energy: {current_energy:.6f}, avg over {len(frame_history)} frames: {avg_energy:.6f}")
+                    dlog(f"[VAD DEBUG] Frame {frame_idx}: current={current_energy:.6f}, avg={avg_energy:.6f}, max_sample={frame_max}, raw_rms={frame_rms:.6f}")
+                elif frame_idx == frame_history_length:  # When history is full
+                    dlog(f"[VAD DEBUG] Frame history full: avg={avg_energy:.6f}, min={np.min(frame_history):.6f}, max={np.max(frame_history):.6f}")
+                elif frame_idx % log_every_five_seconds == 0:  # Every 5 seconds during normal operation
+                    dlog(f"[VAD DEBUG] Current energy: {current_energy:.6f}, avg over {history_filled} frames: {avg_energy:.6f}")
+
+                # VAD state machine: IDLE -> VOICED -> end of capture (break)
+                if state == VAD_IDLE:
+                    # Start voice detection as soon as the smoothed energy crosses the threshold
+                    if avg_energy > energy_threshold:
+                        state = VAD_VOICED
+                        speech_start_time = current_time
+                        silence_frames_count = 0
+                        self._flush_dlog()
+                        elapsed = current_time - overall_start_time
+                        print(f"[VAD] Voice started at {elapsed:.2f}s with energy {avg_energy:.6f}")
+                    elif frame_idx % log_every_half_second == 0:  # Every 0.5 seconds
+                        dlog(f"[VAD DEBUG] Energy: {avg_energy:.6f} vs threshold: {energy_threshold:.6f}")
+                        
+                elif state == VAD_VOICED:
+                    # Continuation uses the lower continuation threshold
+                    silence_frames_count = 0 if avg_energy > continued_threshold else silence_frames_count + 1
+                    speech_duration = current_time - speech_start_time
+                    
+                    if frame_idx % log_every_second == 0:  # Every 1 second during speech
+                        dlog(f"[VAD DEBUG] Energy: {avg_energy:.6f} vs {continued_threshold:.6f}, Silence frames: {silence_frames_count}/{silence_frames_needed}, Speech time: {speech_duration:.2f}s")
+                    
+                    # End conditions - ONLY use 2-second silence detection
+                    if silence_frames_count >= silence_frames_needed and speech_duration >= min_speech_duration:
+                        self._flush_dlog()
+                        print(f"[VAD] End of speech by 2s silence. Duration: {speech_duration:.2f}s")
+                        
+                        # Play immediate feedback if provided (for Claude Code)
+                        if immediate_feedback_callback:
+                            print("[VAD] Triggering immediate feedback...")
+                            await immediate_feedback_callback()
+                        
+                        await asyncio.sleep(speech_buffer_time)
+                        break
 
                 # ==================== VOSK TRANSCRIPTION PROCESSING ====================
                 # CRITICAL: VAD controls ALL timing decisions, VOSK provides transcription only
@@ -250,82 +484,49 @@ class SpeechProcessor:
                 # - VOSK's timing often interrupts natural speech flow with pauses
                 #
                 # SOLUTION: Ignore VOSK finals, accumulate partials, use server's complete result
-                try:
-                    is_final_vosk, is_speech, partial_text_vosk = self.transcriber.process_frame(pcm_bytes)
+                #
+                # Frames go to a worker thread; results are picked up as they become ready.
+                # This runs after the state machine so a frame that ends the capture
+                # isn't sent just to be discarded.
+                submit_vosk_frame(pcm_bytes)
+                current_partial = None
+                for vosk_result in drain_vosk_results():
+                    if isinstance(vosk_result, Exception):
+                        print(f"[VAD] Vosk processing error: {vosk_result}")
+                        continue
+                    result_final, is_speech, partial_text_vosk = vosk_result
+                    
+                    elapsed_speech = (current_time - speech_start_time) if state == VAD_VOICED else 0
                     
                     # Debug VOSK responses
-                    if is_final_vosk or is_speech or partial_text_vosk:
-                        elapsed_speech = (current_time - speech_start_time) if voice_started else 0
-                        print(f"[VOSK DEBUG] final={is_final_vosk}, speech={is_speech}, partial='{partial_text_vosk}', speech_time={elapsed_speech:.2f}s")
+                    if result_final or is_speech or partial_text_vosk:
+                        dlog(f"[VOSK DEBUG] final={result_final}, speech={is_speech}, partial='{partial_text_vosk}', speech_time={elapsed_speech:.2f}s")
                     
                     # IGNORE VOSK's internal final decisions - they're premature and break continuous speech
-                    if is_final_vosk:
-                        print(f"[VAD] IGNORING premature Vosk final at {(current_time - speech_start_time):.2f}s - continuing to listen")
+                    if result_final:
+                        print(f"[VAD] IGNORING premature Vosk final at {elapsed_speech:.2f}s - continuing to listen")
                     
                     # ACCUMULATE partial transcriptions during speech capture
                     # Partials are often more accurate than VOSK's final results
                     # This mirrors the successful push-to-talk implementation
                     if is_speech and partial_text_vosk:
-                        current_partial = partial_text_vosk.strip()
+                        partial = partial_text_vosk.strip()
                         # Track the most recent meaningful partial for fallback use
-                        if len(current_partial) > 0:
-                            last_partial_text = current_partial
-                            print(f"[VAD DEBUG] Updated partial: '{current_partial}'")
-                    else:
-                        current_partial = None
-                        
-                except Exception as vosk_error:
-                    print(f"[VAD] Vosk processing error: {vosk_error}")
-                    is_final_vosk = False
-                    current_partial = None
-
-                # Simplified VAD State Machine - Start immediately with clean audio
-                if not voice_started:
-                    # Debug: Log energy levels every few frames
-                    if int(current_time * 10) % 5 == 0:  # Every 0.5 seconds
-                        print(f"[VAD DEBUG] Energy: {avg_energy:.6f} vs threshold: {energy_threshold:.6f}")
-                    
-                    # Check if energy is above threshold to start voice detection immediately
-                    if avg_energy > energy_threshold:
-                        voice_started = True
-                        speech_start_time = current_time
-                        silence_frames_count = 0
-                        elapsed = current_time - overall_start_time
-                        print(f"[VAD] Voice started at {elapsed:.2f}s with energy {avg_energy:.6f}")
-                else:
-                    # Voice has started - check for continuation using continuation threshold
-                    if avg_energy > continued_threshold:
-                        silence_frames_count = 0
-                    else:
-                        silence_frames_count += 1
-
-                    speech_duration = current_time - speech_start_time
-                    
-                    # Debug output to track energy and frame timing
-                    if int(current_time * 4) % 4 == 0:  # Every 1 second during speech
-                        print(f"[VAD DEBUG] Energy: {avg_energy:.6f} vs {continued_threshold:.6f}, Silence frames: {silence_frames_count}/{silence_frames_needed}, Speech time: {speech_duration:.2f}s")
-                    
-                    # End conditions - ONLY use 2-second silence detection
-                    if silence_frames_count >= silence_frames_needed and speech_duration >= min_speech_duration:
-                        print(f"[VAD] End of speech by 2s silence. Duration: {speech_duration:.2f}s")
-                        
-                        # Play immediate feedback if provided (for Claude Code)
-                        if immediate_feedback_callback:
-                            print("[VAD] Triggering immediate feedback...")
-                            await immediate_feedback_callback()
-                        
-                        await asyncio.sleep(speech_buffer_time)
-                        break
-                        
-                    # Log VOSK finals but DO NOT end on them - they're broken!
-                    if is_final_vosk:
-                        print(f"[VAD] IGNORING premature Vosk final at {speech_duration:.2f}s - continuing to listen")
+                        if len(partial) > 0:
+                            current_partial = partial
+                            last_partial_text = partial
+                            dlog(f"[VAD DEBUG] Updated partial: '{partial}'")
 
                 # Display partial results (less spammy - every 1 second)
                 if current_partial:
-                    if not hasattr(self, "last_partial_print_time") or (current_time - getattr(self, "last_partial_print_time", 0) > 1.0):
-                        print(f"[VAD] Partial: {current_partial}")
-                        self.last_partial_print_time = current_time
+                    if current_time - self._last_partial_print_time > 1.0:
+                        dlog(f"[VAD] Partial: {current_partial}")
+                        self._last_partial_print_time = current_time
+
+                if frame_idx % log_every_half_second == 0:
+                    self._flush_dlog()
+
+            self._flush_dlog()
 
             # ==================== FINAL TRANSCRIPT EXTRACTION ====================
             # When VAD determines speech has ended, get the most complete transcription
@@ -337,9 +538,21 @@ class SpeechProcessor:
             #
             # The server's final_result is generated by calling VOSK's FinalResult() 
             # which consolidates everything processed during the session
+            #
+            # Let queued frames reach VOSK first so the final result covers all audio
+            await self._wait_for_vosk_frames()
+            for vosk_result in self._drain_vosk_results():
+                if not isinstance(vosk_result, Exception) and vosk_result[1] and vosk_result[2] and vosk_result[2].strip():
+                    last_partial_text = vosk_result[2].strip()
             final_transcript = self.transcriber.get_final_text()
             print(f"[VAD] Raw final transcript from VOSK: '{final_transcript}'")
             
+            # RETRY: re-decode the buffered audio before settling for partials
+            if (not final_transcript or not final_transcript.strip()) and state == VAD_VOICED:
+                final_transcript = await self._retranscribe(audio_window, "VAD")
+                if final_transcript:
+                    print(f"[VAD] Re-transcription result: '{final_transcript}'")
+            
             # FALLBACK LOGIC: Use accumulated partials if VOSK final is incomplete
             # This happens when VOSK's internal state is fragmented due to timing conflicts
             if (not final_transcript or not final_transcript.strip()) and last_partial_text:
@@ -394,13 +607,16 @@ class SpeechProcessor:
             print(f"[ERROR] Error during VAD/transcription: {e}")
             traceback.print_exc()
             # Reset transcriber on error
+            await self._wait_for_vosk_frames(discard=True)
             self.transcriber.reset()
             return None
             
         finally:
+            self._flush_dlog()
+            await frame_ring.stop()
+            await self._wait_for_vosk_frames(discard=True)
+            self._drain_vosk_results()
             await self.audio_manager.stop_listening()
-            if hasattr(self, "last_partial_print_time"):
-                del self.last_partial_print_time
 
     async def capture_speech_push_to_talk(self, display_manager, immediate_feedback_callback=None) -> str | None:
         """
@@ -437,6 +653,21 @@ class SpeechProcessor:
         callback_triggered = False  # Track if we've triggered the feedback callback
         manual_stop = False  # Track if manually stopped
         last_partial_text = ""  # Track last partial for fallback
+        self._last_partial_print_time = 0.0
+        last_log_flush = start_time
+        
+        # Read audio on a producer thread so the loop awaits frames instead of polling
+        frame_ring = FrameRing(
+            self.audio_manager.read_audio_frame,
+            self.audio_manager.frame_length * 2,
+            cpu_affinity=AUDIO_THREAD_CPUS,
+            nice_increment=-5,
+        )
+        frame_ring.start()
+        frame_period = self.audio_manager.frame_length / self.audio_manager.sample_rate
+        
+        # Bounded copy of the captured audio so an empty VOSK result can be re-decoded
+        audio_window = collections.deque(maxlen=int(max_recording_time / frame_period) + 1)
         
         try:
             while True:
@@ -455,19 +686,23 @@ class SpeechProcessor:
                     print(f"[PUSH-TO-TALK] Max recording time ({max_recording_time}s) reached.")
                     break
                 
-                # Read and process audio frame
-                pcm_bytes = self.audio_manager.read_audio_frame()
+                # Wait for the next audio frame from the producer thread
+                pcm_bytes = await frame_ring.read(timeout=frame_period * 2)
                 if not pcm_bytes:
-                    await asyncio.sleep(0.005)
                     continue
+                audio_window.append(pcm_bytes)
                 
                 # Debug: Log that we're sending audio to VOSK (only log first few frames to avoid spam)
                 if current_time - start_time < 1.0:
-                    print(f"[PUSH-TO-TALK DEBUG] Sending audio frame to VOSK, size: {len(pcm_bytes)} bytes")
+                    self._dlog(f"[PUSH-TO-TALK DEBUG] Sending audio frame to VOSK, size: {len(pcm_bytes)} bytes")
                 
-                # Process with transcriber
-                try:
-                    is_final_vosk, is_speech, partial_text_vosk = self.transcriber.process_frame(pcm_bytes)
+                # Process with transcriber (on the worker thread)
+                self._submit_vosk_frame(pcm_bytes)
+                for vosk_result in self._drain_vosk_results():
+                    if isinstance(vosk_result, Exception):
+                        print(f"[PUSH-TO-TALK] Vosk processing error: {vosk_result}")
+                        continue
+                    is_final_vosk, is_speech, partial_text_vosk = vosk_result
                     
                     # Track last partial text for fallback
                     if partial_text_vosk and len(partial_text_vosk.strip()) > 0:
@@ -487,12 +722,16 @@ class SpeechProcessor:
                     
                     # Show partial results
                     if partial_text_vosk and len(partial_text_vosk.strip()) > 0:
-                        if not hasattr(self, "last_partial_print_time") or (current_time - getattr(self, "last_partial_print_time", 0) > 0.5):
-                            print(f"[PUSH-TO-TALK] Partial: {partial_text_vosk}")
-                            self.last_partial_print_time = current_time
-                            
-                except Exception as vosk_error:
-                    print(f"[PUSH-TO-TALK] Vosk processing error: {vosk_error}")
+                        if current_time - self._last_partial_print_time > 0.5:
+                            self._dlog(f"[PUSH-TO-TALK] Partial: {partial_text_vosk}")
+                            self._last_partial_print_time = current_time
+                
+                # Write out batched debug lines roughly twice a second
+                if current_time - last_log_flush > 0.5:
+                    self._flush_dlog()
+                    last_log_flush = current_time
+            
+            self._flush_dlog()
             
             # Handle manual stop case - give transcriber time to process final audio
             if manual_stop:
@@ -500,10 +739,18 @@ class SpeechProcessor:
                 # Give a small buffer for any remaining audio processing
                 await asyncio.sleep(0.2)
             
-            # Get final transcript
+            # Get final transcript once queued frames have reached VOSK
+            await self._wait_for_vosk_frames()
+            for vosk_result in self._drain_vosk_results():
+                if not isinstance(vosk_result, Exception) and vosk_result[2] and vosk_result[2].strip():
+                    last_partial_text = vosk_result[2].strip()
             final_transcript = self.transcriber.get_final_text()
             print(f"[PUSH-TO-TALK] Final transcript: '{final_transcript}' (manual_stop: {manual_stop})")
             
+            # Re-decode the buffered audio before settling for partials
+            if not final_transcript or not final_transcript.strip():
+                final_transcript = await self._retranscribe(audio_window, "PUSH-TO-TALK")
+            
             # If final transcript is empty but we have partial text, use the partial as fallback
             if not final_transcript or not final_transcript.strip():
                 if last_partial_text:
@@ -532,9 +779,11 @@ class SpeechProcessor:
             return None
             
         finally:
+            self._flush_dlog()
+            await frame_ring.stop()
+            await self._wait_for_vosk_frames(discard=True)
+            self._drain_vosk_results()
             await self.audio_manager.stop_listening()
-            if hasattr(self, "last_partial_print_time"):
-                del self.last_partial_print_time
             # Ensure transcriber state is clean for next capture
             try:
                 self.transcriber.reset()
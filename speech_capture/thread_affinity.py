@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Thread Affinity - Pin capture pipeline threads to dedicated CPU cores
+
+Keeps the audio producer and VOSK worker threads from migrating between cores
+(which costs cache warmth and shows up as frame jitter on the Pi). Everything
+here is best effort: unsupported platforms, missing cores and missing
+CAP_SYS_NICE are logged and ignored.
+"""
+
+import os
+
+
+def pin_current_thread(cpus, label: str, nice_increment: int = 0):
+    """
+    Pin the calling thread to a set of CPUs and optionally adjust its nice level.
+
+    Args:
+        cpus: Iterable of CPU indices, or None/empty to leave affinity alone
+        label: Thread name used in log messages
+        nice_increment: Value passed to os.nice() (negative raises priority)
+    """
+    if cpus and hasattr(os, "sched_setaffinity"):
+        try:
+            # pid 0 targets the calling thread on Linux
+            wanted = set(cpus) & os.sched_getaffinity(0)
+            if wanted:
+                os.sched_setaffinity(0, wanted)
+                print(f"[ThreadAffinity] {label} pinned to CPU(s) {sorted(wanted)}")
+            else:
+                print(f"[ThreadAffinity] {label}: CPU(s) {sorted(cpus)} not available, not pinning")
+        except OSError as e:
+            print(f"[ThreadAffinity] {label}: could not set affinity: {e}")
+
+    if nice_increment:
+        try:
+            # Linux nice values are per-thread
+            os.nice(nice_increment)
+        except (OSError, AttributeError) as e:
+            print(f"[ThreadAffinity] {label}: could not change priority: {e}")
@@ -342,6 +342,33 @@ class VoskWebSocketClient:
         
         return final_result
         
+    def decode_full(self, pcm_bytes: bytes, chunk_bytes: int = 16000) -> str:
+        """
+        Re-run recognition over a complete captured utterance
+        
+        Used as a retry when the streamed session produced no final text:
+        resets the server session, streams the whole buffer in large chunks
+        and returns get_final_text() for it.
+        """
+        self.reset()
+        
+        for offset in range(0, len(pcm_bytes), chunk_bytes):
+            future = asyncio.run_coroutine_threadsafe(
+                self.websocket.send(pcm_bytes[offset:offset + chunk_bytes]),
+                self.loop
+            )
+            future.result(timeout=2.0)
+            
+        # Fold interim partials/finals into client state so get_final_text
+        # only has to wait for the server's final_result
+        while True:
+            try:
+                self._process_response(self.response_queue.get_nowait())
+            except queue.Empty:
+                break
+                
+        return self.get_final_text()
+        
     def cleanup(self):
         """Clean up resources"""
         self.disconnect()
@@ -1,12 +1,32 @@
 #!/usr/bin/env python3
 
 import asyncio
-import os
+import aiohttp
 import tempfile
 import time
 from pathlib import Path
 from config.client_config import KEEP_TEMP_AUDIO_FILES
 
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+
+def _write_bytes_sync(path, data: bytes):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+async def _write_bytes(path, data: bytes):
+    """Write an audio buffer to disk without blocking the event loop"""
+    if AIOFILES_AVAILABLE:
+        async with aiofiles.open(path, "wb") as f:
+            await f.write(data)
+    else:
+        await asyncio.to_thread(_write_bytes_sync, path, data)
+
 
 class AudioCoordinator:
     """
@@ -20,6 +40,7 @@ class AudioCoordinator:
         self.audio_manager = audio_manager
         self.is_playing_tts = False
         self.wake_word_suppression_callback = None
+        self._http = None  # Shared keep-alive session for the local TTS server
         
     def set_wake_word_suppression_callback(self, callback):
         """Set callback to enable/disable wake word detection during TTS"""
@@ -27,10 +48,11 @@ class AudioCoordinator:
 
     async def handle_tts_playback(self, audio_bytes: bytes, source_engine: str):
         """
-        Handle TTS audio playback by writing bytes to file and playing through AudioManager.
+        Handle TTS audio playback by streaming the bytes straight to AudioManager.
 
-        This method writes the TTS audio bytes to a temporary file and ensures it
-        plays completely before returning. It handles file cleanup after playback.
+        The audio is piped to the player from memory (no temp file round-trip) and
+        this method returns once it has played completely. With
+        KEEP_TEMP_AUDIO_FILES set, a debug copy is written alongside playback.
 
         Args:
             audio_bytes: The audio data from TTS engine
@@ -40,73 +62,159 @@ class AudioCoordinator:
             print("[AudioCoordinator.handle_tts_playback] No audio bytes to play.")
             return
 
-        temp_dir = Path(tempfile.gettempdir())
         # Use .wav for Piper as it produces WAV or similar PCM output, MP3 for ElevenLabs/Cartesia.
         ext = ".wav" if source_engine.lower() in ["piper"] else ".mp3"
-        fname = temp_dir / f"assistant_response_{int(time.time()*1000)}{ext}"
 
         try:
-            # Write the TTS audio bytes to temporary file
-            with open(fname, "wb") as f:
-                f.write(audio_bytes)
-            print(f"[AudioCoordinator.handle_tts_playback] Audio file written: {fname} ({len(audio_bytes)} bytes)")
-
             # Suppress wake words during TTS playback
             self.is_playing_tts = True
             if self.wake_word_suppression_callback:
                 self.wake_word_suppression_callback(True)
-                
-            # Play the audio file directly using AudioManager.
-            await self.audio_manager.play_audio(str(fname))
 
-            print(f"[AudioCoordinator.handle_tts_playback] Audio playback completed for: {fname}")
-            
-            # Re-enable wake words after TTS completes
+            print(f"[AudioCoordinator.handle_tts_playback] Playing {len(audio_bytes)} bytes of {ext} audio from memory")
+            playback = self.audio_manager.play_audio_bytes(audio_bytes, ext)
+            if KEEP_TEMP_AUDIO_FILES:
+                # Debug copy only - written concurrently with playback, off the event loop
+                fname = Path(tempfile.gettempdir()) / f"assistant_response_{int(time.time()*1000)}{ext}"
+                results = await asyncio.gather(
+                    playback, _write_bytes(fname, audio_bytes), return_exceptions=True
+                )
+                if isinstance(results[1], Exception):
+                    print(f"[WARN] Failed to keep debug copy {fname}: {results[1]}")
+                else:
+                    print(f"[AudioCoordinator.handle_tts_playback] Debug copy kept: {fname}")
+                if isinstance(results[0], Exception):
+                    raise results[0]
+            else:
+                await playback
+
+            print("[AudioCoordinator.handle_tts_playback] Audio playback completed")
+
+        except Exception as e:
+            print(f"[ERROR] AudioCoordinator.handle_tts_playback: Failed to play audio: {e}")
+        finally:
+            # Re-enable wake words after TTS completes (or fails)
             self.is_playing_tts = False
             if self.wake_word_suppression_callback:
                 self.wake_word_suppression_callback(False)
 
+    async def stream_tts_playback(self, chunk_iter):
+        """
+        Play TTS audio while it is still being generated.
+
+        Streamed MP3 chunks are piped to the player as they arrive, so playback
+        overlaps synthesis. Engines that only produce a whole WAV buffer (Piper)
+        go through handle_tts_playback instead.
+
+        Args:
+            chunk_iter: Async iterator of (chunk, engine) tuples, e.g. from
+                TTSHandler.generate_audio_stream
+        """
+        first = await anext(chunk_iter, None)
+        if first is None:
+            print("[AudioCoordinator.stream_tts_playback] No audio to play.")
+            return
+        
+        first_chunk, engine = first
+        if engine.lower() == "piper":
+            await chunk_iter.aclose()
+            await self.handle_tts_playback(first_chunk, engine)
+            return
+        
+        kept = [] if KEEP_TEMP_AUDIO_FILES else None
+        
+        async def mp3_chunks():
+            try:
+                yield first_chunk
+                if kept is not None:
+                    kept.append(first_chunk)
+                async for chunk, _ in chunk_iter:
+                    if kept is not None:
+                        kept.append(chunk)
+                    yield chunk
+            finally:
+                # async for doesn't close its iterator when unwound early
+                await chunk_iter.aclose()
+        
+        stream = mp3_chunks()
+        
+        try:
+            self.is_playing_tts = True
+            if self.wake_word_suppression_callback:
+                self.wake_word_suppression_callback(True)
+            
+            print(f"[AudioCoordinator.stream_tts_playback] Streaming {engine} audio to the player")
+            await self.audio_manager.play_audio_stream(stream, f"<{engine} stream.mp3>")
+            print("[AudioCoordinator.stream_tts_playback] Audio playback completed")
+            
+            if kept:
+                fname = Path(tempfile.gettempdir()) / f"assistant_response_{int(time.time()*1000)}.mp3"
+                try:
+                    await _write_bytes(fname, b"".join(kept))
+                    print(f"[AudioCoordinator.stream_tts_playback] Debug copy kept: {fname}")
+                except Exception as e:
+                    print(f"[WARN] Failed to keep debug copy {fname}: {e}")
+        
         except Exception as e:
-            print(f"[ERROR] AudioCoordinator.handle_tts_playback: Failed to play audio from {fname}: {e}")
+            print(f"[ERROR] AudioCoordinator.stream_tts_playback: Failed to play audio: {e}")
         finally:
-            # Clean up temporary file after playback is confirmed complete
-            if os.path.exists(fname) and not KEEP_TEMP_AUDIO_FILES:
-                try:
-                    os.remove(fname)
-                    print(f"[AudioCoordinator.handle_tts_playback] Temp audio file deleted: {fname}")
-                except Exception as e_del:
-                    print(f"[WARN] Failed to delete temp audio file {fname}: {e_del}")
+            self.is_playing_tts = False
+            if self.wake_word_suppression_callback:
+                self.wake_word_suppression_callback(False)
+            # Close the wrapper first so its own async for unwinds chunk_iter; closing
+            # chunk_iter directly while the wrapper is suspended in it raises
+            # "asynchronous generator is already running". The second close covers a
+            # wrapper that never started (closing that doesn't run its finally).
+            await stream.aclose()
+            await chunk_iter.aclose()
 
     async def play_audio_file(self, audio_file_path: str):
         """Play an audio file directly through the audio manager"""
         await self.audio_manager.play_audio(audio_file_path)
     
-    async def play_phase_sound(self, phase: str, sound_file: str = None):
-        """Play sound for specific workflow phase via TTS server"""
-        import aiohttp
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive HTTP session, creating it if needed"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60)
+            )
+        return self._http
+
+    async def play_phase_sound(self, phase: str, sound_file: str = None, started_event: asyncio.Event = None):
+        """
+        Play sound for specific workflow phase via TTS server
+        
+        Args:
+            phase: Workflow phase name (e.g. "processing", "complete")
+            sound_file: Sound to start for this phase, or None to just stop audio
+            started_event: Optional event set once the sound has started playing
+        """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    'http://localhost:5000/play_phase_sound',
-                    json={'phase': phase, 'sound_file': sound_file}
-                ) as response:
-                    result = await response.json()
-                    print(f"[AudioCoordinator] Phase sound {phase}: {result.get('status')}")
-                    return result
+            async with self._get_http_session().post(
+                'http://localhost:5000/play_phase_sound',
+                json={'phase': phase, 'sound_file': sound_file}
+            ) as response:
+                result = await response.json()
+                # The TTS server replies once playback has been started
+                if started_event:
+                    started_event.set()
+                print(f"[AudioCoordinator] Phase sound {phase}: {result.get('status')}")
+                return result
         except Exception as e:
             print(f"[AudioCoordinator] Failed to play phase sound: {e}")
             # Fallback to local playback
             if sound_file:
+                if started_event:
+                    started_event.set()
                 await self.play_audio_file(sound_file)
 
     async def wait_for_audio_completion_with_buffer(self):
-        """Wait for audio completion with additional buffer time to ensure device release"""
+        """Wait for audio completion, then for our player to release the device (up to 0.5 s)"""
         # First wait for the audio manager's completion event
         await self.audio_manager.wait_for_audio_completion()
         
-        # Add a small fixed buffer to ensure audio device is fully released
-        buffer_time = 0.5  # Half second buffer regardless of audio length
-        await asyncio.sleep(buffer_time)
+        # Playback already waits for device release, so this only blocks if mpg123 is still exiting
+        await self.audio_manager.wait_for_player_exit(timeout=0.5)
 
     async def stop_current_audio(self):
         """Stop any currently playing audio"""
@@ -119,4 +227,6 @@ class AudioCoordinator:
     async def cleanup(self):
         """Clean up audio coordinator resources"""
         # Audio manager cleanup is handled by the audio manager itself
-        pass
\ No newline at end of file
+        if self._http and not self._http.closed:
+            await self._http.close()
+        self._http = None
\ No newline at end of file
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import io
 import os
 import time
 import asyncio
@@ -8,7 +9,7 @@ from mutagen.mp3 import MP3
 from asyncio import Event
 import numpy as np
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, Union
 import traceback
 os.environ['PULSE_SERVER'] = 'unix:/run/user/1000/pulse/native'
 
@@ -71,6 +72,7 @@ class AudioManager:
         self.pa = pyaudio.PyAudio()
         self.audio_stream = None
         self.current_process = None
+        self._last_player = None  # Most recent mpg123 process, kept after current_process is cleared
         
         self.audio_complete = Event()
         self.audio_complete.set()
@@ -82,6 +84,10 @@ class AudioManager:
         self.state = AudioManagerState()
         
         self.sample_rate = sample_rate
+        # 2048 samples = 128 ms at 16 kHz, i.e. ~8 capture-loop iterations (and
+        # VOSK sends) per second. Larger frames mean fewer wakeups and less
+        # per-frame overhead but coarser silence timing, since the VAD counts
+        # silence in whole frames; don't go below ~30 ms.
         self.frame_length = 2048
         
         print(f"\n=== Audio System Initialization ===")
@@ -185,6 +191,107 @@ class AudioManager:
         """
         Play audio file using mpg123 with full state tracking.
         """
+        await self._play_with_mpg123(audio_file)
+
+    async def play_audio_bytes(self, audio_data: bytes, ext: str = ".mp3"):
+        """
+        Play an in-memory audio buffer by piping it to mpg123's stdin.
+
+        Same state tracking as play_audio, without writing a temp file.
+        """
+        await self._play_with_mpg123(f"<memory{ext}>", audio_data)
+
+    async def play_audio_stream(self, chunks: AsyncIterator[bytes], label: str = "<stream.mp3>"):
+        """
+        Play MP3 audio while it is still arriving by piping each chunk to mpg123.
+
+        The total duration isn't known up front, so this waits for mpg123 to exit
+        after the stream ends rather than sleeping for the expected duration.
+        """
+        async with self.playback_lock:
+            async with self.state_lock:
+                self.state.is_speaking = True
+                self.state.is_playing = True
+                self.state.playback_start_time = time.time()
+                self.state.current_audio_file = label
+                self.state.expected_duration = None
+            self.audio_complete.clear()
+            
+            feed_task = None
+            try:
+                print(f"[AudioManager] Executing playback: /usr/bin/mpg123 -q - (streaming {label})")
+                process = await asyncio.create_subprocess_exec(
+                    '/usr/bin/mpg123', '-q', '-',
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                self.current_process = process
+                self._last_player = process
+                feed_task = asyncio.create_task(self._feed_stdin(process, chunks))
+                
+                try:
+                    # stdin closes when the stream ends; mpg123 exits once it has played it all
+                    await asyncio.wait_for(process.wait(), timeout=120.0)
+                except asyncio.TimeoutError:
+                    print("[AudioManager] Streamed playback timeout, terminating mpg123")
+                    process.terminate()
+                    try:
+                        await asyncio.wait_for(process.wait(), timeout=2.0)
+                    except asyncio.TimeoutError:
+                        print("[AudioManager] Force killing mpg123 process")
+                        process.kill()
+                        await process.wait()
+                
+            except FileNotFoundError:
+                print("[FATAL ERROR] `mpg123` is not installed or not in /usr/bin/.")
+            except Exception as e:
+                print(f"Error in play_audio_stream: {e}")
+                traceback.print_exc()
+            finally:
+                if feed_task and not feed_task.done():
+                    feed_task.cancel()
+                    # Let the feeder unwind so the caller's chunk iterator isn't left mid-await
+                    try:
+                        await feed_task
+                    except asyncio.CancelledError:
+                        pass
+                self.current_process = None
+                async with self.state_lock:
+                    self.state.is_speaking = False
+                    self.state.is_playing = False
+                    self.state.playback_start_time = None
+                    self.state.current_audio_file = None
+                    self.state.expected_duration = None
+                self.audio_complete.set()
+
+    async def _feed_stdin(self, process, audio_data: Union[bytes, AsyncIterator[bytes]]):
+        """Stream an audio buffer (or async iterator of chunks) into the player's stdin as it consumes it"""
+        try:
+            if isinstance(audio_data, (bytes, bytearray, memoryview)):
+                process.stdin.write(audio_data)
+                await process.stdin.drain()
+            else:
+                async for chunk in audio_data:
+                    process.stdin.write(chunk)
+                    await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # Player exited early (stopped or failed)
+            pass
+        finally:
+            try:
+                process.stdin.close()
+            except Exception:
+                pass
+
+    async def _play_with_mpg123(self, audio_file: str, audio_data: Optional[bytes] = None):
+        """
+        Shared mpg123 playback with full state tracking.
+
+        Args:
+            audio_file: Path to play, or a label when audio_data is given
+            audio_data: Optional in-memory audio piped to mpg123 instead of a file
+        """
         async with self.playback_lock:
             async with self.state_lock:
                 self.state.is_speaking = True
@@ -193,9 +300,10 @@ class AudioManager:
                 self.state.current_audio_file = audio_file
             self.audio_complete.clear()
             
+            feed_task = None
             try:
                 try:
-                    audio = MP3(audio_file)
+                    audio = MP3(io.BytesIO(audio_data) if audio_data is not None else audio_file)
                     async with self.state_lock:
                         self.state.expected_duration = audio.info.length
                 except Exception as e:
@@ -203,14 +311,27 @@ class AudioManager:
                         self.state.expected_duration = 2.0
                 
                 # USE MPG123 FOR STABLE PLAYBACK WITH AUTOMATIC OUTPUT DETECTION
-                command = f'/usr/bin/mpg123 -q "{audio_file}"'
-                print(f"[AudioManager] Executing playback: {command}")
-                
-                self.current_process = await asyncio.create_subprocess_shell(
-                    command,
-                    stdout=asyncio.subprocess.DEVNULL,
-                    stderr=asyncio.subprocess.DEVNULL
-                )
+                if audio_data is None:
+                    command = f'/usr/bin/mpg123 -q "{audio_file}"'
+                    print(f"[AudioManager] Executing playback: {command}")
+                    
+                    self.current_process = await asyncio.create_subprocess_shell(
+                        command,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.DEVNULL
+                    )
+                else:
+                    print(f"[AudioManager] Executing playback: /usr/bin/mpg123 -q - ({len(audio_data)} bytes from memory)")
+                    
+                    self.current_process = await asyncio.create_subprocess_exec(
+                        '/usr/bin/mpg123', '-q', '-',
+                        stdin=asyncio.subprocess.PIPE,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.DEVNULL
+                    )
+                    # Feed in the background: the pipe only drains as fast as mpg123 plays
+                    feed_task = asyncio.create_task(self._feed_stdin(self.current_process, audio_data))
+                self._last_player = self.current_process
                 
                 # Wait for actual audio duration instead of process completion
                 audio_duration = self.state.expected_duration
@@ -260,6 +381,8 @@ class AudioManager:
                 print(f"Error in play_audio: {e}")
                 traceback.print_exc()
             finally:
+                if feed_task and not feed_task.done():
+                    feed_task.cancel()
                 # Cleanup and state reset
                 self.current_process = None
                 async with self.state_lock:
@@ -289,6 +412,23 @@ class AudioManager:
         """Wait for current audio playback to complete."""
         await self.audio_complete.wait()
 
+    async def wait_for_player_exit(self, timeout: float):
+        """
+        Wait (up to timeout seconds) for the most recent mpg123 process to exit,
+        i.e. for it to release the output device.
+
+        Returns:
+            bool: True if the player has exited, False if it is still running
+        """
+        player = self._last_player
+        if player is None or player.returncode is not None:
+            return True
+        try:
+            await asyncio.wait_for(player.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def reset_audio_state(self):
         """Reset all audio states to initial values."""
         await self.stop_listening()
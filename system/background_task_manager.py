@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+import asyncio
+
+
+class BackgroundTaskManager:
+    """
+    Tracks fire-and-forget asyncio tasks so they can be cancelled together.
+
+    Tasks are held by strong reference until they finish (the event loop itself
+    only keeps weak references, so untracked tasks can be garbage collected
+    mid-flight) and drop out of the set automatically on completion.
+    """
+
+    def __init__(self):
+        self._tasks = set()
+
+    def create(self, coro, name=None):
+        """Schedule a coroutine as a tracked background task"""
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def __len__(self):
+        return len(self._tasks)
+
+    async def shutdown(self):
+        """Cancel all outstanding tasks and wait for them in parallel"""
+        tasks = list(self._tasks)
+        if not tasks:
+            return
+        print(f"[BackgroundTaskManager] Cancelling {len(tasks)} background task(s)")
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
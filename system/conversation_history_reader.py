@@ -1,15 +1,98 @@
 #!/usr/bin/env python3
 
+import heapq
 import json
+import mmap
 import os
 import re
 from datetime import datetime, date
 from pathlib import Path
 from typing import List, Dict, Optional, Callable
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 import threading
-import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Chat logs larger than this are parsed straight from an mmap instead of a read() copy
+_MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# Mood indicators in brackets like [thoughtful], [confused]
+_MOOD_SUB_RE = re.compile(r'\[[\w\s]+\]')
+_MOOD_SEARCH_RE = re.compile(r'\[(\w+)\]')
+
+# chat_log_YYYY-MM-DD... names sort chronologically without a stat() per file
+_DATED_LOG_NAME_RE = re.compile(r'^chat_log_\d{4}-\d{2}-\d{2}')
+
+# inotify doesn't see writes made by other hosts on these filesystems
+_NETWORK_FS_MARKERS = ('nfs', 'cifs', 'smb', 'fuse')
+
+
+def _is_network_mount(path: Path) -> bool:
+    """Check /proc/mounts for the filesystem holding path (longest mount prefix wins)"""
+    try:
+        target = str(path.resolve())
+        best_mount, best_fstype = '', ''
+        with open('/proc/mounts', 'r') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                # Spaces in mount points are escaped as \040
+                mount_point = fields[1].replace('\\040', ' ')
+                if (target == mount_point or target.startswith(mount_point.rstrip('/') + '/')) \
+                        and len(mount_point) > len(best_mount):
+                    best_mount, best_fstype = mount_point, fields[2]
+        return any(marker in best_fstype for marker in _NETWORK_FS_MARKERS)
+    except OSError:
+        return False
+
+
+def _build_message_template(role_label: str, bg_color: str, text_color: str, align: str, margin: str) -> str:
+    """Pre-render a chat bubble with the role's styling, leaving per-message placeholders"""
+    return f'''
+            <div style="display: flex; justify-content: {align}; margin-bottom: 15px;">
+                <div style="
+                    background-color: {bg_color}; 
+                    border-radius: 10px; 
+                    padding: 12px; 
+                    {margin}
+                    border-left: 4px solid {text_color};
+                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+                ">
+                    <div style="font-weight: bold; color: {text_color}; margin-bottom: 5px;">
+                        {role_label}
+                    </div>
+                    {{mood_block}}
+                    <div style="color: #333; line-height: 1.4;">
+                        {{content}}
+                    </div>
+                    <div style="font-size: 11px; color: #666; margin-top: 8px; text-align: right;">
+                        {{time}}
+                    </div>
+                </div>
+            </div>
+            '''
+
+
+# Chat HTML pieces, styled once at import: user (light blue, right), LAURA (light green, left)
+_CHAT_HTML_HEADER = '<div style="max-height: 600px; overflow-y: auto; padding: 10px;">'
+_CHAT_HTML_FOOTER = '</div>'
+_MSG_TMPL_USER = _build_message_template("You", "#e3f2fd", "#1976d2", "flex-end", "margin-left: 20%;")
+_MSG_TMPL_ASSISTANT = _build_message_template("LAURA", "#f1f8e9", "#388e3c", "flex-start", "margin-right: 20%;")
+_MOOD_BLOCK_TMPL = '<small style="color: #666; font-style: italic;">[{}]</small><br>'
+
+
+def _message_sort_key(message: 'ConversationMessage') -> datetime:
+    return message.datetime
 
 
 class ConversationMessage:
@@ -18,14 +101,27 @@ class ConversationMessage:
     def __init__(self, role: str, content: str, timestamp: str, mood: Optional[str] = None):
         self.role = role  # 'user' or 'assistant'
         self.content = content
+        self.content_lower = content.lower()  # Lower-cased once for search_messages
         self.timestamp = timestamp
         self.mood = mood
         self.datetime = self._parse_timestamp(timestamp)
+        # Duplicate-detection key; built once and shares the strings above rather than copying them
+        self.dedup_key = (timestamp, content)
     
     def _parse_timestamp(self, timestamp_str: str) -> datetime:
         """Parse timestamp string to datetime object"""
         try:
-            # Handle various timestamp formats
+            # Fast path: ISO 8601 (C parser); a trailing Z is treated as local like the formats below
+            try:
+                parsed = datetime.fromisoformat(timestamp_str.rstrip('Z'))
+                if parsed.tzinfo is not None:
+                    # Keep everything naive local time so messages stay comparable
+                    parsed = parsed.astimezone().replace(tzinfo=None)
+                return parsed
+            except ValueError:
+                pass
+            
+            # Legacy formats fromisoformat can't handle on older Pythons
             for fmt in [
                 "%Y-%m-%dT%H:%M:%S.%fZ",
                 "%Y-%m-%dT%H:%M:%SZ", 
@@ -46,9 +142,10 @@ class ConversationMessage:
             print(f"[ConversationHistoryReader] Error parsing timestamp {timestamp_str}: {e}")
             return datetime.now()
     
-    def get_relative_time(self) -> str:
-        """Get human-readable relative time string"""
-        now = datetime.now()
+    def get_relative_time(self, now: Optional[datetime] = None) -> str:
+        """Get human-readable relative time string (pass now when formatting many messages)"""
+        if now is None:
+            now = datetime.now()
         diff = now - self.datetime
         
         if diff.total_seconds() < 60:
@@ -66,7 +163,7 @@ class ConversationMessage:
     def get_display_content(self) -> str:
         """Get content formatted for display (handle mood indicators)"""
         # Remove mood indicators in brackets like [thoughtful], [confused]
-        content = re.sub(r'\[[\w\s]+\]', '', self.content).strip()
+        content = _MOOD_SUB_RE.sub('', self.content).strip()
         
         # Limit length for display
         if len(content) > 150:
@@ -78,23 +175,57 @@ class ConversationMessage:
         """Extract mood from content if present"""
         if not self.mood:
             # Look for mood indicators in brackets
-            mood_match = re.search(r'\[(\w+)\]', self.content)
+            mood_match = _MOOD_SEARCH_RE.search(self.content)
             if mood_match:
                 return mood_match.group(1)
         return self.mood
 
 
 class ChatLogFileHandler(FileSystemEventHandler):
-    """File system event handler for monitoring chat log changes"""
+    """
+    File system event handler for monitoring chat log changes.
+    
+    Bursts of modify events for the same file are coalesced into a single
+    callback fired once the file has been quiet for debounce_seconds.
+    """
     
-    def __init__(self, callback: Callable):
+    def __init__(self, callback: Callable, debounce_seconds: float = 0.2):
         self.callback = callback
+        self.debounce_seconds = debounce_seconds
+        self._pending: Dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
+        # Timers run on their own threads; keep reloads serialized like the observer thread did
+        self._callback_lock = threading.Lock()
         
     def on_modified(self, event):
-        if not event.is_directory and event.src_path.endswith('.json'):
-            # Debounce rapid file changes
-            time.sleep(0.1)
-            self.callback(event.src_path)
+        if event.is_directory:
+            return
+        name = os.path.basename(event.src_path)
+        if not (name.startswith('chat_log_') and name.endswith('.json')):
+            return
+            
+        with self._lock:
+            # Restart the quiet-period timer for this path
+            timer = self._pending.get(event.src_path)
+            if timer:
+                timer.cancel()
+            timer = threading.Timer(self.debounce_seconds, self._fire, args=[event.src_path])
+            timer.daemon = True
+            self._pending[event.src_path] = timer
+            timer.start()
+            
+    def _fire(self, path: str):
+        with self._lock:
+            self._pending.pop(path, None)
+        with self._callback_lock:
+            self.callback(path)
+        
+    def cancel_pending(self):
+        """Drop any reloads that haven't fired yet"""
+        with self._lock:
+            for timer in self._pending.values():
+                timer.cancel()
+            self._pending.clear()
 
 
 class ConversationHistoryReader:
@@ -103,12 +234,19 @@ class ConversationHistoryReader:
     Provides real-time monitoring and formatting for Gradio display.
     """
     
-    def __init__(self, chat_logs_dir: str = "/home/user/rp_client/chat_logs"):
+    def __init__(self, chat_logs_dir: str = "/home/user/rp_client/chat_logs", poll_interval: float = 30.0):
         self.chat_logs_dir = Path(chat_logs_dir)
-        self.messages: List[ConversationMessage] = []
-        self.observer: Optional[Observer] = None
+        self.poll_interval = poll_interval  # Seconds between scans when polling a network mount
+        self.messages: deque[ConversationMessage] = deque()  # Newest first
+        self.observer = None
+        self._event_handler: Optional[ChatLogFileHandler] = None
         self.update_callback: Optional[Callable] = None
         self.max_messages = 100  # Limit displayed messages for performance
+        self._seen = set()  # dedup_keys of self.messages, kept in step with it
+        # Today's message counts, kept in step with self.messages and reset at midnight
+        self._today_date = date.today()
+        self._today_user_count = 0
+        self._today_assistant_count = 0
         
         print(f"[ConversationHistoryReader] Initializing with directory: {self.chat_logs_dir}")
         
@@ -126,35 +264,39 @@ class ConversationHistoryReader:
         """Load all conversation messages from existing log files"""
         print("[ConversationHistoryReader] Loading conversation history...")
         
-        self.messages.clear()
+        self.messages = deque()
         
-        # Get all JSON files sorted by date (newest first)
-        log_files = sorted(
-            self.chat_logs_dir.glob("chat_log_*.json"),
-            key=lambda f: f.stat().st_mtime,
-            reverse=True
-        )
+        # Get all JSON files sorted by date (newest first). ISO-dated names sort by
+        # name alone; anything else falls back to one stat() per file for mtime.
+        log_files = list(self.chat_logs_dir.glob("chat_log_*.json"))
+        if all(_DATED_LOG_NAME_RE.match(f.name) for f in log_files):
+            sort_key = lambda f: f.name
+        else:
+            sort_key = lambda f: f.stat().st_mtime
         
         # Load messages from recent files (limit to prevent performance issues)
+        recent_files = sorted(log_files, key=sort_key, reverse=True)[:7]  # Load last 7 days max
         files_loaded = 0
-        for log_file in log_files:
-            if files_loaded >= 7:  # Load last 7 days max
-                break
-                
+        
+        # Read the files concurrently so cold-cache reads overlap; each load is self-contained
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(self._load_messages_from_file, f) for f in recent_files]
+            
+        runs = []
+        for log_file, future in zip(recent_files, futures):
             try:
-                messages_from_file = self._load_messages_from_file(log_file)
-                self.messages.extend(messages_from_file)
+                runs.append(future.result())
                 files_loaded += 1
                 
             except Exception as e:
                 print(f"[ConversationHistoryReader] Error loading {log_file}: {e}")
         
-        # Sort all messages by timestamp (newest first)
-        self.messages.sort(key=lambda m: m.datetime, reverse=True)
+        # Each file's run is already newest first; merge them and keep max messages
+        merged = heapq.merge(*runs, key=_message_sort_key, reverse=True)
+        self.messages = deque(islice(merged, self.max_messages))
         
-        # Limit to max messages
-        if len(self.messages) > self.max_messages:
-            self.messages = self.messages[:self.max_messages]
+        self._seen = {m.dedup_key for m in self.messages}
+        self._recount_today()
         
         print(f"[ConversationHistoryReader] Loaded {len(self.messages)} messages from {files_loaded} files")
     
@@ -163,8 +305,7 @@ class ConversationHistoryReader:
         messages = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json(file_path)
             
             # Handle both list format and object format
             if isinstance(data, list):
@@ -183,8 +324,24 @@ class ConversationHistoryReader:
         except Exception as e:
             print(f"[ConversationHistoryReader] Error reading {file_path}: {e}")
         
+        # Sorted newest first once here so callers can merge runs instead of re-sorting
+        messages.sort(key=_message_sort_key, reverse=True)
         return messages
     
+    @staticmethod
+    def _read_json(file_path: Path):
+        """Parse a chat log file, using orjson (and mmap for large files) when available"""
+        if not ORJSON_AVAILABLE:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD_BYTES:
+                # orjson takes a memoryview, not the mmap itself; release it before unmapping
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+            return orjson.loads(f.read())
+    
     def start_monitoring(self):
         """Start monitoring chat log directory for changes"""
         if self.observer is not None:
@@ -194,9 +351,13 @@ class ConversationHistoryReader:
         print("[ConversationHistoryReader] Starting file monitoring...")
         
         try:
-            self.observer = Observer()
-            event_handler = ChatLogFileHandler(self._on_file_changed)
-            self.observer.schedule(event_handler, str(self.chat_logs_dir), recursive=False)
+            if _is_network_mount(self.chat_logs_dir):
+                print(f"[ConversationHistoryReader] Network mount detected, polling every {self.poll_interval}s")
+                self.observer = PollingObserver(timeout=self.poll_interval)
+            else:
+                self.observer = Observer()
+            self._event_handler = ChatLogFileHandler(self._on_file_changed)
+            self.observer.schedule(self._event_handler, str(self.chat_logs_dir), recursive=False)
             self.observer.start()
             print("[ConversationHistoryReader] File monitoring started")
             
@@ -210,6 +371,9 @@ class ConversationHistoryReader:
             self.observer.stop()
             self.observer.join()
             self.observer = None
+            if self._event_handler:
+                self._event_handler.cancel_pending()
+                self._event_handler = None
             print("[ConversationHistoryReader] File monitoring stopped")
     
     def _on_file_changed(self, file_path: str):
@@ -217,34 +381,50 @@ class ConversationHistoryReader:
         try:
             print(f"[ConversationHistoryReader] File changed: {file_path}")
             
-            # Reload messages from changed file
+            # Reload messages from changed file (ChatLogFileHandler only passes chat logs)
             changed_file = Path(file_path)
-            if changed_file.suffix == '.json' and 'chat_log_' in changed_file.name:
-                
-                # Load new messages from the changed file
-                new_messages = self._load_messages_from_file(changed_file)
+            
+            # Load new messages from the changed file
+            new_messages = self._load_messages_from_file(changed_file)
+            
+            if new_messages:
+                # Add new messages to the beginning of the list
+                # Remove duplicates by timestamp and content
+                unique_new_messages = [
+                    m for m in new_messages 
+                    if m.dedup_key not in self._seen
+                ]
                 
-                if new_messages:
-                    # Add new messages to the beginning of the list
-                    # Remove duplicates by timestamp and content
-                    existing_timestamps = {(m.timestamp, m.content) for m in self.messages}
-                    unique_new_messages = [
-                        m for m in new_messages 
-                        if (m.timestamp, m.content) not in existing_timestamps
-                    ]
+                if unique_new_messages:
+                    # This runs on the watcher's timer thread while display and search
+                    # iterate self.messages, so build a new deque and swap it in once
+                    # rather than mutating the shared one
+                    current = self.messages
+                    if not current or unique_new_messages[-1].datetime >= current[0].datetime:
+                        # Usual case - everything new is newer than what we have, so prepend
+                        messages = deque(unique_new_messages)
+                        messages.extend(current)
+                    else:
+                        # Both runs are newest first, so a linear merge keeps the order
+                        messages = deque(heapq.merge(
+                            unique_new_messages, current, key=_message_sort_key, reverse=True
+                        ))
+                    self._seen.update(m.dedup_key for m in unique_new_messages)
+                    self._adjust_today_counts(unique_new_messages, 1)
+                    
+                    # Limit total messages, dropping the oldest
+                    if len(messages) > self.max_messages:
+                        evicted = [messages.pop() for _ in range(len(messages) - self.max_messages)]
+                        self._seen.difference_update(m.dedup_key for m in evicted)
+                        self._adjust_today_counts(evicted, -1)
+                    
+                    self.messages = messages
+                    
+                    print(f"[ConversationHistoryReader] Added {len(unique_new_messages)} new messages")
                     
-                    if unique_new_messages:
-                        self.messages = unique_new_messages + self.messages
-                        
-                        # Limit total messages
-                        if len(self.messages) > self.max_messages:
-                            self.messages = self.messages[:self.max_messages]
-                        
-                        print(f"[ConversationHistoryReader] Added {len(unique_new_messages)} new messages")
-                        
-                        # Notify Gradio of update
-                        if self.update_callback:
-                            self.update_callback()
+                    # Notify Gradio of update
+                    if self.update_callback:
+                        self.update_callback()
             
         except Exception as e:
             print(f"[ConversationHistoryReader] Error handling file change: {e}")
@@ -252,13 +432,14 @@ class ConversationHistoryReader:
     def get_messages_for_display(self, limit: int = 50) -> List[Dict]:
         """Get formatted messages for Gradio display"""
         display_messages = []
+        now = datetime.now()
         
-        for message in self.messages[:limit]:
+        for message in islice(self.messages, limit):
             # Format message for display
             display_msg = {
                 'role': message.role,
                 'content': message.get_display_content(),
-                'time': message.get_relative_time(),
+                'time': message.get_relative_time(now),
                 'timestamp': message.timestamp,
                 'mood': message.extract_mood() or 'casual',
                 'datetime': message.datetime.isoformat()
@@ -269,75 +450,51 @@ class ConversationHistoryReader:
     
     def get_formatted_chat_html(self, limit: int = 50) -> str:
         """Get conversation history formatted as HTML for Gradio display"""
-        html_parts = ['<div style="max-height: 600px; overflow-y: auto; padding: 10px;">']
-        
         messages = self.get_messages_for_display(limit)
         
-        for msg in reversed(messages):  # Show oldest first in display
-            role_class = "user-message" if msg['role'] == 'user' else "assistant-message"
-            role_label = "You" if msg['role'] == 'user' else "LAURA"
-            
-            # Choose colors based on role
-            if msg['role'] == 'user':
-                bg_color = "#e3f2fd"  # Light blue
-                text_color = "#1976d2"  # Blue
-                align = "flex-end"
-                margin = "margin-left: 20%;"
-            else:
-                bg_color = "#f1f8e9"  # Light green
-                text_color = "#388e3c"  # Green
-                align = "flex-start" 
-                margin = "margin-right: 20%;"
-            
-            mood_indicator = ""
-            if msg['role'] == 'assistant' and msg['mood'] != 'casual':
-                mood_indicator = f'<small style="color: #666; font-style: italic;">[{msg["mood"]}]</small><br>'
-            
-            html_parts.append(f'''
-            <div style="display: flex; justify-content: {align}; margin-bottom: 15px;">
-                <div style="
-                    background-color: {bg_color}; 
-                    border-radius: 10px; 
-                    padding: 12px; 
-                    {margin}
-                    border-left: 4px solid {text_color};
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                ">
-                    <div style="font-weight: bold; color: {text_color}; margin-bottom: 5px;">
-                        {role_label}
-                    </div>
-                    {mood_indicator}
-                    <div style="color: #333; line-height: 1.4;">
-                        {msg['content']}
-                    </div>
-                    <div style="font-size: 11px; color: #666; margin-top: 8px; text-align: right;">
-                        {msg['time']}
-                    </div>
-                </div>
-            </div>
-            ''')
-        
-        html_parts.append('</div>')
+        parts = [_CHAT_HTML_HEADER]
+        parts.extend(self._render_message(msg) for msg in reversed(messages))  # Show oldest first in display
+        parts.append(_CHAT_HTML_FOOTER)
         
-        return ''.join(html_parts)
+        return ''.join(parts)
     
-    def get_today_message_count(self) -> Dict[str, int]:
-        """Get message counts for today"""
-        today = date.today()
-        user_count = 0
-        assistant_count = 0
+    @staticmethod
+    def _render_message(msg: Dict) -> str:
+        """Render one display message into its role's pre-styled chat bubble"""
+        if msg['role'] == 'user':
+            return _MSG_TMPL_USER.format(mood_block='', content=msg['content'], time=msg['time'])
         
-        for message in self.messages:
+        show_mood = msg['role'] == 'assistant' and msg['mood'] != 'casual'
+        mood_block = _MOOD_BLOCK_TMPL.format(msg['mood']) if show_mood else ''
+        return _MSG_TMPL_ASSISTANT.format(mood_block=mood_block, content=msg['content'], time=msg['time'])
+    
+    def _recount_today(self):
+        """Rebuild today's message counts from scratch"""
+        self._today_date = date.today()
+        self._today_user_count = 0
+        self._today_assistant_count = 0
+        self._adjust_today_counts(self.messages, 1)
+    
+    def _adjust_today_counts(self, messages: List[ConversationMessage], delta: int):
+        """Add (delta=1) or remove (delta=-1) messages from today's counts"""
+        today = self._today_date
+        for message in messages:
             if message.datetime.date() == today:
                 if message.role == 'user':
-                    user_count += 1
+                    self._today_user_count += delta
                 else:
-                    assistant_count += 1
+                    self._today_assistant_count += delta
+    
+    def get_today_message_count(self) -> Dict[str, int]:
+        """Get message counts for today"""
+        if date.today() != self._today_date:
+            # Past midnight - yesterday's counts no longer apply
+            self._recount_today()
         
         return {
-            'user_messages': user_count,
-            'assistant_messages': assistant_count,
-            'total_messages': user_count + assistant_count
+            'user_messages': self._today_user_count,
+            'assistant_messages': self._today_assistant_count,
+            'total_messages': self._today_user_count + self._today_assistant_count
         }
     
     def search_messages(self, query: str, limit: int = 20) -> List[Dict]:
@@ -347,13 +504,14 @@ class ConversationHistoryReader:
         
         query_lower = query.lower()
         matching_messages = []
+        now = datetime.now()
         
         for message in self.messages:
-            if query_lower in message.content.lower():
+            if query_lower in message.content_lower:
                 display_msg = {
                     'role': message.role,
                     'content': message.get_display_content(),
-                    'time': message.get_relative_time(),
+                    'time': message.get_relative_time(now),
                     'timestamp': message.timestamp,
                     'mood': message.extract_mood() or 'casual'
                 }
@@ -5,6 +5,14 @@ import re
 from pathlib import Path
 from typing import Optional
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+_MOOD_PREFIX_RE = re.compile(r'^\[(.*?)\]([\s\S]*)', re.IGNORECASE | re.DOTALL)
+
 
 class ConversationManager:
     """
@@ -29,20 +37,30 @@ class ConversationManager:
             "what do you think", "how does that sound", "what's next",
             ".",
         ]
+        # One scan of the lower-cased text covers ?, !, [continue] and every phrase
+        self._hook_re = re.compile(
+            r'[?!]|\[continue\]|' + '|'.join(re.escape(p.lower()) for p in self.continuation_phrases)
+        )
+        # With pyahocorasick, match every phrase in one linear pass however many there are
+        self._hook_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._hook_automaton = ahocorasick.Automaton()
+            for phrase in ["?", "!", "[continue]", *self.continuation_phrases]:
+                self._hook_automaton.add_word(phrase.lower(), phrase)
+            self._hook_automaton.make_automaton()
+        # Sound directory listings keyed by path, reused until the directory's mtime changes
+        self._audio_listing_cache: dict[Path, tuple[int, list[str]]] = {}
 
     def has_conversation_hook(self, response_text):
         """Check if response has conversation hook"""
         if not response_text or not isinstance(response_text, str): 
             return False
             
-        if "?" in response_text or "!" in response_text or "[continue]" in response_text.lower(): 
-            return True
-            
-        for phrase in self.continuation_phrases:
-            if phrase in response_text.lower(): 
-                return True
-        
-        return False
+        # Lower-case once; both matchers then compare literally
+        low = response_text.lower()
+        if self._hook_automaton is not None:
+            return next(self._hook_automaton.iter(low), None) is not None
+        return bool(self._hook_re.search(low))
 
     def reset_conversation_state(self):
         """Reset any lingering conversation state to prevent interference"""
@@ -59,7 +77,7 @@ class ConversationManager:
             return ""
             
         cleaned_text = text_from_server
-        mood_match = re.match(r'^\[(.*?)\]([\s\S]*)', cleaned_text, re.IGNORECASE | re.DOTALL)
+        mood_match = _MOOD_PREFIX_RE.match(cleaned_text)
         
         if mood_match:
             cleaned_text = mood_match.group(2).strip()
@@ -67,6 +85,21 @@ class ConversationManager:
         formatted_message = cleaned_text.replace('\n', ' ').strip()
         return formatted_message
 
+    def _list_audio_files(self, audio_path: Path) -> list[str]:
+        """List the mp3/wav files in audio_path, re-reading it only when its mtime changes"""
+        try:
+            mtime_ns = audio_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        cached = self._audio_listing_cache.get(audio_path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        audio_files = [str(p) for p in audio_path.glob('*.mp3')] + [str(p) for p in audio_path.glob('*.wav')]
+        self._audio_listing_cache[audio_path] = (mtime_ns, audio_files)
+        return audio_files
+
     def _get_random_audio(self, category: str, subtype: str = None):
         """Get random audio file for given category"""
         import random
@@ -86,12 +119,9 @@ class ConversationManager:
                 if subtype and (Path(f"{audio_path}/{subtype}")).exists():
                     audio_path = Path(f"{audio_path}/{subtype}")
             
-            audio_files = []
-            if audio_path.exists():
-                audio_files = list(audio_path.glob('*.mp3')) + list(audio_path.glob('*.wav'))
-            
+            audio_files = self._list_audio_files(audio_path)
             if audio_files:
-                return str(random.choice(audio_files))
+                return random.choice(audio_files)
             return None
         except Exception as e:
             print(f"Error in _get_random_audio: {str(e)}")
@@ -128,9 +158,9 @@ class ConversationManager:
                     
                     # Handle TTS
                     if self.client_settings.get("tts_mode") != "text" and cleaned_tts_text:
-                        audio_bytes, engine = await self.tts_handler.generate_audio(cleaned_tts_text, persona_name="laura")
-                        if audio_bytes:
-                            await self.audio_coordinator.handle_tts_playback(audio_bytes, engine)
+                        await self.audio_coordinator.stream_tts_playback(
+                            self.tts_handler.generate_audio_stream(cleaned_tts_text, persona_name="laura")
+                        )
                     else:
                         print(f"Assistant: {response_text}")
                         await asyncio.sleep(0.1 * len(cleaned_tts_text.split()) if cleaned_tts_text else 1)
@@ -177,9 +207,9 @@ class ConversationManager:
             
             # Handle TTS
             if self.client_settings.get("tts_mode") != "text" and cleaned_tts_text:
-                audio_bytes, engine = await self.tts_handler.generate_audio(cleaned_tts_text, persona_name="laura")
-                if audio_bytes:
-                    await self.audio_coordinator.handle_tts_playback(audio_bytes, engine)
+                await self.audio_coordinator.stream_tts_playback(
+                    self.tts_handler.generate_audio_stream(cleaned_tts_text, persona_name="laura")
+                )
             else:
                 await asyncio.sleep(0.1 * len(cleaned_tts_text.split()) if cleaned_tts_text else 1)
             
@@ -4,33 +4,122 @@ Document Cache Manager for MCP Client
 Implements proper caching strategy based on Anthropic's prompt caching guidelines
 """
 
+import atexit
 import json
 import hashlib
+import mmap
 import os
+import sys
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
-import base64
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Cache keys only need identity, not cryptographic strength - prefer the fast hashes
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _intern_keys(obj: Dict) -> Dict:
+    return {sys.intern(k): v for k, v in obj.items()}
+
+
+def _json_loads(data, intern_keys: bool = False):
+    """
+    Parse JSON bytes. Within one document both backends already share repeated
+    key strings (json's scanner memo, orjson's key cache); intern_keys extends
+    that across separate loads, e.g. one per journal line.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if intern_keys:
+        return json.loads(data, object_hook=_intern_keys)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Compact JSON as bytes (the index is machine-read; no pretty-printing)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Text formats worth sending as cached prompt context
+_CACHEABLE_EXTENSIONS = frozenset({'.txt', '.md', '.json', '.csv', '.log', '.xml', '.html'})
+
+
+@contextmanager
+def _mmap_file(file_path: str):
+    """Map a file read-only for sequential scanning (yields b'' for empty files, which mmap can't map)"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
 
 class DocumentCacheManager:
     def __init__(self, cache_dir: str = "/home/user/rp_client/cache"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_index_file = self.cache_dir / "cache_index.json"
+        # Document contents live here as <hash>.bin; the index only holds metadata
+        self.blob_dir = self.cache_dir / "blobs"
+        self.blob_dir.mkdir(exist_ok=True)
+        # Document puts/deletes are appended here between full index rewrites
+        self.cache_journal_file = self.cache_dir / "cache_index.log"
         self.cache_index = self._load_cache_index()
+        self._replay_journal()
+        if "bytes_on_disk" not in self.cache_index["cache_stats"]:
+            # Index from before the running total existed - measure the blobs once
+            self.cache_index["cache_stats"]["bytes_on_disk"] = self._scan_dir_size(self.blob_dir)
+        
+        # Counter bumps only mark the index dirty; it is rewritten at most every flush interval
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._flush_interval_seconds = 5.0
+        atexit.register(self.flush)
         
         # Anthropic prompt caching settings
         self.cache_lifetime_minutes = 5  # Default 5-minute cache
         self.extended_cache_lifetime_minutes = 60  # Extended 1-hour cache
         self.min_cacheable_tokens = 1024  # Minimum tokens for caching
         
+        # path -> (st_mtime_ns, st_size, digest); a digest is reused until the file changes
+        self._hash_cache: Dict[str, Tuple[int, int, str]] = {}
+        # doc hash -> BPE token count, so each content version is tokenized once
+        self._token_cache: Dict[str, int] = {}
+        self._enc = None  # tiktoken encoding, loaded on first use
+        
     def _load_cache_index(self) -> Dict:
         """Load cache index from disk"""
         if self.cache_index_file.exists():
             try:
-                with open(self.cache_index_file, 'r') as f:
-                    return json.load(f)
+                return _json_loads(self.cache_index_file.read_bytes())
             except Exception as e:
                 print(f"[CACHE] Error loading cache index: {e}")
         return {
@@ -44,45 +133,139 @@ class DocumentCacheManager:
         }
     
     def _save_cache_index(self):
-        """Save cache index to disk"""
+        """Save cache index to disk and compact the journal into it"""
         try:
-            with open(self.cache_index_file, 'w') as f:
-                json.dump(self.cache_index, f, indent=2)
+            tmp_file = self.cache_index_file.with_suffix(".tmp")
+            tmp_file.write_bytes(_json_dumps(self.cache_index))
+            os.replace(tmp_file, self.cache_index_file)
+            # Everything journaled so far is now in the index
+            open(self.cache_journal_file, 'w').close()
+            self._dirty = False
+            self._last_flush = time.monotonic()
         except Exception as e:
             print(f"[CACHE] Error saving cache index: {e}")
     
-    def _generate_document_hash(self, file_path: str) -> str:
-        """Generate hash for document content"""
-        hasher = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            while chunk := f.read(8192):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+    def _replay_journal(self):
+        """Apply document changes journaled since the index was last written"""
+        if not self.cache_journal_file.exists():
+            return
+        try:
+            with open(self.cache_journal_file, 'rb') as f:
+                for line in f:
+                    try:
+                        record = _json_loads(line, intern_keys=True)
+                    except ValueError:
+                        # Torn final write from a crash
+                        continue
+                    if record.get("op") == "put":
+                        self.cache_index["documents"][record["hash"]] = record["entry"]
+                    elif record.get("op") == "del":
+                        self.cache_index["documents"].pop(record["hash"], None)
+        except Exception as e:
+            print(f"[CACHE] Error replaying cache journal: {e}")
+    
+    def _journal(self, record: Dict):
+        """Append one document change to the journal (O(1) instead of rewriting the index)"""
+        try:
+            with open(self.cache_journal_file, 'ab') as f:
+                f.write(_json_dumps(record) + b"\n")
+        except Exception as e:
+            print(f"[CACHE] Error writing cache journal: {e}")
+        self._dirty = True
+    
+    def _maybe_flush(self):
+        """Rewrite the index if it is dirty and the flush interval has passed"""
+        if self._dirty and time.monotonic() - self._last_flush > self._flush_interval_seconds:
+            self._save_cache_index()
+    
+    def flush(self):
+        """Write any pending index changes now"""
+        if self._dirty:
+            self._save_cache_index()
+    
+    def _generate_document_hash(self, file_path: str, st: Optional[os.stat_result] = None) -> str:
+        """Generate hash for document content, reusing the last digest while the file is unchanged"""
+        if st is None:
+            st = os.stat(file_path)
+        cached = self._hash_cache.get(file_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        
+        digest = self._hash_file(file_path)
+        self._hash_cache[file_path] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
+    
+    @staticmethod
+    def _hash_file(file_path: str) -> str:
+        """Hash a file's content (BLAKE3, else xxHash3, else SHA-256)"""
+        if BLAKE3_AVAILABLE:
+            # AUTO lets large files be hashed across cores; small ones stay single-threaded
+            hasher = blake3(max_threads=blake3.AUTO)
+            hasher.update_mmap(file_path)
+            return hasher.hexdigest()
+        
+        with _mmap_file(file_path) as mm:
+            if XXHASH_AVAILABLE:
+                return xxhash.xxh3_128_hexdigest(mm)
+            return hashlib.sha256(mm).hexdigest()
     
-    def _estimate_tokens(self, content: bytes) -> int:
-        """Estimate token count for content (rough approximation)"""
-        # Rough estimate: 1 token ≈ 4 characters
-        return len(content) // 4
+    def _prefetch_hashes(self, file_paths: List[str], stats: List[os.stat_result]):
+        """Hash every changed document concurrently (the hashers release the GIL)"""
+        stale = []
+        for file_path, st in zip(file_paths, stats):
+            cached = self._hash_cache.get(file_path)
+            if not (cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size):
+                stale.append((file_path, st))
+        if len(stale) < 2:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(len(stale), os.cpu_count() or 1)) as executor:
+            digests = list(executor.map(self._hash_file, [file_path for file_path, _ in stale]))
+        
+        # Only the calling thread touches the memo
+        for (file_path, st), digest in zip(stale, digests):
+            self._hash_cache[file_path] = (st.st_mtime_ns, st.st_size, digest)
+    
+    def _estimate_tokens(self, content, doc_hash: Optional[str] = None) -> int:
+        """Count tokens with tiktoken's cl100k_base BPE, else estimate 1 token per 4 bytes"""
+        if not TIKTOKEN_AVAILABLE:
+            return len(content) // 4
+        
+        if doc_hash is not None and doc_hash in self._token_cache:
+            return self._token_cache[doc_hash]
+        
+        if self._enc is None:
+            self._enc = tiktoken.get_encoding("cl100k_base")
+        count = len(self._enc.encode_ordinary(str(content, 'utf-8', 'ignore')))
+        if doc_hash is not None:
+            self._token_cache[doc_hash] = count
+        return count
     
-    def should_cache_document(self, file_path: str) -> Tuple[bool, str]:
+    def should_cache_document(self, file_path: str, st: Optional[os.stat_result] = None) -> Tuple[bool, str]:
         """Determine if document should be cached based on Anthropic's guidelines"""
         try:
-            file_size = os.path.getsize(file_path)
-            
-            # Check file size (don't cache very small files)
-            if file_size < 4096:  # ~1024 tokens minimum
-                return False, "File too small for efficient caching"
-            
-            # Check file type
+            # Check file type first - it needs no syscall at all
             file_ext = Path(file_path).suffix.lower()
-            cacheable_extensions = ['.txt', '.md', '.json', '.csv', '.log', '.xml', '.html']
-            if file_ext not in cacheable_extensions:
+            if file_ext not in _CACHEABLE_EXTENSIONS:
                 return False, f"File type {file_ext} not optimal for caching"
             
-            # Estimate tokens
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            estimated_tokens = self._estimate_tokens(content)
+            if st is None:
+                st = os.stat(file_path)
+            file_size = st.st_size
+            
+            # Check file size (don't cache very small files). BPE tokens cover at least
+            # one byte each, so with a real tokenizer the floor is one byte per token.
+            min_bytes = self.min_cacheable_tokens if TIKTOKEN_AVAILABLE else 4096  # ~1024 tokens minimum
+            if file_size < min_bytes:
+                return False, "File too small for efficient caching"
+            
+            if TIKTOKEN_AVAILABLE:
+                doc_hash = self._generate_document_hash(file_path, st)
+                with _mmap_file(file_path) as content:
+                    estimated_tokens = self._estimate_tokens(content, doc_hash)
+            else:
+                # The estimate only depends on length, so no need to read the file
+                estimated_tokens = file_size // 4
             
             if estimated_tokens < self.min_cacheable_tokens:
                 return False, f"Estimated {estimated_tokens} tokens below minimum {self.min_cacheable_tokens}"
@@ -92,35 +275,38 @@ class DocumentCacheManager:
         except Exception as e:
             return False, f"Error checking document: {e}"
     
-    def get_cached_document(self, file_path: str) -> Optional[Dict]:
+    def get_cached_document(self, file_path: str, st: Optional[os.stat_result] = None) -> Optional[Dict]:
         """Retrieve cached document if valid"""
-        doc_hash = self._generate_document_hash(file_path)
+        doc_hash = self._generate_document_hash(file_path, st)
         
         if doc_hash in self.cache_index["documents"]:
             cached_doc = self.cache_index["documents"][doc_hash]
             
-            # Check if cache is still valid
-            cache_time = datetime.fromisoformat(cached_doc["cached_at"])
-            cache_duration = timedelta(minutes=cached_doc.get("cache_lifetime", self.cache_lifetime_minutes))
-            
-            if datetime.now() - cache_time < cache_duration:
+            if "blob_path" not in cached_doc or not os.path.exists(cached_doc["blob_path"]):
+                # Pre-blob entry or blob removed underneath us - re-cache it
+                print(f"[CACHE MISSING] Document {Path(file_path).name} has no stored content")
+                self._remove_entry(doc_hash)
+            elif time.time() < self._expires_at(cached_doc):
                 self.cache_index["cache_stats"]["cache_hits"] += 1
-                self._save_cache_index()
+                self._dirty = True
+                self._maybe_flush()
                 print(f"[CACHE HIT] Document {Path(file_path).name} retrieved from cache")
                 return cached_doc
             else:
                 # Cache expired
                 print(f"[CACHE EXPIRED] Document {Path(file_path).name} cache expired")
-                del self.cache_index["documents"][doc_hash]
+                self._remove_entry(doc_hash)
                 
         self.cache_index["cache_stats"]["cache_misses"] += 1
-        self._save_cache_index()
+        self._dirty = True
+        self._maybe_flush()
         return None
     
-    def cache_document(self, file_path: str, content: bytes, 
-                      use_extended_cache: bool = False) -> Dict:
-        """Cache document with metadata"""
-        doc_hash = self._generate_document_hash(file_path)
+    def cache_document(self, file_path: str, content, 
+                      use_extended_cache: bool = False,
+                      st: Optional[os.stat_result] = None) -> Dict:
+        """Cache document with metadata (content may be bytes or any buffer, e.g. an mmap)"""
+        doc_hash = self._generate_document_hash(file_path, st)
         file_name = Path(file_path).name
         
         # Determine cache lifetime
@@ -134,10 +320,11 @@ class DocumentCacheManager:
             "file_name": file_name,
             "hash": doc_hash,
             "size": len(content),
-            "estimated_tokens": self._estimate_tokens(content),
-            "content_base64": base64.b64encode(content).decode('utf-8'),
+            "estimated_tokens": self._estimate_tokens(content, doc_hash),
+            "blob_path": str(self._write_blob(doc_hash, content)),
             "cached_at": datetime.now().isoformat(),
             "cache_lifetime": cache_lifetime,
+            "expires_at": time.time() + cache_lifetime * 60,  # Epoch seconds, compared as a float
             "cache_control": {
                 "type": "ephemeral" if cache_lifetime <= 5 else "extended",
                 "breakpoint_eligible": True  # Can be used as cache breakpoint
@@ -148,29 +335,83 @@ class DocumentCacheManager:
         self.cache_index["documents"][doc_hash] = cache_entry
         self.cache_index["cache_stats"]["total_cached"] += 1
         self.cache_index["cache_stats"]["bytes_saved"] += len(content)
-        self._save_cache_index()
+        self._journal({"op": "put", "hash": doc_hash, "entry": cache_entry})
+        self._maybe_flush()
         
         print(f"[CACHE STORED] Document {file_name} cached for {cache_lifetime} minutes")
         return cache_entry
     
+    def _expires_at(self, cached_doc: Dict) -> float:
+        """Expiry as epoch seconds (derived from cached_at for entries stored before expires_at existed)"""
+        expires_at = cached_doc.get("expires_at")
+        if expires_at is None:
+            lifetime = cached_doc.get("cache_lifetime", self.cache_lifetime_minutes)
+            expires_at = datetime.fromisoformat(cached_doc["cached_at"]).timestamp() + lifetime * 60
+            cached_doc["expires_at"] = expires_at
+        return expires_at
+    
+    def _write_blob(self, doc_hash: str, content) -> Path:
+        """Store document content as cache_dir/blobs/<hash>.bin (same hash, same bytes - written once)"""
+        blob_path = self.blob_dir / f"{doc_hash}.bin"
+        if not blob_path.exists():
+            tmp_path = blob_path.with_suffix(".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, blob_path)
+            self.cache_index["cache_stats"]["bytes_on_disk"] += len(content)
+        return blob_path
+    
+    def _remove_entry(self, doc_hash: str):
+        """Drop a document from the index along with its stored content"""
+        cached_doc = self.cache_index["documents"].pop(doc_hash, None)
+        if cached_doc:
+            self._journal({"op": "del", "hash": doc_hash})
+        if cached_doc and "blob_path" in cached_doc:
+            try:
+                os.unlink(cached_doc["blob_path"])
+                stats = self.cache_index["cache_stats"]
+                stats["bytes_on_disk"] = max(0, stats["bytes_on_disk"] - cached_doc.get("size", 0))
+            except FileNotFoundError:
+                pass
+    
+    def read_cached_content(self, cached_doc: Dict) -> bytes:
+        """Read a cached document's content back from its blob"""
+        with open(cached_doc["blob_path"], 'rb') as f:
+            return f.read()
+    
     def prepare_cached_context(self, document_paths: List[str]) -> Dict:
         """Prepare multiple documents as cached context for prompt"""
         cached_documents = []
         cache_hits = 0
         cache_misses = 0
         
+        # One stat per document, shared by dedup, the hash lookup and the suitability check.
+        # The same file listed twice (or via different paths) is only processed once.
+        seen_files = set()
+        unique_paths = []
+        stats = []
         for doc_path in document_paths:
-            cached_doc = self.get_cached_document(doc_path)
+            st = os.stat(doc_path)
+            file_id = (st.st_dev, st.st_ino)
+            if file_id not in seen_files:
+                seen_files.add(file_id)
+                unique_paths.append(doc_path)
+                stats.append(st)
+        document_paths = unique_paths
+        self._prefetch_hashes(document_paths, stats)
+        
+        for doc_path, st in zip(document_paths, stats):
+            cached_doc = self.get_cached_document(doc_path, st)
             if cached_doc:
                 cached_documents.append(cached_doc)
                 cache_hits += 1
             else:
                 # Load and cache if suitable
-                should_cache, reason = self.should_cache_document(doc_path)
+                should_cache, reason = self.should_cache_document(doc_path, st)
                 if should_cache:
-                    with open(doc_path, 'rb') as f:
-                        content = f.read()
-                    cached_doc = self.cache_document(doc_path, content)
+                    # Encode straight from the page cache instead of a read() copy
+                    with _mmap_file(doc_path) as content:
+                        cached_doc = self.cache_document(doc_path, content, st=st)
                     cached_documents.append(cached_doc)
                 cache_misses += 1
         
@@ -185,29 +426,45 @@ class DocumentCacheManager:
             "cache_control_hint": "use_cached" if cache_hits > cache_misses else "rebuild_cache"
         }
     
-    def get_cache_statistics(self) -> Dict:
-        """Get current cache statistics"""
+    @staticmethod
+    def _scan_dir_size(directory: Path) -> int:
+        """Total size of every file under directory (one stat per file)"""
+        return sum(f.stat().st_size for f in directory.rglob('*') if f.is_file())
+    
+    def get_cache_statistics(self, deep: bool = False) -> Dict:
+        """
+        Get current cache statistics.
+        
+        cache_dir_size comes from the running blob total plus the index files;
+        deep=True walks the cache directory instead (for debugging drift).
+        """
         stats = self.cache_index["cache_stats"].copy()
         stats["active_documents"] = len(self.cache_index["documents"])
-        stats["cache_dir_size"] = sum(
-            f.stat().st_size for f in self.cache_dir.rglob('*') if f.is_file()
-        )
+        if deep:
+            stats["cache_dir_size"] = self._scan_dir_size(self.cache_dir)
+        else:
+            index_size = 0
+            for path in (self.cache_index_file, self.cache_journal_file):
+                try:
+                    index_size += path.stat().st_size
+                except FileNotFoundError:
+                    pass
+            stats["cache_dir_size"] = stats["bytes_on_disk"] + index_size
         return stats
     
     def clear_expired_cache(self):
         """Remove expired cache entries"""
-        expired_count = 0
-        for doc_hash in list(self.cache_index["documents"].keys()):
-            cached_doc = self.cache_index["documents"][doc_hash]
-            cache_time = datetime.fromisoformat(cached_doc["cached_at"])
-            cache_duration = timedelta(minutes=cached_doc.get("cache_lifetime", self.cache_lifetime_minutes))
-            
-            if datetime.now() - cache_time >= cache_duration:
-                del self.cache_index["documents"][doc_hash]
-                expired_count += 1
+        now = time.time()
+        expired = [
+            doc_hash for doc_hash, cached_doc in self.cache_index["documents"].items()
+            if self._expires_at(cached_doc) <= now
+        ]
+        for doc_hash in expired:
+            self._remove_entry(doc_hash)
+        expired_count = len(expired)
         
         if expired_count > 0:
-            self._save_cache_index()
+            self._maybe_flush()
             print(f"[CACHE CLEANUP] Removed {expired_count} expired entries")
         
         return expired_count
\ No newline at end of file
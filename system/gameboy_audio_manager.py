@@ -7,13 +7,24 @@ Removes all pyaudio/microphone dependencies for GameBoy-style Apple Watch input
 """
 
 import asyncio
+import io
 import pygame
-import threading
+from functools import lru_cache
 from typing import Optional
 import traceback
 import os
 
 
+# Clips up to this size are decoded once and replayed from memory via mixer.Sound
+_SOUND_CACHE_MAX_BYTES = 1024 * 1024
+
+
+@lru_cache(maxsize=32)
+def _load_sound(path: str, mtime_ns: int) -> pygame.mixer.Sound:
+    """Decode a short clip to PCM (mtime_ns keys out stale copies of edited files)"""
+    return pygame.mixer.Sound(path)
+
+
 class GameBoyAudioManager:
     """
     Simplified audio manager for GameBoy mode - output only
@@ -25,13 +36,28 @@ class GameBoyAudioManager:
     def __init__(self, sample_rate: int = 44100):
         self.sample_rate = sample_rate
         self.is_initialized = False
-        self._audio_lock = threading.Lock()
+        self._end_event_type = pygame.USEREVENT + 1
+        self._sfx_end_event_type = pygame.USEREVENT + 2
+        self._end_events_available = False
+        self._sfx_channel = None
+        # Guards mixer setup/stop only - never held while waiting for playback,
+        # so stop_audio can interrupt a clip that is playing
+        self._audio_lock = asyncio.Lock()
         
         # Initialize pygame mixer for audio output
         try:
             pygame.mixer.pre_init(frequency=sample_rate, size=-16, channels=2, buffer=1024)
             pygame.mixer.init()
             self.is_initialized = True
+            
+            # Have the mixer post an event when music ends (including stop())
+            pygame.mixer.music.set_endevent(self._end_event_type)
+            self._end_events_available = True
+            
+            # One reserved channel for cached short clips, with its own end event
+            pygame.mixer.set_reserved(1)
+            self._sfx_channel = pygame.mixer.Channel(0)
+            self._sfx_channel.set_endevent(self._sfx_end_event_type)
             print(f"[GAMEBOY_AUDIO] Audio output initialized at {sample_rate}Hz")
         except Exception as e:
             print(f"[GAMEBOY_AUDIO] Failed to initialize audio: {e}")
@@ -53,30 +79,116 @@ class GameBoyAudioManager:
             return
             
         try:
-            with self._audio_lock:
+            sound = self._get_cached_sound(audio_file_path)
+            
+            async with self._audio_lock:
                 print(f"[GAMEBOY_AUDIO] Playing audio: {os.path.basename(audio_file_path)}")
                 
-                # Load and play the audio file
-                pygame.mixer.music.load(audio_file_path)
-                pygame.mixer.music.set_volume(volume)
-                pygame.mixer.music.play()
+                if sound is not None:
+                    # Short clip - already decoded, plays straight from memory
+                    self._sfx_channel.set_volume(volume)
+                    self._clear_end_events(self._sfx_end_event_type)
+                    self._sfx_channel.play(sound)
+                else:
+                    # Load and stream the audio file
+                    pygame.mixer.music.load(audio_file_path)
+                    pygame.mixer.music.set_volume(volume)
+                    self._clear_end_events(self._end_event_type)
+                    pygame.mixer.music.play()
+            
+            # Wait for playback to complete (or be stopped)
+            if sound is not None:
+                await self._wait_for_end(self._sfx_end_event_type, self._sfx_channel.get_busy)
+            else:
+                await self._wait_for_end(self._end_event_type, pygame.mixer.music.get_busy)
                 
-                # Wait for playback to complete
-                while pygame.mixer.music.get_busy():
-                    await asyncio.sleep(0.1)
-                    
-                print(f"[GAMEBOY_AUDIO] Completed playback: {os.path.basename(audio_file_path)}")
+            print(f"[GAMEBOY_AUDIO] Completed playback: {os.path.basename(audio_file_path)}")
                 
         except Exception as e:
             print(f"[GAMEBOY_AUDIO] Error playing audio {audio_file_path}: {e}")
             traceback.print_exc()
     
+    async def play_audio_bytes(self, audio_data: bytes, ext: str = ".mp3", volume: float = 1.0):
+        """Play an in-memory audio buffer (e.g. TTS output) without writing a temp file"""
+        if not self.is_initialized:
+            print(f"[GAMEBOY_AUDIO] Audio not initialized, skipping <memory{ext}>")
+            return
+        
+        try:
+            async with self._audio_lock:
+                print(f"[GAMEBOY_AUDIO] Playing audio: <memory{ext}> ({len(audio_data)} bytes)")
+                # The name hint tells SDL_mixer which decoder to use for the buffer
+                pygame.mixer.music.load(io.BytesIO(audio_data), ext.lstrip('.'))
+                pygame.mixer.music.set_volume(volume)
+                self._clear_end_events(self._end_event_type)
+                pygame.mixer.music.play()
+            
+            # Wait for playback to complete (or be stopped)
+            await self._wait_for_end(self._end_event_type, pygame.mixer.music.get_busy)
+            print(f"[GAMEBOY_AUDIO] Completed playback: <memory{ext}>")
+        
+        except Exception as e:
+            print(f"[GAMEBOY_AUDIO] Error playing in-memory audio: {e}")
+            traceback.print_exc()
+    
+    async def play_audio_stream(self, chunks, label: str = "<stream.mp3>"):
+        """
+        Play streamed MP3 chunks (e.g. from TTSHandler.generate_audio_stream).
+
+        pygame can't start decoding a buffer that is still growing, so the stream is
+        collected first and then played from memory.
+        """
+        audio_data = b"".join([chunk async for chunk in chunks])
+        if not audio_data:
+            print(f"[GAMEBOY_AUDIO] Empty audio stream, skipping {label}")
+            return
+        await self.play_audio_bytes(audio_data, os.path.splitext(label.rstrip('>'))[1] or ".mp3")
+    
+    def _get_cached_sound(self, audio_file_path: str) -> Optional[pygame.mixer.Sound]:
+        """Return a decoded Sound for short clips, or None to stream via mixer.music"""
+        if self._sfx_channel is None:
+            return None
+        st = os.stat(audio_file_path)
+        if st.st_size > _SOUND_CACHE_MAX_BYTES:
+            return None
+        try:
+            return _load_sound(audio_file_path, st.st_mtime_ns)
+        except pygame.error as e:
+            # Format Sound can't decode - the music streamer may still handle it
+            print(f"[GAMEBOY_AUDIO] Could not preload {os.path.basename(audio_file_path)}: {e}")
+            return None
+    
+    def _clear_end_events(self, event_type: int):
+        """Drop end events left over from earlier playback"""
+        if self._end_events_available:
+            try:
+                pygame.event.clear(event_type)
+            except pygame.error:
+                self._end_events_available = False
+    
+    async def _wait_for_end(self, event_type: int, is_busy):
+        """Wait for the mixer's end event, falling back to polling is_busy()"""
+        if self._end_events_available:
+            try:
+                while not pygame.event.get(event_type):
+                    await asyncio.sleep(0.02)
+                return
+            except pygame.error:
+                # The event queue needs SDL's video subsystem, which headless setups may lack
+                print("[GAMEBOY_AUDIO] Mixer end events unavailable, polling playback state")
+                self._end_events_available = False
+        
+        while is_busy():
+            await asyncio.sleep(0.1)
+    
     async def stop_audio(self):
         """Stop currently playing audio"""
         if self.is_initialized:
             try:
-                with self._audio_lock:
+                async with self._audio_lock:
                     pygame.mixer.music.stop()
+                    if self._sfx_channel is not None:
+                        self._sfx_channel.stop()
                     print("[GAMEBOY_AUDIO] Audio playback stopped")
             except Exception as e:
                 print(f"[GAMEBOY_AUDIO] Error stopping audio: {e}")
@@ -86,7 +198,7 @@ class GameBoyAudioManager:
         if not self.is_initialized:
             return False
         try:
-            return pygame.mixer.music.get_busy()
+            return pygame.mixer.music.get_busy() or bool(self._sfx_channel and self._sfx_channel.get_busy())
         except:
             return False
     
@@ -96,6 +208,9 @@ class GameBoyAudioManager:
         try:
             if self.is_initialized:
                 pygame.mixer.music.stop()
+                # Cached Sounds belong to this mixer instance
+                _load_sound.cache_clear()
+                self._sfx_channel = None
                 pygame.mixer.quit()
                 self.is_initialized = False
         except Exception as e:
@@ -1,10 +1,18 @@
 #!/usr/bin/env python3
 
 import asyncio
-import time
+import concurrent.futures
+import errno
+import json
+import logging
+import os
 import random
-import select
-from datetime import datetime
+import subprocess
+import sys
+import threading
+import time
+import selectors
+from collections import deque
 from pathlib import Path
 from typing import Optional
 from evdev import InputDevice, list_devices, ecodes
@@ -13,8 +21,207 @@ try:
     GPIO_AVAILABLE = True
 except ImportError:
     GPIO_AVAILABLE = False
+try:
+    from gpiozero import Button
+    GPIOZERO_AVAILABLE = True
+except ImportError:
+    GPIOZERO_AVAILABLE = False
 from colorama import Fore
 
+# Debug chatter goes through logging so it costs nothing unless a handler enables DEBUG;
+# user-facing [INFO]/[WARN] lines stay on print like the rest of the client
+logger = logging.getLogger('input_manager')
+
+# Wake word stack, imported once up front instead of inside the first wake-loop call.
+# Optional so GameBoy (output-only) installs without a microphone stack still import.
+try:
+    import pyaudio
+    PYAUDIO_AVAILABLE = True
+except ImportError:
+    PYAUDIO_AVAILABLE = False
+_SNOWBOY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'snowboy')
+if _SNOWBOY_PATH not in sys.path:
+    sys.path.insert(0, _SNOWBOY_PATH)
+try:
+    import snowboydetect
+    SNOWBOY_AVAILABLE = True
+except ImportError:
+    SNOWBOY_AVAILABLE = False
+try:
+    import numpy as np
+    from openwakeword.model import Model as OpenWakeWordModel
+    OPENWAKEWORD_AVAILABLE = True
+except ImportError:
+    OPENWAKEWORD_AVAILABLE = False
+
+# Wake word engine: "snowboy" (default) or "openwakeword" (int8 ONNX models, NEON-accelerated onnxruntime)
+try:
+    from config.client_config import WAKEWORD_BACKEND, OPENWAKEWORD_MODELS
+except ImportError:
+    WAKEWORD_BACKEND = "snowboy"
+    OPENWAKEWORD_MODELS = {}  # model filename (in WAKEWORD_MODEL_DIR) -> detection threshold
+
+_WAKE_FRAME_SAMPLES = 1024
+_WAKE_FRAME_SECONDS = _WAKE_FRAME_SAMPLES / 16000
+_WAKE_BREAK_INTERVAL = 30  # seconds between wake-stream breaks for notifications/keyboard recheck
+_WAKE_QUEUE_FRAMES = 8  # ~0.5 s of audio; older frames are dropped if detection falls behind
+
+# Key codes bound once for the keyboard event loop
+_EV_KEY = ecodes.EV_KEY
+_KEY_LEFTMETA = ecodes.KEY_LEFTMETA
+
+# errnos meaning the keyboard node is gone (unplugged, BT channel switch) rather than just idle
+_DEAD_KBD_ERRNOS = frozenset({errno.ENODEV, errno.EBADF, errno.ENXIO, errno.EIO})
+
+# Held modifiers are tracked as a bitmask; only these keys matter for wake routing
+_MOD_LEFTSHIFT = 1
+_MOD_BITS = {
+    ecodes.KEY_LEFTSHIFT: _MOD_LEFTSHIFT,
+    ecodes.KEY_RIGHTSHIFT: 2,
+    ecodes.KEY_LEFTMETA: 4,
+    ecodes.KEY_LEFTCTRL: 8,
+    ecodes.KEY_LEFTALT: 16,
+}
+
+_VOICES_FILE = "/home/user/rp_client/TTS/config/voices.json"
+_VOICES_FLUSH_DELAY = 0.5  # seconds; rapid persona switches collapse into one write
+
+def _spawn(args, **popen_kwargs):
+    """
+    Start a fire-and-forget child process without forking on the event loop thread.
+
+    On the loop thread the Popen runs in the default executor; elsewhere (gpiozero
+    callback threads) it runs inline since nothing is waiting on that thread.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        subprocess.Popen(args, **popen_kwargs)
+        return
+    future = loop.run_in_executor(None, lambda: subprocess.Popen(args, **popen_kwargs))
+    future.add_done_callback(
+        lambda f: f.exception() and print(f"[WARN] Failed to start {args[0]}: {f.exception()}"))
+
+
+# Button long-press launches: name -> (label, argv, cwd, confirmation sound)
+_LONG_PRESS_ACTIONS = {
+    'laura_mcp': (
+        "run_LAURA MCP tool",
+        ['python3', '/home/user/rp_client/run.py'],
+        '/home/user/rp_client',
+        '/home/user/rp_client/assets/sounds/sound_effects/cc_confirm.mp3',
+    ),
+    'claude_code_vi': (
+        "Claude Code voice injection",
+        ['python3', '/home/user/rp_client/claude/simple_voice_injector.py'],
+        '/home/user/rp_client',
+        '/home/user/rp_client/assets/sounds/sound_effects/teletype.mp3',
+    ),
+}
+
+# Annoyance audio: button{N}/<level>/*.mp3 with button{N}/default.mp3 as fallback
+_BUTTON_AUDIO_DIR = "/home/user/rp_client/assets/sounds/button_audio"
+_ANNOYANCE_LEVELS = ((3, "1-3"), (5, "4-5"), (7, "6-7"), (9, "8-9"))  # (max clicks, folder)
+_ANNOYANCE_TOP_LEVEL = "10"
+
+
+def _annoyance_level(click_count: int) -> str:
+    """Map a click count to its annoyance level folder"""
+    return next((folder for max_clicks, folder in _ANNOYANCE_LEVELS if click_count <= max_clicks),
+                _ANNOYANCE_TOP_LEVEL)
+
+
+# Keyboard selection: (name substrings, path substring or None, priority); highest match wins
+_KEYBOARD_PRIORITY_RULES = (
+    (("Pi 500", "Keyboard"), "event5", 100),  # event5 receives KEY_LEFTMETA
+    (("K780", "Keyboard"), None, 95),
+    (("Pi 500", "Keyboard"), "event10", 90),
+    (("Pi 500", "Keyboard"), None, 50),
+)
+_GENERIC_KEYBOARD_PRIORITY = 30
+_GENERIC_KEYBOARD_EXCLUDE = ("Mouse", "Consumer", "System", "AVRCP")
+
+
+def _keyboard_priority(name: str, path: str) -> int:
+    """Return the selection priority for an input device, or 0 if it isn't a keyboard"""
+    priority = max((p for names, path_part, p in _KEYBOARD_PRIORITY_RULES
+                    if all(n in name for n in names) and (path_part is None or path_part in path)),
+                   default=0)
+    if not priority and "Keyboard" in name and not any(x in name for x in _GENERIC_KEYBOARD_EXCLUDE):
+        priority = _GENERIC_KEYBOARD_PRIORITY
+    return priority
+
+
+_wake_config = None  # (resource, model_str, sensitivity_bytes, model_names) once resolved
+
+
+def _prepare_wake_paths():
+    """
+    Resolve wake word model paths and sensitivities once per process.
+
+    Returns:
+        tuple | None: (resource_bytes, model_str_bytes, sensitivity_bytes, model_names),
+        or None if required files are missing
+    """
+    global _wake_config
+    if _wake_config is not None:
+        return _wake_config
+    
+    from config.client_config import WAKE_WORDS_AND_SENSITIVITIES as WAKE_WORDS, WAKEWORD_RESOURCE_FILE, WAKEWORD_MODEL_DIR
+    
+    # Explicitly define resource path
+    resource_path = Path(WAKEWORD_RESOURCE_FILE).absolute()
+    
+    # Build model paths from filenames in WAKE_WORDS
+    wakeword_dir = Path(WAKEWORD_MODEL_DIR).absolute()
+    model_paths = [wakeword_dir / name for name in WAKE_WORDS.keys()]
+    
+    # Check for missing files
+    missing = [str(path) for path in [resource_path] + model_paths if not path.exists()]
+    if missing:
+        print(f"ERROR: The following required file(s) are missing:\n" + "\n".join(missing))
+        return None
+    
+    # Build sensitivities list, ensuring order matches models
+    sensitivities = []
+    for p in model_paths:
+        sensitivity = WAKE_WORDS.get(p.name)
+        if sensitivity is None:
+            print(f"WARNING: No sensitivity found for {p.name}. Defaulting to 0.5.")
+            sensitivity = 0.5
+        sensitivities.append(str(sensitivity))
+    
+    _wake_config = (
+        str(resource_path).encode(),
+        ",".join(str(p) for p in model_paths).encode(),
+        ",".join(sensitivities).encode(),
+        [p.name for p in model_paths],
+    )
+    return _wake_config
+
+
+def _prepare_openwakeword_models():
+    """
+    Resolve openWakeWord model paths and thresholds.
+
+    Returns:
+        tuple | None: (model_paths, {model key: (model filename, threshold)}),
+        or None if required files are missing
+    """
+    from config.client_config import WAKEWORD_MODEL_DIR
+    
+    wakeword_dir = Path(WAKEWORD_MODEL_DIR).absolute()
+    model_paths = [wakeword_dir / name for name in OPENWAKEWORD_MODELS]
+    
+    missing = [str(path) for path in model_paths if not path.exists()]
+    if missing:
+        print("ERROR: The following required file(s) are missing:\n" + "\n".join(missing))
+        return None
+    
+    # openWakeWord keys its predictions by model file stem
+    thresholds = {p.stem: (p.name, float(OPENWAKEWORD_MODELS[p.name])) for p in model_paths}
+    return [str(p) for p in model_paths], thresholds
+
 
 class InputManager:
     """
@@ -27,33 +234,73 @@ class InputManager:
     def __init__(self, audio_manager):
         self.audio_manager = audio_manager
         self.keyboard_device = None
-        self.last_interaction = time.time()
-        self.last_interaction_check = time.time()
+        # epoll interest list held in the kernel; re-registered only when the device changes
+        self._key_selector = selectors.DefaultSelector()
+        # Event-driven path: the loop reads the keyboard when its fd becomes readable
+        # and queues wake sources; the selector poll above is the fallback
+        self._kbd_queue = asyncio.Queue()
+        self._kbd_reader_loop = None
+        self._kbd_reader_fd = None
+        self._kbd_reader_failed = False
+        self.last_interaction_ns = time.monotonic_ns()
+        self._interaction_event = asyncio.Event()
         
-        # Key state tracking for modifier detection
-        self.keys_pressed = set()
+        # Modifier state tracking (bitmask of _MOD_BITS)
+        self.mods = 0
         
         # Cooldown for keyboard events to prevent double triggers
         self.keyboard_cooldown_until = 0
         
         # Initialize GPIO buttons
         self.gpio_initialized = False
-        self.button_press_start = {}
         self.button_hold_time = 2.0  # seconds for long press
-        if GPIO_AVAILABLE:
+        self._buttons = {}  # gpiozero Buttons by pin, when edge-triggered input is available
+        self._button_was_held = {}
+        # pin -> (persona label for short press, long-press label, long-press action)
+        self._btn_table = {
+            23: ("LAURA", "Run LAURA MCP tool", lambda: self._spawn_action('laura_mcp')),  # Top
+            24: ("Claude Code", "Claude Code voice injection", lambda: self._spawn_action('claude_code_vi')),  # Bottom
+        }
+        self._btn_down_at = [0.0] * len(self._btn_table)  # polling fallback: press time per table slot, 0.0 = up
+        if GPIOZERO_AVAILABLE:
+            self._init_gpiozero_buttons()
+        elif GPIO_AVAILABLE:
             self._init_gpio_buttons()
             
         # Button click tracking for annoyance system
         self.button_click_counts = {23: 0, 24: 0}
         self.last_button_pressed = None
         self.current_persona = "laura"  # "laura" or "claude_code"
+        self._annoyance_audio, self._annoyance_fallback = self._scan_annoyance_audio()
+        
+        # voices.json is read once and written back on a coalescing timer
+        self._voices_data = None
+        self._voices_flush_timer = None
+        self._voices_lock = threading.Lock()
+        
+        # Long-lived mpg123 in remote-control mode for button sounds (no fork/exec per press)
+        self._player = None
+        try:
+            self._player = subprocess.Popen(
+                ['mpg123', '-R'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+        except OSError as e:
+            print(f"[WARN] Could not start mpg123 control player, spawning per sound: {e}")
         
         # Wake word detection attributes
         self.wake_detector = None
         self.wake_model_names = None
+        self._oww_thresholds = None  # {model key: (filename, threshold)} when using openWakeWord
         self.wake_pa = None
         self.wake_stream = None
-        self.wake_last_break = None
+        self._next_break_at = 0.0  # monotonic deadline for the next wake-stream break
+        # Inference runs on one worker thread so the loop keeps serving keyboard/buttons meanwhile
+        self._wake_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='wakeword')
+        self._wake_frames = deque(maxlen=_WAKE_QUEUE_FRAMES)
         
     def find_pi_keyboard(self):
         """Find keyboard device with proper priority and logging"""
@@ -70,60 +317,21 @@ class InputManager:
                 device = InputDevice(path)
                 print(f"  - {device.path}: {device.name}")
                 
-                # Check if we can read from this device
-                try:
-                    select.select([device.fd], [], [], 0)
-                    
-                    # Check for keyboard devices (Pi 500, K780, etc.)
-                    is_keyboard = False
-                    priority = 0
-                    
-                    # Pi 500 keyboard (original priority)
-                    if "Pi 500" in device.name and "Keyboard" in device.name:
-                        is_keyboard = True
-                        if "event5" in device.path:
-                            priority = 100  # Prioritize event5 as it receives KEY_LEFTMETA
-                        elif "event10" in device.path:
-                            priority = 90   # event10 is secondary
-                        else:
-                            priority = 50
-                    
-                    # Logitech K780 keyboard (high priority)
-                    elif "K780" in device.name and "Keyboard" in device.name:
-                        is_keyboard = True
-                        priority = 95  # High priority for K780
-                    
-                    # Generic keyboard detection (lower priority)
-                    elif ("Keyboard" in device.name and 
-                          "Mouse" not in device.name and 
-                          "Consumer" not in device.name and 
-                          "System" not in device.name and
-                          "AVRCP" not in device.name):
-                        is_keyboard = True
-                        priority = 30
-                            
-                    if is_keyboard and priority > 0:
-                        try:
-                            device.grab()
-                            device.ungrab()
-                            keyboard_devices.append((device, priority))
-                            print(f"    {Fore.GREEN}✓ Keyboard found: {device.name} (priority: {priority}){Fore.WHITE}")
-                        except Exception as e:
-                            print(f"    {Fore.YELLOW}✗ Cannot grab device: {e}{Fore.WHITE}")
-                            device.close()
-                    else:
-                        device.close()
-                        
-                except Exception as e:
-                    print(f"    {Fore.YELLOW}✗ Cannot read device: {e}{Fore.WHITE}")
+                priority = _keyboard_priority(device.name, device.path)
+                if priority:
+                    keyboard_devices.append((device, priority))
+                    print(f"    {Fore.GREEN}✓ Keyboard found: {device.name} (priority: {priority}){Fore.WHITE}")
+                else:
                     device.close()
                     
             except Exception as e:
                 print(f"    {Fore.RED}Error with device {path}: {e}{Fore.WHITE}")
 
         if keyboard_devices:
-            keyboard_devices.sort(key=lambda x: x[1], reverse=True)
-            keyboard_device = keyboard_devices[0][0]
+            keyboard_device = max(keyboard_devices, key=lambda x: x[1])[0]
+            for device, _ in keyboard_devices:
+                if device is not keyboard_device:
+                    device.close()
             print(f"{Fore.GREEN}✓ Using keyboard device: {keyboard_device.path} ({keyboard_device.name}){Fore.WHITE}")
             print(f"{Fore.GREEN}✓ Using keyboard without exclusive access to allow normal typing{Fore.WHITE}")
             return keyboard_device
@@ -133,25 +341,106 @@ class InputManager:
 
     def initialize_keyboard(self):
         """Initialize keyboard input detection"""
-        self.keyboard_device = self.find_pi_keyboard()
+        self._set_keyboard_device(self.find_pi_keyboard())
         return self.keyboard_device is not None
     
+    def _set_keyboard_device(self, device):
+        """Swap the keyboard device, keeping the selector registration in sync"""
+        self._remove_keyboard_reader()
+        if self.keyboard_device:
+            try:
+                self._key_selector.unregister(self.keyboard_device)
+            except (KeyError, ValueError, OSError):
+                pass
+        self.keyboard_device = device
+        if device:
+            try:
+                self._key_selector.register(device, selectors.EVENT_READ)
+            except (KeyError, ValueError, OSError) as e:
+                print(f"[WARN] Could not watch keyboard device: {e}")
+    
+    def _ensure_keyboard_reader(self):
+        """Attach the keyboard fd to the running event loop (needs a running loop)"""
+        if self._kbd_reader_failed or not self.keyboard_device:
+            return
+        fd = self.keyboard_device.fd
+        if fd < 0 or fd == self._kbd_reader_fd:
+            return
+        self._remove_keyboard_reader()
+        try:
+            loop = asyncio.get_running_loop()
+            loop.add_reader(fd, self._on_kbd_readable)
+            self._kbd_reader_loop = loop
+            self._kbd_reader_fd = fd
+        except (NotImplementedError, RuntimeError, ValueError, OSError) as e:
+            print(f"[WARN] Event-driven keyboard unavailable, polling instead: {e}")
+            self._kbd_reader_failed = True
+    
+    def _remove_keyboard_reader(self):
+        """Detach the keyboard fd from the event loop before the device goes away"""
+        if self._kbd_reader_fd is None:
+            return
+        try:
+            self._kbd_reader_loop.remove_reader(self._kbd_reader_fd)
+        except (RuntimeError, ValueError, OSError):
+            pass
+        self._kbd_reader_loop = None
+        self._kbd_reader_fd = None
+    
+    def _on_kbd_readable(self):
+        """Event loop callback: drain the keyboard and queue any wake source"""
+        try:
+            wake_source = self._read_keyboard_events()
+        except BlockingIOError:
+            return
+        except (OSError, ValueError) as e:
+            # Device vanished (unplug, channel switch) - find it again
+            print(f"[WARN] Keyboard device error: {e}")
+            self._refresh_keyboard_device()
+            return
+        
+        # Keys are still read during the cooldown so modifier state stays right
+        if wake_source and time.monotonic() >= self.keyboard_cooldown_until:
+            self._kbd_queue.put_nowait(wake_source)
+    
+    def _read_keyboard_events(self) -> str | None:
+        """Drain pending key events, tracking modifiers; returns the wake source for a Meta press"""
+        wake_source = None
+        for event in self.keyboard_device.read():
+            if event.type == _EV_KEY:
+                # Track modifier state changes (value 2 is autorepeat)
+                bit = _MOD_BITS.get(event.code)
+                if bit and event.value != 2:
+                    self.mods = self.mods | bit if event.value else self.mods & ~bit
+                
+                # Check for left meta press
+                if event.code == _KEY_LEFTMETA and event.value == 1 and wake_source is None:
+                    # Check if shift is currently held
+                    if self.mods & _MOD_LEFTSHIFT:
+                        print("[INFO] SHIFT+Left Meta detected - routing to Claude Code")
+                        wake_source = "keyboard_code"
+                    else:
+                        print("[INFO] Left Meta detected - routing to LAURA")
+                        wake_source = "keyboard_laura"
+        return wake_source
+    
     def _refresh_keyboard_device(self):
         """Refresh keyboard device when connection is lost"""
         try:
-            # Close old device if it exists
+            # Close old device if it exists (unwatch it first, while its fd is still valid)
             if self.keyboard_device:
+                old_device = self.keyboard_device
+                self._set_keyboard_device(None)
                 try:
-                    self.keyboard_device.close()
+                    old_device.close()
                 except:
                     pass
-                self.keyboard_device = None
             
-            # Clear pressed keys state
-            self.keys_pressed.clear()
+            # Clear modifier state
+            self.mods = 0
             
             # Try to find keyboard again
-            self.keyboard_device = self.find_pi_keyboard()
+            self._set_keyboard_device(self.find_pi_keyboard())
             
             if self.keyboard_device:
                 print("[INFO] Keyboard device refreshed successfully")
@@ -160,7 +449,7 @@ class InputManager:
                 
         except Exception as e:
             print(f"[ERROR] Error refreshing keyboard device: {e}")
-            self.keyboard_device = None
+            self._set_keyboard_device(None)
 
     def _listen_keyboard_sync(self) -> str | None:
         """Synchronous keyboard check for wake event"""
@@ -168,7 +457,7 @@ class InputManager:
             return None
         
         # Check if we're in cooldown period
-        if time.time() < self.keyboard_cooldown_until:
+        if time.monotonic() < self.keyboard_cooldown_until:
             return None
             
         try:
@@ -178,89 +467,74 @@ class InputManager:
                 self._refresh_keyboard_device()
                 return None
                 
-            ready, _, _ = select.select([self.keyboard_device.fd], [], [], 0.001)
-            if ready:
-                for event in self.keyboard_device.read():
-                    if event.type == ecodes.EV_KEY:
-                        # Track key state changes
-                        if event.value == 1:  # Key press
-                            self.keys_pressed.add(event.code)
-                        elif event.value == 0:  # Key release
-                            self.keys_pressed.discard(event.code)
-                        
-                        # Check for left meta press
-                        if (event.code == ecodes.KEY_LEFTMETA and event.value == 1):
-                            # Check if shift is currently held
-                            if ecodes.KEY_LEFTSHIFT in self.keys_pressed:
-                                print("[INFO] SHIFT+Left Meta detected - routing to Claude Code")
-                                return "keyboard_code"
-                            else:
-                                print("[INFO] Left Meta detected - routing to LAURA")
-                                return "keyboard_laura"
+            # Non-blocking readiness check against the registered fd
+            if self._key_selector.select(0):
+                return self._read_keyboard_events()
                                 
-        except (BlockingIOError, OSError, ValueError) as e:
-            if "file descriptor" in str(e):
+        except BlockingIOError:
+            pass
+        except (OSError, ValueError) as e:
+            # ValueError: the selector was handed a closed (-1) fd
+            if isinstance(e, ValueError) or e.errno in _DEAD_KBD_ERRNOS:
                 print(f"[WARN] Keyboard device error: {e}")
                 self._refresh_keyboard_device()
-            pass
             
         return None
 
+    def _on_wake_audio(self, in_data, frame_count, time_info, status):
+        """PortAudio callback: hand the captured frame to the wake loop without copying"""
+        self._wake_frames.append(in_data)
+        return (None, pyaudio.paContinue)
+
+    def _open_wake_stream(self):
+        """Open the wake word input stream in callback mode"""
+        self._wake_frames.clear()
+        return self.wake_pa.open(
+            rate=16000,
+            channels=1,
+            format=pyaudio.paInt16,
+            input=True,
+            frames_per_buffer=_WAKE_FRAME_SAMPLES,
+            stream_callback=self._on_wake_audio
+        )
+
     async def wake_word_detection(self):
         """Wake word detection with notification-aware breaks"""
-        import pyaudio
-        import sys
-        import os
-        # Add snowboy directory to Python path
-        snowboy_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'snowboy')
-        if snowboy_path not in sys.path:
-            sys.path.insert(0, snowboy_path)
-        import snowboydetect
-        from config.client_config import WAKE_WORDS_AND_SENSITIVITIES as WAKE_WORDS, WAKEWORD_RESOURCE_FILE, WAKEWORD_MODEL_DIR
-        
         # One-time initialization
         if not self.wake_detector:
+            use_oww = WAKEWORD_BACKEND == "openwakeword"
+            if use_oww and not OPENWAKEWORD_AVAILABLE:
+                print(f"{Fore.YELLOW}[WARN] openwakeword not available, falling back to snowboy{Fore.WHITE}")
+                use_oww = False
+            if not PYAUDIO_AVAILABLE or not (use_oww or SNOWBOY_AVAILABLE):
+                print("Error initializing wake word detection: pyaudio/snowboydetect not available")
+                return None
             try:
                 print(f"{Fore.YELLOW}Initializing wake word detector...{Fore.WHITE}")
-
-                # Explicitly define resource path
-                resource_path = Path(WAKEWORD_RESOURCE_FILE)
-
-                # Set the directory where all wake word models are kept
-                wakeword_dir = Path(WAKEWORD_MODEL_DIR)
-
-                # Build model paths from filenames in WAKE_WORDS
-                model_paths = [wakeword_dir / name for name in WAKE_WORDS.keys()]
-
-                # Check for missing files
-                missing = [str(path.absolute()) for path in [resource_path] + model_paths if not path.exists()]
-                if missing:
-                    print(f"ERROR: The following required file(s) are missing:\n" + "\n".join(missing))
-                    return None
-
-                # Build sensitivities list, ensuring order matches models
-                sensitivities = []
-                for p in model_paths:
-                    sensitivity = WAKE_WORDS.get(p.name)
-                    if sensitivity is None:
-                        print(f"WARNING: No sensitivity found for {p.name}. Defaulting to 0.5.")
-                        sensitivity = 0.5
-                    sensitivities.append(str(sensitivity))
-                if len(sensitivities) != len(model_paths):
-                    print("ERROR: Sensitivities count does not match model paths count!")
-                    return None
-
-                # Initialize the detector
-                self.wake_detector = snowboydetect.SnowboyDetect(
-                    resource_filename=str(resource_path.absolute()).encode(),
-                    model_str=",".join(str(p.absolute()) for p in model_paths).encode()
-                )
-                sensitivity_bytes = ",".join(sensitivities).encode()
-                self.wake_detector.SetSensitivity(sensitivity_bytes)
-                self.wake_model_names = [p.name for p in model_paths]
+                
+                if use_oww:
+                    oww_config = _prepare_openwakeword_models()
+                    if oww_config is None:
+                        return None
+                    model_paths, self._oww_thresholds = oww_config
+                    self.wake_detector = OpenWakeWordModel(wakeword_models=model_paths, inference_framework='onnx')
+                    self.wake_model_names = [name for name, _ in self._oww_thresholds.values()]
+                else:
+                    wake_config = _prepare_wake_paths()
+                    if wake_config is None:
+                        return None
+                    resource, model_str, sensitivity_bytes, model_names = wake_config
+                    
+                    # Initialize the detector
+                    self.wake_detector = snowboydetect.SnowboyDetect(
+                        resource_filename=resource,
+                        model_str=model_str
+                    )
+                    self.wake_detector.SetSensitivity(sensitivity_bytes)
+                    self.wake_model_names = model_names
                 self.wake_pa = pyaudio.PyAudio()
                 self.wake_stream = None
-                self.wake_last_break = time.time()
+                self.sync_wake_break()
                 print(f"{Fore.GREEN}Wake word detector initialized with models: {self.wake_model_names}{Fore.WHITE}")
             except Exception as e:
                 print(f"Error initializing wake word detection: {e}")
@@ -269,19 +543,12 @@ class InputManager:
         try:
             # Create/restart stream if needed
             if not self.wake_stream or not self.wake_stream.is_active():
-                self.wake_stream = self.wake_pa.open(
-                    rate=16000,
-                    channels=1,
-                    format=pyaudio.paInt16,
-                    input=True,
-                    frames_per_buffer=1024
-                )
+                self.wake_stream = self._open_wake_stream()
                 self.wake_stream.start_stream()
 
             # Periodic breaks for notifications and keyboard recheck (every 30 seconds)
-            current_time = time.time()
-            if (current_time - self.wake_last_break) >= 30:
-                self.wake_last_break = current_time
+            if time.monotonic() >= self._next_break_at:
+                self.sync_wake_break()
                 if self.wake_stream:
                     self.wake_stream.stop_stream()
                     
@@ -291,32 +558,26 @@ class InputManager:
                         self._refresh_keyboard_device()
                     
                     await asyncio.sleep(0.6)  # 0.6-second break
+                    self._wake_frames.clear()
                     self.wake_stream.start_stream()
                 return None
 
-            # Read audio with error handling
+            # Take the next frame queued by the stream callback; wait out a quarter frame if none yet
             try:
-                data = self.wake_stream.read(1024, exception_on_overflow=False)
-                if len(data) == 0:
-                    print("Warning: Empty audio frame received")
-                    return None
-            except (IOError, OSError) as e:
-                print(f"Stream read error: {e}")
-                if self.wake_stream:
-                    self.wake_stream.stop_stream()
-                    self.wake_stream.close()
-                    self.wake_stream = None
+                data = self._wake_frames.popleft()
+            except IndexError:
+                await asyncio.sleep(_WAKE_FRAME_SECONDS / 4)
+                return None
+            if not data:
+                print("Warning: Empty audio frame received")
                 return None
 
-            result = self.wake_detector.RunDetection(data)
-            if result > 0:
-                print(f"{Fore.GREEN}Wake word detected! (Model {result}){Fore.WHITE}")
-                # Don't update last_interaction here - only update on successful user interactions
-                return self.wake_model_names[result-1] if result <= len(self.wake_model_names) else None
-
-            # Occasionally yield to event loop (much less frequently)
-            if random.random() < 0.01:
-                await asyncio.sleep(0)
+            detected = await asyncio.get_running_loop().run_in_executor(
+                self._wake_executor, self._detect_wake_frame, data)
+            if detected:
+                print(f"{Fore.GREEN}Wake word detected! ({detected}){Fore.WHITE}")
+                # Don't update last_interaction_ns here - only update on successful user interactions
+                return detected
 
             return None
 
@@ -328,39 +589,59 @@ class InputManager:
                 self.wake_stream = None
             return None
 
+    def _detect_wake_frame(self, data) -> str | None:
+        """Run the wake detector over one frame (on the wake executor); returns the model filename if it fired"""
+        if self._oww_thresholds is not None:
+            return self._run_openwakeword(data)
+        result = self.wake_detector.RunDetection(data)
+        if 0 < result <= len(self.wake_model_names):
+            return self.wake_model_names[result-1]
+        return None
+
+    def _run_openwakeword(self, data) -> str | None:
+        """Score one frame with openWakeWord; returns the model filename of the best hit over threshold"""
+        scores = self.wake_detector.predict(np.frombuffer(data, dtype=np.int16))
+        key, score = max(scores.items(), key=lambda item: item[1], default=(None, 0.0))
+        entry = self._oww_thresholds.get(key)
+        if entry and score >= entry[1]:
+            self.wake_detector.reset()  # clear the score history so one utterance fires once
+            return entry[0]
+        return None
+
+    def sync_wake_break(self):
+        """Restart the 30-second wake-stream break timer from now (e.g. aligned with display rotation)"""
+        self._next_break_at = time.monotonic() + _WAKE_BREAK_INTERVAL
+
     def stop_wake_word_detection(self):
         """Stop wake word detection and release microphone for voice input"""
         try:
             if self.wake_stream:
-                print("[DEBUG] Stopping wake word stream to release microphone")
+                logger.debug("Stopping wake word stream to release microphone")
                 self.wake_stream.stop_stream()
                 self.wake_stream.close()
                 self.wake_stream = None
         except Exception as e:
-            print(f"[DEBUG] Error stopping wake stream: {e}")
+            logger.debug("Error stopping wake stream: %s", e)
     
     def restart_wake_word_detection(self):
         """Restart wake word detection after voice input is complete"""
         try:
             if not self.wake_stream and self.wake_pa and self.wake_detector:
-                print("[DEBUG] Restarting wake word detection")
-                import pyaudio  # Import pyaudio locally
-                self.wake_stream = self.wake_pa.open(
-                    format=pyaudio.paInt16,
-                    channels=1,
-                    rate=16000,
-                    input=True,
-                    frames_per_buffer=1024
-                )
+                logger.debug("Restarting wake word detection")
+                self.wake_stream = self._open_wake_stream()
         except Exception as e:
-            print(f"[DEBUG] Error restarting wake stream: {e}")
+            logger.debug("Error restarting wake stream: %s", e)
 
     async def check_for_wake_events(self):
         """Check for wake events from keyboard, buttons, or wake word"""
         wake_event_source = None
         
-        # Check keyboard first
-        keyboard_event = self._listen_keyboard_sync()
+        # Check keyboard first - queued by the fd reader, or polled if that's unavailable
+        self._ensure_keyboard_reader()
+        if self._kbd_reader_fd is not None:
+            keyboard_event = self._next_keyboard_wake()
+        else:
+            keyboard_event = self._listen_keyboard_sync()
         if keyboard_event:
             wake_event_source = keyboard_event  # Can be "keyboard_laura" or "keyboard_code"
             print(f"[INFO] Wake event from keyboard: {keyboard_event}")
@@ -376,85 +657,154 @@ class InputManager:
         
         return wake_event_source
 
+    def _next_keyboard_wake(self) -> str | None:
+        """Pop the next queued keyboard wake source, if any"""
+        try:
+            return self._kbd_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
     def update_last_interaction(self):
         """Update last interaction timestamp - call this only on successful user interactions"""
-        self.last_interaction = time.time()
-        print(f"[DEBUG] Last interaction updated to {self.last_interaction}")
+        self.last_interaction_ns = time.monotonic_ns()
+        self._interaction_event.set()
+        logger.debug("Last interaction updated")
+
+    async def wait_for_interaction(self, timeout=None):
+        """Block until the next user interaction; returns False if timeout expires first"""
+        try:
+            await asyncio.wait_for(self._interaction_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._interaction_event.clear()
+        return True
     
     def set_keyboard_cooldown(self, duration=1.5):
         """Set a cooldown period for keyboard events (prevents double triggers)"""
-        self.keyboard_cooldown_until = time.time() + duration
+        self.keyboard_cooldown_until = time.monotonic() + duration
+        # Presses queued before the cooldown belong to the interaction just handled
+        while self._next_keyboard_wake():
+            pass
         print(f"[INFO] Keyboard cooldown set for {duration} seconds")
 
     def get_time_since_last_interaction(self):
         """Get seconds since last interaction"""
-        return time.time() - self.last_interaction
+        return (time.monotonic_ns() - self.last_interaction_ns) * 1e-9
 
     def cleanup(self):
         """Clean up keyboard and GPIO resources"""
         if self.keyboard_device:
-            self.keyboard_device.close()
-            self.keyboard_device = None
+            device = self.keyboard_device
+            self._set_keyboard_device(None)
+            device.close()
+        self._key_selector.close()
+        for button in self._buttons.values():
+            button.close()
+        self._buttons.clear()
         if GPIO_AVAILABLE and self.gpio_initialized:
             GPIO.cleanup()
+        self._wake_executor.shutdown(wait=False, cancel_futures=True)
+        if self._voices_flush_timer:
+            self._voices_flush_timer.cancel()
+            self._flush_voices()
+        if self._player:
+            try:
+                self._player.stdin.write('Q\n')
+                self._player.stdin.flush()
+                self._player.wait(timeout=1)
+            except Exception:
+                self._player.terminate()
+            self._player = None
+
+    def _play_sound(self, path):
+        """Play a short sound through the control-mode player, or a one-off mpg123 if it's gone"""
+        if self._player and self._player.poll() is None:
+            try:
+                self._player.stdin.write(f'L {path}\n')
+                self._player.stdin.flush()
+                return
+            except (BrokenPipeError, OSError, ValueError):
+                self._player = None
+        _spawn(['mpg123', '-q', path], stdin=subprocess.DEVNULL)
 
     def _init_gpio_buttons(self):
         """Initialize GPIO buttons for miniPiTFT"""
         try:
             GPIO.setmode(GPIO.BCM)
-            GPIO.setup(23, GPIO.IN, pull_up_down=GPIO.PUD_UP)  # Top button
-            GPIO.setup(24, GPIO.IN, pull_up_down=GPIO.PUD_UP)  # Bottom button
+            for pin in self._btn_table:
+                GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
             self.gpio_initialized = True
             print("[INFO] GPIO buttons initialized (pins 23, 24)")
         except Exception as e:
             print(f"[WARN] Failed to initialize GPIO buttons: {e}")
             self.gpio_initialized = False
 
+    def _init_gpiozero_buttons(self):
+        """Set up the miniPiTFT buttons as edge-triggered, debounced gpiozero Buttons"""
+        try:
+            for pin in self._btn_table:
+                button = Button(pin, pull_up=True, bounce_time=0.02, hold_time=self.button_hold_time)
+                button.when_pressed = lambda pin=pin: self._on_button_pressed(pin)
+                button.when_held = lambda pin=pin: self._on_button_held(pin)
+                button.when_released = lambda pin=pin: self._on_button_released(pin)
+                self._buttons[pin] = button
+            print("[INFO] GPIO buttons initialized with edge detection (pins 23, 24)")
+        except Exception as e:
+            print(f"[WARN] Failed to initialize gpiozero buttons: {e}")
+            for button in self._buttons.values():
+                button.close()
+            self._buttons.clear()
+            if GPIO_AVAILABLE:
+                self._init_gpio_buttons()
+    
+    def _on_button_pressed(self, pin):
+        """gpiozero callback (its own thread): a new press starts"""
+        self._button_was_held[pin] = False
+        logger.debug("Button %d pressed", pin)
+    
+    def _on_button_held(self, pin):
+        """gpiozero callback: button held past button_hold_time - long-press action"""
+        self._button_was_held[pin] = True
+        _, long_label, long_action = self._btn_table[pin]
+        print(f"[INFO] Button {pin} long press - {long_label}")
+        long_action()
+    
+    def _on_button_released(self, pin):
+        """gpiozero callback: released before the hold fired - short-press action"""
+        if self._button_was_held.pop(pin, False):
+            return
+        persona = self._btn_table[pin][0]
+        print(f"[INFO] Button {pin} short press - {persona} persona confirmation")
+        self._handle_persona_button_press(pin)
+
     def _check_gpio_buttons(self):
-        """Check GPIO buttons and return wake event if pressed"""
-        if not GPIO_AVAILABLE or not self.gpio_initialized:
+        """Poll GPIO buttons (fallback when gpiozero edge detection isn't available)"""
+        if self._buttons or not GPIO_AVAILABLE or not self.gpio_initialized:
             return None
             
-        current_time = time.time()
+        current_time = time.monotonic()
         
         try:
-            # Check button 23 (top) - for LAURA
-            if GPIO.input(23) == 0:  # Button pressed (active low)
-                if 23 not in self.button_press_start:
-                    self.button_press_start[23] = current_time
-                    print("[DEBUG] Button 23 (top) pressed - starting timer")
-                return None  # Wait for release
-            elif 23 in self.button_press_start:
-                # Button released
-                press_duration = current_time - self.button_press_start[23]
-                del self.button_press_start[23]
-                if press_duration < self.button_hold_time:
-                    print(f"[INFO] Button 23 short press ({press_duration:.2f}s) - LAURA persona confirmation")
-                    self._handle_persona_button_press(23)
-                    return None
-                else:
-                    print(f"[INFO] Button 23 long press ({press_duration:.2f}s) - Run LAURA MCP tool")
-                    self._run_laura_mcp_tool()
-                    return None
-            
-            # Check button 24 (bottom) - for Claude Code  
-            if GPIO.input(24) == 0:  # Button pressed (active low)
-                if 24 not in self.button_press_start:
-                    self.button_press_start[24] = current_time
-                    print("[DEBUG] Button 24 (bottom) pressed - starting timer")
-                return None  # Wait for release
-            elif 24 in self.button_press_start:
+            down_at = self._btn_down_at
+            for slot, (pin, (persona, long_label, long_action)) in enumerate(self._btn_table.items()):
+                if GPIO.input(pin) == 0:  # Button pressed (active low)
+                    if not down_at[slot]:
+                        down_at[slot] = current_time
+                        logger.debug("Button %d pressed - starting timer", pin)
+                    continue  # Wait for release
+                
+                press_start = down_at[slot]
+                if not press_start:
+                    continue
                 # Button released
-                press_duration = current_time - self.button_press_start[24]
-                del self.button_press_start[24]
+                down_at[slot] = 0.0
+                press_duration = current_time - press_start
                 if press_duration < self.button_hold_time:
-                    print(f"[INFO] Button 24 short press ({press_duration:.2f}s) - Claude Code persona confirmation")
-                    self._handle_persona_button_press(24)
-                    return None
+                    print(f"[INFO] Button {pin} short press ({press_duration:.2f}s) - {persona} persona confirmation")
+                    self._handle_persona_button_press(pin)
                 else:
-                    print(f"[INFO] Button 24 long press ({press_duration:.2f}s) - Claude Code voice injection")
-                    self._launch_claude_code_voice_injection()
-                    return None
+                    print(f"[INFO] Button {pin} long press ({press_duration:.2f}s) - {long_label}")
+                    long_action()
                     
         except Exception as e:
             print(f"[WARN] GPIO button check error: {e}")
@@ -464,8 +814,7 @@ class InputManager:
     def _handle_volume_up(self):
         """Handle volume up button action"""
         try:
-            import subprocess
-            subprocess.run(['amixer', 'set', 'Master', '5%+'], capture_output=True)
+            _spawn(['amixer', 'set', 'Master', '5%+'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             print("✅ Volume increased")
         except Exception as e:
             print(f"❌ Volume up error: {e}")
@@ -473,8 +822,7 @@ class InputManager:
     def _handle_volume_down(self):
         """Handle volume down button action"""
         try:
-            import subprocess
-            subprocess.run(['amixer', 'set', 'Master', '5%-'], capture_output=True)
+            _spawn(['amixer', 'set', 'Master', '5%-'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             print("✅ Volume decreased")
         except Exception as e:
             print(f"❌ Volume down error: {e}")
@@ -482,7 +830,7 @@ class InputManager:
     def reset_button_counters(self):
         """Reset button click counters (called when user sends message or switches persona)"""
         self.button_click_counts = {23: 0, 24: 0}
-        print("[DEBUG] Button click counters reset")
+        logger.debug("Button click counters reset")
 
     def _handle_persona_button_press(self, button_number):
         """Handle persona confirmation button press with annoyance tracking"""
@@ -511,7 +859,7 @@ class InputManager:
             self.button_click_counts[button_number] += 1
             click_count = self.button_click_counts[button_number]
             
-            print(f"[INFO] Button {button_number} pressed {click_count} times ({target_persona})")
+            logger.debug("Button %d pressed %d times (%s)", button_number, click_count, target_persona)
             
             # Play appropriate annoyance level audio
             self._play_annoyance_audio(button_number, click_count)
@@ -520,63 +868,82 @@ class InputManager:
             print(f"[ERROR] Error handling persona button press: {e}")
 
     def _update_active_voice(self, voice_id):
-        """Update active voice in voices.json"""
+        """Update active voice in voices.json (written back shortly after, coalescing rapid switches)"""
         try:
-            import json
-            voices_file = "/home/user/rp_client/TTS/config/voices.json"
-            
-            with open(voices_file, 'r') as f:
-                voices_data = json.load(f)
-            
-            voices_data['active_voice'] = voice_id
-            
-            with open(voices_file, 'w') as f:
-                json.dump(voices_data, f, indent=2)
+            with self._voices_lock:
+                if self._voices_data is None:
+                    with open(_VOICES_FILE, 'r') as f:
+                        self._voices_data = json.load(f)
+                
+                if self._voices_data.get('active_voice') == voice_id:
+                    return
+                self._voices_data['active_voice'] = voice_id
+                
+                if self._voices_flush_timer is None:
+                    self._voices_flush_timer = threading.Timer(_VOICES_FLUSH_DELAY, self._flush_voices)
+                    self._voices_flush_timer.daemon = True
+                    self._voices_flush_timer.start()
                 
             print(f"[INFO] Updated active voice to: {voice_id}")
             
         except Exception as e:
             print(f"[ERROR] Failed to update active voice: {e}")
 
-    def _play_annoyance_audio(self, button_number, click_count):
-        """Play audio based on annoyance level from click count"""
+    def _flush_voices(self):
+        """Atomically write the cached voices.json"""
         try:
-            import subprocess
-            import os
-            import random
-            
-            # Determine annoyance level folder
-            if click_count <= 3:
-                level_folder = "1-3"
-            elif click_count <= 5:
-                level_folder = "4-5"
-            elif click_count <= 7:
-                level_folder = "6-7"
-            elif click_count <= 9:
-                level_folder = "8-9"
-            else:  # 10+
-                level_folder = "10"
+            with self._voices_lock:
+                self._voices_flush_timer = None
+                if self._voices_data is None:
+                    return
+                payload = json.dumps(self._voices_data, indent=2)
             
-            # Look for audio files in the annoyance level folder
-            audio_dir = f"/home/user/rp_client/assets/sounds/button_audio/button{button_number}/{level_folder}"
+            tmp_path = f"{_VOICES_FILE}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, _VOICES_FILE)
             
-            if os.path.exists(audio_dir):
-                # Get all mp3 files in the folder
-                audio_files = [f for f in os.listdir(audio_dir) if f.endswith('.mp3')]
-                
-                if audio_files:
-                    # Pick random file from the folder
-                    chosen_file = random.choice(audio_files)
-                    audio_path = os.path.join(audio_dir, chosen_file)
-                    
-                    subprocess.Popen(['mpg123', '-q', audio_path])
-                    print(f"[INFO] Playing annoyance level {level_folder}: {chosen_file}")
-                    return
+        except Exception as e:
+            print(f"[ERROR] Failed to write voices.json: {e}")
+
+    def _scan_annoyance_audio(self):
+        """Index annoyance audio once at startup: {(button, level): (paths...)} and {button: fallback}"""
+        levels = [folder for _, folder in _ANNOYANCE_LEVELS] + [_ANNOYANCE_TOP_LEVEL]
+        audio = {}
+        fallback = {}
+        for button in (23, 24):
+            button_dir = os.path.join(_BUTTON_AUDIO_DIR, f"button{button}")
+            for level in levels:
+                try:
+                    with os.scandir(os.path.join(button_dir, level)) as entries:
+                        files = tuple(e.path for e in entries if e.name.endswith('.mp3') and e.is_file())
+                except OSError:
+                    continue
+                if files:
+                    audio[(button, level)] = files
+            default_path = os.path.join(button_dir, "default.mp3")
+            if os.path.isfile(default_path):
+                fallback[button] = default_path
+        print(f"[INFO] Indexed annoyance audio for {len(audio)} button levels")
+        return audio, fallback
+
+    def _play_annoyance_audio(self, button_number, click_count):
+        """Play audio based on annoyance level from click count"""
+        try:
+            level_folder = _annoyance_level(click_count)
+            
+            # Pick random file from the indexed annoyance level folder
+            audio_files = self._annoyance_audio.get((button_number, level_folder))
+            if audio_files:
+                audio_path = random.choice(audio_files)
+                self._play_sound(audio_path)
+                print(f"[INFO] Playing annoyance level {level_folder}: {os.path.basename(audio_path)}")
+                return
             
             # Fallback to default if no annoyance audio found
-            fallback_path = f"/home/user/rp_client/assets/sounds/button_audio/button{button_number}/default.mp3"
-            if os.path.exists(fallback_path):
-                subprocess.Popen(['mpg123', '-q', fallback_path])
+            fallback_path = self._annoyance_fallback.get(button_number)
+            if fallback_path:
+                self._play_sound(fallback_path)
                 print(f"[INFO] Playing fallback audio (no annoyance level found)")
             else:
                 print(f"[WARN] No audio found for button {button_number}, level {level_folder}")
@@ -584,50 +951,19 @@ class InputManager:
         except Exception as e:
             print(f"[ERROR] Failed to play annoyance audio: {e}")
 
-    def _run_laura_mcp_tool(self):
-        """Execute run_LAURA MCP tool"""
+    def _spawn_action(self, name):
+        """Launch a long-press action from _LONG_PRESS_ACTIONS and play its confirmation sound"""
+        label, argv, cwd, confirm_sound = _LONG_PRESS_ACTIONS[name]
         try:
-            import subprocess
-            
-            print("[INFO] Launching run_LAURA MCP tool...")
-            
-            # Run the LAURA script in background
-            subprocess.Popen([
-                'python3', 
-                '/home/user/rp_client/run.py'
-            ], cwd='/home/user/rp_client')
-            
-            print("✅ run_LAURA MCP tool launched successfully")
-            
-            # Optional: Play confirmation sound
-            try:
-                subprocess.Popen(['mpg123', '-q', '/home/user/rp_client/assets/sounds/sound_effects/cc_confirm.mp3'])
-            except:
-                pass
-                
-        except Exception as e:
-            print(f"❌ Failed to launch run_LAURA MCP tool: {e}")
-
-    def _launch_claude_code_voice_injection(self):
-        """Launch Claude Code voice injection system"""
-        try:
-            import subprocess
-            
-            print("[INFO] Launching Claude Code voice injection...")
-            
-            # Launch the voice injection script
-            subprocess.Popen([
-                'python3',
-                '/home/user/rp_client/claude/simple_voice_injector.py'
-            ], cwd='/home/user/rp_client')
-            
-            print("✅ Claude Code voice injection launched successfully")
+            print(f"[INFO] Launching {label}...")
+            _spawn(argv, cwd=cwd)
+            print(f"✅ {label} launched successfully")
             
             # Optional: Play confirmation sound
             try:
-                subprocess.Popen(['mpg123', '-q', '/home/user/rp_client/assets/sounds/sound_effects/teletype.mp3'])
-            except:
+                self._play_sound(confirm_sound)
+            except Exception:
                 pass
                 
         except Exception as e:
-            print(f"❌ Failed to launch Claude Code voice injection: {e}")
\ No newline at end of file
+            print(f"❌ Failed to launch {label}: {e}")
\ No newline at end of file
@@ -2,11 +2,56 @@
 
 import asyncio
 import json
+import logging
 import os
 import random
+import re
 import time
 from typing import Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson parses str or bytes directly; the MCP text content is passed through as-is
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+logger = logging.getLogger('notification_manager')
+
+# Exception types that classify a failed check without looking at the message
+_ERROR_STATUS_BY_TYPE = (
+    (ConnectionError, "connection_failed"),
+)
+
+
+def _classify_check_error(e: Exception) -> str:
+    """Map a check_notifications failure to a connection status"""
+    for exc_type, status in _ERROR_STATUS_BY_TYPE:
+        if isinstance(e, exc_type):
+            return status
+    message = str(e).lower()
+    if "tool" in message and "not found" in message:
+        return "tool_missing"  # check_notifications not on the MCP server
+    if "connection" in message:
+        return "connection_failed"
+    return "error"
+
+# Most polls come back empty; recognise that without building the envelope dict
+_EMPTY_NOTIFICATIONS_RE = re.compile(r'"notifications"\s*:\s*\[\s*\]')
+
+
+def _extract_notifications(text: str) -> list:
+    """Pull the notifications array out of a check_notifications response body"""
+    if '"notifications"' not in text or _EMPTY_NOTIFICATIONS_RE.search(text):
+        return []
+    return _json_loads(text).get("notifications", [])
+
+
+_MEDICINE_AUDIO_DIR = "/home/user/rp_client/assets/sounds/laura/notifications/daily_medicine"
+_MEDICINE_OVER30_FILES = ("getdistracted.mp3", "notasfunctional.mp3", "quitbeingloser.mp3")
+
 
 class NotificationManager:
     """
@@ -22,6 +67,26 @@ class NotificationManager:
         self.connection_status = "unknown"  # Track MCP connection status
         self.last_successful_check = None   # Track last successful notification check
         self.consecutive_failures = 0       # Track consecutive failures for backoff
+        self._medicine_table = self._build_medicine_table()
+    
+    @staticmethod
+    def _build_medicine_table():
+        """
+        Medicine reminder buckets, most late first: (min minutes late, mood, sounds).
+        Sound files are checked for existence once here so notifications don't stat them.
+        """
+        def existing(*paths):
+            return tuple(p for p in paths if os.path.isfile(p))
+        
+        return (
+            # Over 30 minutes - very angry/sassy (annoyed should trigger angry images)
+            (30, "annoyed", existing(*(os.path.join(_MEDICINE_AUDIO_DIR, "over30", name)
+                                       for name in _MEDICINE_OVER30_FILES))),
+            (20, "frustrated", existing(f"{_MEDICINE_AUDIO_DIR}/20min.mp3")),
+            (10, "concerned", existing(f"{_MEDICINE_AUDIO_DIR}/10min.mp3")),
+            # Caring images for initial reminder
+            (float("-inf"), "caring", existing(f"{_MEDICINE_AUDIO_DIR}/notification.mp3")),
+        )
 
     async def check_for_notifications(self, mcp_session, session_id):
         """Check for server notifications once"""
@@ -35,55 +100,45 @@ class NotificationManager:
             # Parse response properly
             notifications = None
             if hasattr(response, 'content') and response.content:
-                json_str = response.content[0].text
-                parsed_response = json.loads(json_str)
-                notifications = parsed_response.get("notifications", [])
+                notifications = _extract_notifications(response.content[0].text)
             elif isinstance(response, dict):
                 notifications = response.get("notifications", [])
             
             # Update connection status on successful response
             self.connection_status = "connected"
             self.consecutive_failures = 0
-            self.last_successful_check = asyncio.get_event_loop().time()
+            self.last_successful_check = asyncio.get_running_loop().time()
             
             if notifications:
                 print(f"[NOTIFICATION] Found {len(notifications)} notifications")
                 return notifications
                     
         except Exception as e:
-            print(f"[NOTIFICATION ERROR] Failed to check notifications: {e}")
-            print(f"[NOTIFICATION ERROR] Exception type: {type(e)}")
-            if hasattr(e, 'message'):
-                print(f"[NOTIFICATION ERROR] Exception message: {e.message}")
             # Update connection status and failure count
             self.consecutive_failures += 1
             
-            # Check if it's a specific MCP error
-            if "tool" in str(e).lower() and "not found" in str(e).lower():
-                print("[NOTIFICATION ERROR] The 'check_notifications' tool is not available on the MCP server")
-                self.connection_status = "tool_missing"
-            elif "connection" in str(e).lower():
-                print("[NOTIFICATION ERROR] MCP connection issue detected")
-                self.connection_status = "connection_failed"
-            else:
-                print(f"[NOTIFICATION ERROR] Full error details: {repr(e)}")
-                self.connection_status = "error"
+            self.connection_status = _classify_check_error(e)
             
-            print(f"[NOTIFICATION ERROR] Connection status: {self.connection_status}, consecutive failures: {self.consecutive_failures}")
+            logger.exception("Notification check failed; status=%s failures=%d",
+                             self.connection_status, self.consecutive_failures)
             
             # Return empty list to continue operation
             return []
         
         return []
 
-    async def handle_notification(self, notification, display_manager):
-        """Handle incoming notification with TTS and display"""
+    async def handle_notification(self, notification, display_manager, tts_task=None):
+        """Handle incoming notification with TTS and display (tts_task: prefetched generate_audio task)"""
         notification_type = notification.get("notification_type", "general")
         text = notification.get("text", "")
         minutes_late = notification.get("minutes_late", 0)
         
         print(f"[NOTIFICATION] {notification_type}: {text} (late: {minutes_late}min)")
         
+        # Start TTS now so it generates while the display updates and the notification sound plays
+        if tts_task is None and text:
+            tts_task = asyncio.create_task(self.tts_handler.generate_audio(text, persona_name="laura"))
+        
         # Interrupt current activity for notifications
         current_state = display_manager.current_state
         
@@ -92,27 +147,9 @@ class NotificationManager:
         
         # Determine mood and sound based on how late the medicine is
         if notification_type == "medicine_reminder":
-            base_path = "/home/user/rp_client/assets/sounds/laura/notifications/daily_medicine"
-            
-            # Progressive anger based on lateness
-            if minutes_late >= 30:
-                # Over 30 minutes - very angry/sassy
-                mood = "annoyed"  # This should trigger angry images
-                timeout_sounds = [
-                    f"{base_path}/over30/getdistracted.mp3",
-                    f"{base_path}/over30/notasfunctional.mp3", 
-                    f"{base_path}/over30/quitbeingloser.mp3"
-                ]
-                notification_audio = random.choice([s for s in timeout_sounds if os.path.exists(s)])
-            elif minutes_late >= 20:
-                mood = "frustrated"  # Frustrated images
-                notification_audio = f"{base_path}/20min.mp3"
-            elif minutes_late >= 10:
-                mood = "concerned"   # Concerned images
-                notification_audio = f"{base_path}/10min.mp3"
-            else:
-                mood = "caring"      # Caring images for initial reminder
-                notification_audio = f"{base_path}/notification.mp3"
+            # Progressive anger based on lateness: first bucket the reminder is late enough for
+            _, mood, sounds = next(bucket for bucket in self._medicine_table if minutes_late >= bucket[0])
+            notification_audio = random.choice(sounds) if sounds else None
         else:
             mood = notification.get("mood", "caring")
             notification_audio = None
@@ -121,13 +158,13 @@ class NotificationManager:
         await display_manager.update_display("notification", mood=mood)
         
         # Play notification sound if available
-        if notification_audio and os.path.exists(notification_audio):
+        if notification_audio:
             await self.audio_coordinator.play_audio_file(notification_audio)
             await asyncio.sleep(1)  # Brief pause between notification sound and TTS
         
         # Generate and play TTS (display state set to notification with mood)
-        if text:
-            audio_bytes, engine = await self.tts_handler.generate_audio(text, persona_name="laura")
+        if tts_task is not None:
+            audio_bytes, engine = await tts_task
             if audio_bytes:
                 await self.audio_coordinator.handle_tts_playback(audio_bytes, engine)
         
@@ -138,28 +175,63 @@ class NotificationManager:
         else:
             await display_manager.update_display("idle")
 
+    @staticmethod
+    def _coalesce_notifications(notifications):
+        """Collapse a backlog: one medicine reminder (the latest-running) and no repeated type/text pairs"""
+        unique = {}
+        for notification in notifications:
+            notification_type = notification.get("notification_type", "general")
+            if notification_type == "medicine_reminder":
+                key = (notification_type,)
+                current = unique.get(key)
+                if current and current.get("minutes_late", 0) >= notification.get("minutes_late", 0):
+                    continue
+            else:
+                key = (notification_type, notification.get("text", ""))
+                if key in unique:
+                    continue
+            unique[key] = notification
+        return list(unique.values())
+
     async def process_notifications(self, notifications, display_manager):
         """Process a list of notifications"""
-        for notification in notifications:
-            await self.handle_notification(notification, display_manager)
+        unique = self._coalesce_notifications(notifications)
+        if len(unique) < len(notifications):
+            print(f"[NOTIFICATION] Coalesced {len(notifications)} notifications into {len(unique)}")
+        
+        # Generate all TTS up front in parallel; playback below stays sequential
+        tts_tasks = [
+            asyncio.create_task(self.tts_handler.generate_audio(n["text"], persona_name="laura"))
+            if n.get("text") else None
+            for n in unique
+        ]
+        try:
+            for notification, tts_task in zip(unique, tts_tasks):
+                await self.handle_notification(notification, display_manager, tts_task)
+        finally:
+            for tts_task in tts_tasks:
+                if tts_task is not None and not tts_task.done():
+                    tts_task.cancel()
 
     async def check_for_notifications_loop(self, mcp_session, session_id, display_manager):
         """Background notification checking with exponential backoff on failures"""
         base_interval = 30  # Base check interval in seconds
         
         while True:
+            # Check first so a healthy connection doesn't wait a full interval at startup
+            notifications = await self.check_for_notifications(mcp_session, session_id)
+            if notifications:
+                await self.process_notifications(notifications, display_manager)
+            
             # Calculate delay based on consecutive failures (exponential backoff)
             if self.consecutive_failures == 0:
                 delay = base_interval
             else:
-                # Exponential backoff: 30s, 60s, 120s, 240s, max 300s (5min)
-                delay = min(base_interval * (2 ** (self.consecutive_failures - 1)), 300)
+                # Exponential backoff: 30s, 60s, 120s, 240s, max 300s (5min); shift capped so it stays small
+                delay = min(base_interval << min(self.consecutive_failures - 1, 4), 300)
             
-            await asyncio.sleep(delay)
-            
-            notifications = await self.check_for_notifications(mcp_session, session_id)
-            if notifications:
-                await self.process_notifications(notifications, display_manager)
+            # Up to 10% jitter so pollers started together drift apart
+            await asyncio.sleep(delay * (1 + random.random() * 0.1))
 
     async def test_local_notification(self, display_manager, notification_type="medicine_reminder", minutes_late=0):
         """Test the notification system locally without MCP server"""
@@ -181,7 +253,8 @@ class NotificationManager:
             "consecutive_failures": self.consecutive_failures,
             "last_successful_check": self.last_successful_check,
             "time_since_success": (
-                time.time() - self.last_successful_check 
+                # loop.time() runs on time.monotonic()
+                time.monotonic() - self.last_successful_check 
                 if self.last_successful_check else None
             )
         }
\ No newline at end of file
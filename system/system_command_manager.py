@@ -2,10 +2,95 @@
 
 import asyncio
 import base64
+import mmap
+import os
+import re
 from pathlib import Path
 from typing import Optional, Tuple
 from system.client_system_manager import ClientSystemManager
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Trigger phrases in priority order: when several match, the earliest group wins
+_COMMAND_PHRASES = (
+    (("enable remote tts", "api tts"), ("switch_tts_mode", "api")),
+    (("enable local tts", "local tts"), ("switch_tts_mode", "local")),
+    (("text only mode", "text only"), ("switch_tts_mode", "text")),
+    (("switch tts provider to cartesia",), ("switch_api_tts_provider", "cartesia")),
+    (("switch tts provider to elevenlabs",), ("switch_api_tts_provider", "elevenlabs")),
+    (("switch tts provider to piper",), ("switch_api_tts_provider", "piper")),
+    (("calibrate the microphone", "run voice calibration", "calibrate voice detection", "calibrate microphone"),
+     ("vad_calibration", None)),
+    (("claude code voice", "voice coding", "start voice input"), ("claude_code_voice", None)),
+    # Test notification commands
+    (("test notification", "test medicine reminder"), ("test_notification", "medicine_reminder")),
+    (("test notification late", "test late reminder"), ("test_notification_late", "medicine_reminder_late")),
+    # Reminder acknowledgment commands
+    (("i took my medicine", "took my medicine", "medicine taken", "i took it"), ("clear_reminder", "medicine")),
+    (("i'm going to bed", "going to bed", "bedtime", "time for bed"), ("clear_reminder", "bedtime")),
+    (("i exercised", "workout done", "finished exercising", "exercise complete"), ("clear_reminder", "exercise")),
+    (("reminder done", "finished that", "task complete", "i did it"), ("clear_reminder", "general")),
+    # Demo mode command
+    (("demo mode", "demonstration mode", "show demo"), ("demo_mode", None)),
+)
+
+# phrase -> (priority, (cmd_type, cmd_arg)); a phrase listed twice keeps its first (highest) priority
+_PHRASE_TABLE = {}
+for _priority, (_phrases, _result) in enumerate(_COMMAND_PHRASES):
+    for _phrase in _phrases:
+        _PHRASE_TABLE.setdefault(_phrase, (_priority, _result))
+
+if AHOCORASICK_AVAILABLE:
+    # One linear pass reports every phrase occurrence, overlapping ones included
+    _command_automaton = ahocorasick.Automaton()
+    for _phrase, _entry in _PHRASE_TABLE.items():
+        _command_automaton.add_word(_phrase, _entry)
+    _command_automaton.make_automaton()
+else:
+    _command_automaton = None
+
+# Fallback: a zero-width lookahead tries every start position, and with the alternatives in
+# priority order each position reports its highest-priority phrase
+_COMMAND_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(p) for p in sorted(_PHRASE_TABLE, key=lambda p: _PHRASE_TABLE[p][0])) + '))'
+)
+
+
+_MAX_CONCURRENT_UPLOADS = 3
+
+
+def _encode_file_b64(file_path: str) -> str:
+    """Base64-encode a file straight from a read-only mapping (no in-memory copy of the raw bytes)"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return base64.b64encode(mm).decode('ascii')
+
+
+def _list_pending_files(query_dir: str) -> list:
+    """DirEntries of the regular files waiting in the query directory ([] if it doesn't exist)"""
+    try:
+        with os.scandir(query_dir) as entries:
+            return [e for e in entries if e.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _match_command(t: str):
+    """Return the highest-priority (cmd_type, cmd_arg) whose phrase occurs in lower-cased t"""
+    if _command_automaton is not None:
+        hits = (entry for _, entry in _command_automaton.iter(t))
+    else:
+        hits = (_PHRASE_TABLE[m.group(1)] for m in _COMMAND_RE.finditer(t))
+    best = min(hits, default=None, key=lambda entry: entry[0])
+    return best[1] if best else None
+
 
 class SystemCommandManager:
     """
@@ -25,40 +110,9 @@ class SystemCommandManager:
 
     def detect_system_command(self, transcript: str) -> Tuple[bool, Optional[str], Optional[str]]:
         """Detect system commands in transcript"""
-        t = transcript.lower()
-        if "enable remote tts" in t or "api tts" in t:
-            return True, "switch_tts_mode", "api"
-        elif "enable local tts" in t or "local tts" in t:
-            return True, "switch_tts_mode", "local"
-        elif "text only mode" in t or "text only" in t:
-            return True, "switch_tts_mode", "text"
-        elif "switch tts provider to cartesia" in t:
-            return True, "switch_api_tts_provider", "cartesia"
-        elif "switch tts provider to elevenlabs" in t:
-            return True, "switch_api_tts_provider", "elevenlabs"
-        elif "switch tts provider to piper" in t:
-            return True, "switch_api_tts_provider", "piper"
-        elif "calibrate the microphone" in t or "run voice calibration" in t or "calibrate voice detection" in t or "calibrate microphone" in t:
-            return True, "vad_calibration", None
-        elif "claude code voice" in t or "voice coding" in t or "start voice input" in t:
-            return True, "claude_code_voice", None
-        # Test notification commands
-        elif "test notification" in t or "test medicine reminder" in t:
-            return True, "test_notification", "medicine_reminder"
-        elif "test notification late" in t or "test late reminder" in t:
-            return True, "test_notification_late", "medicine_reminder_late"
-        # Reminder acknowledgment commands
-        elif any(phrase in t for phrase in ["i took my medicine", "took my medicine", "medicine taken", "i took it"]):
-            return True, "clear_reminder", "medicine"
-        elif any(phrase in t for phrase in ["i'm going to bed", "going to bed", "bedtime", "time for bed"]):
-            return True, "clear_reminder", "bedtime"
-        elif any(phrase in t for phrase in ["i exercised", "workout done", "finished exercising", "exercise complete"]):
-            return True, "clear_reminder", "exercise"
-        elif any(phrase in t for phrase in ["reminder done", "finished that", "task complete", "i did it"]):
-            return True, "clear_reminder", "general"
-        # Demo mode command
-        elif "demo mode" in t or "demonstration mode" in t or "show demo" in t:
-            return True, "demo_mode", None
+        match = _match_command(transcript.lower())
+        if match:
+            return True, *match
         return False, None, None
 
     async def upload_document(self, file_path: str, mcp_session, session_id) -> dict | None:
@@ -67,9 +121,9 @@ class SystemCommandManager:
             return None
             
         try:
-            with open(file_path, 'rb') as f: 
-                content = base64.b64encode(f.read()).decode('utf-8')
-                
+            # Encode off the event loop; large documents take a while
+            content = await asyncio.to_thread(_encode_file_b64, file_path)
+            
             return await mcp_session.call_tool("upload_document", arguments={
                 "session_id": session_id, 
                 "filename": Path(file_path).name, 
@@ -180,18 +234,26 @@ class SystemCommandManager:
 
     async def check_and_upload_documents(self, mcp_session, session_id):
         """Check for and upload any pending documents"""
-        query_files_path = Path(self.client_settings.get("QUERY_FILES_DIR", "/home/user/rp_client/query_files"))
-        if query_files_path.exists():
-            for file_to_upload in query_files_path.iterdir():
-                if file_to_upload.is_file():
-                    upload_result = await self.upload_document(str(file_to_upload), mcp_session, session_id)
-                    
-                    # Move to offload directory
-                    offload_path = Path(self.client_settings.get("QUERY_OFFLOAD_DIR", "/home/user/rp_client/query_offload"))
-                    offload_path.mkdir(parents=True, exist_ok=True)
-                    
-                    try:
-                        file_to_upload.rename(offload_path / file_to_upload.name)
-                        print(f"[INFO] Document {file_to_upload.name} uploaded and moved to offload")
-                    except Exception as e:
-                        print(f"[ERROR] Could not move {file_to_upload.name}: {e}")
+        query_files_path = self.client_settings.get("QUERY_FILES_DIR", "/home/user/rp_client/query_files")
+        pending = await asyncio.to_thread(_list_pending_files, query_files_path)
+        if not pending:
+            return
+        
+        offload_path = self.client_settings.get("QUERY_OFFLOAD_DIR", "/home/user/rp_client/query_offload")
+        await asyncio.to_thread(os.makedirs, offload_path, exist_ok=True)
+        
+        # A few uploads in flight at once; each holds its base64 payload in memory until sent
+        upload_slots = asyncio.Semaphore(_MAX_CONCURRENT_UPLOADS)
+        
+        async def upload_and_offload(file_to_upload: os.DirEntry):
+            async with upload_slots:
+                await self.upload_document(file_to_upload.path, mcp_session, session_id)
+            
+            # Move to offload directory
+            try:
+                await asyncio.to_thread(os.rename, file_to_upload.path, os.path.join(offload_path, file_to_upload.name))
+                print(f"[INFO] Document {file_to_upload.name} uploaded and moved to offload")
+            except Exception as e:
+                print(f"[ERROR] Could not move {file_to_upload.name}: {e}")
+        
+        await asyncio.gather(*(upload_and_offload(f) for f in pending))
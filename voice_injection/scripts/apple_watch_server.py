@@ -4,14 +4,48 @@ Simple Apple Watch Text Injection Server
 Receives text via HTTP and injects it using virtual keyboard
 """
 
+import atexit
+import concurrent.futures
 from flask import Flask, request, jsonify
 from standalone_injector import StandaloneInjector
-from evdev import UInput
-import time
+import sys
+
+# TTS client loaded once in-process instead of a python3 subprocess per request
+sys.path.append('/home/user/rp_client/TTS')
+from speak import speak_conversation
 
 app = Flask(__name__)
 injector = StandaloneInjector()
 
+# All typing goes through one worker thread and one long-lived virtual keyboard, so
+# messages can't interleave and the device-settle delay is paid once, not per message
+inject_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='watch-inject')
+
+
+def _ensure_ui():
+    """Create the shared virtual keyboard if needed (runs on inject_executor)"""
+    return injector.get_ui(name='apple-watch-injector')
+
+
+def _inject_text(text):
+    """Type text on the shared virtual keyboard (runs on inject_executor)"""
+    try:
+        injector.type_text(_ensure_ui(), text)
+        print(f"[APPLE_WATCH] Successfully injected text")
+    except Exception as e:
+        print(f"[APPLE_WATCH] Injection failed: {e}")
+        # Drop the device so the next message starts from a fresh one
+        injector.release_ui()
+
+
+def _shutdown():
+    """Finish queued injections, then remove the virtual keyboard"""
+    inject_executor.shutdown(wait=True)
+    injector.release_ui()
+
+
+atexit.register(_shutdown)
+
 @app.route('/watch/message', methods=['POST'])
 def handle_watch_message():
     """Receive text from Apple Watch and inject it"""
@@ -23,16 +57,9 @@ def handle_watch_message():
         text = data['text']
         print(f"[APPLE_WATCH] Received: '{text}'")
         
-        # Inject the text using virtual keyboard
-        try:
-            with UInput(injector.capabilities, name='apple-watch-injector', version=0x3) as ui:
-                time.sleep(0.2)  # Let system recognize the device
-                injector.type_text(ui, text)
-                print(f"[APPLE_WATCH] Successfully injected text")
-                return jsonify({"status": "success", "message": "Text injected"}), 200
-        except Exception as e:
-            print(f"[APPLE_WATCH] Injection failed: {e}")
-            return jsonify({"error": f"Injection failed: {str(e)}"}), 500
+        # Queue the text for the injection worker and answer right away
+        inject_executor.submit(_inject_text, text)
+        return jsonify({"status": "accepted", "message": "Text queued for injection"}), 202
             
     except Exception as e:
         print(f"[APPLE_WATCH] Error: {e}")
@@ -47,17 +74,12 @@ def status():
 def handle_tts():
     """TTS endpoint using the new speak.py"""
     try:
-        import subprocess
         data = request.get_json()
         if not data or 'text' not in data:
             return jsonify({"error": "Missing 'text' field"}), 400
             
         text = data['text']
-        result = subprocess.run([
-            'python3', '/home/user/rp_client/TTS/speak.py', text
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
+        if speak_conversation(text):
             return jsonify({"status": "success", "message": "TTS played"}), 200
         else:
             return jsonify({"error": "TTS failed"}), 500
@@ -71,6 +93,9 @@ if __name__ == '__main__':
     print("  POST /watch/message - Inject text from Apple Watch")
     print("  POST /tts/speak    - Play text via TTS")
     print("  GET  /status       - Health check")
+    # Create the virtual keyboard now so the first message doesn't wait for it to settle
+    inject_executor.submit(_ensure_ui)
+    
     print("\nStarting server on port 8080...")
     print("Your IP: Check network icon in system tray")
     
@@ -55,15 +55,19 @@ def create_tray_icon():
     # Run the icon (blocks until quit)
     icon.run()
 
+_session = None  # requests.Session, created on the first test so repeat clicks reuse the connection
+
 def test_injection():
     """Send a test injection request"""
-    import requests
-    import json
+    global _session
     try:
-        response = requests.post(
+        if _session is None:
+            import requests
+            _session = requests.Session()
+        response = _session.post(
             'http://localhost:8080/watch/message',
-            headers={'Content-Type': 'application/json'},
-            data=json.dumps({'text': 'Test injection from tray icon'})
+            json={'text': 'Test injection from tray icon'},
+            timeout=2
         )
         print(f"Test injection: {response.status_code}")
     except Exception as e: